@@ -0,0 +1,163 @@
+"""
+Benchmark: end-to-end detection + extraction of synthetic statements, by stage
+
+Writes Wells Fargo / Bank of America statements (benchmarks.synthetic_statements)
+to a temp dir, then times bank detection and extraction (cache off, JVM already
+warm) of each, best of --repeat runs. Extraction time is split into reading
+tables (tabula, pdfplumber fallbacks and safeguards, from the StageProfiler
+stages) and parsing them. The extracted transactions are hashed, so a change in
+output shows up next to the timings.
+
+tabula's table detection is a heuristic and can skip rows of a synthetic page
+just like it can on a real one, so the generated count is only reported; the
+output hash is what --baseline compares, along with the timings (slower than
+baseline by more than --tolerance fails). Timings are only comparable on the
+machine that saved the baseline.
+
+Usage: python -m benchmarks.bench_extraction [--pages 6] [--transactions 100] [--statements 1]
+           [--banks wells_fargo,bank_of_america] [--repeat 3]
+           [--baseline benchmarks/baseline.json [--save-baseline]] [--tolerance 0.25]
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.synthetic_statements import GENERATORS, SyntheticStatement
+from core.extraction_cache import ExtractionCache
+from core.log import configure_logging
+from core.pdf_session import PdfSession
+from core.processor_factory import ProcessorFactory
+from core.profiling import StageProfiler
+from core.tabula_backend import get_tabula_backend
+
+# Profiler stages that read tables out of the PDF; every other stage is parsing
+TABLE_STAGES = {"cache_read", "cache_write", "tables", "tabula", "safeguard", "drop_seen_rows", "pdfplumber_fallback"}
+PHASES = ("detect", "tables", "parse")
+
+
+def make_statements(bank: str, out_dir: str, pages: int, transactions: int, count: int) -> List[SyntheticStatement]:
+    """count consecutive monthly statements, starting from the generator's default month"""
+    generate = GENERATORS[bank]
+    params = inspect.signature(generate).parameters
+    year, month, seed = (params[name].default for name in ("year", "month", "seed"))
+    statements = []
+    for i in range(count):
+        months = month - 1 + i
+        path = os.path.join(out_dir, f"{bank}_{i + 1:03d}.pdf")
+        statements.append(generate(path, pages, transactions, year=year + months // 12, month=months % 12 + 1,
+                                   seed=seed + i))
+    return statements
+
+
+def run_once(factory: ProcessorFactory, statement: SyntheticStatement) -> Dict:
+    """Detect and extract one statement; phase timings in seconds, the transactions and their hash"""
+    with PdfSession(statement.path) as session:
+        start = time.perf_counter()
+        bank = factory.detector.detect_bank(statement.path, session=session)
+        detect_seconds = time.perf_counter() - start
+        if bank != statement.bank:
+            raise SystemExit(f"❌ {statement.path}: detected {bank!r}, expected {statement.bank!r}")
+
+        processor = factory.processor_classes[bank](session=session, cache=ExtractionCache(enabled=False))
+        profiler = StageProfiler()
+        _, transactions = processor.extract_transactions(statement.path, profiler=profiler)
+
+    table_seconds = sum(s.wall_seconds for s in profiler.stages.values() if s.name in TABLE_STAGES)
+    csv = transactions.to_frame().to_csv(index=False)
+    return {
+        "detect": detect_seconds,
+        "tables": table_seconds,
+        "parse": profiler.total_wall_seconds - table_seconds,
+        "transactions": len(transactions),
+        "sha1": hashlib.sha1(csv.encode("utf-8")).hexdigest(),
+    }
+
+
+def bench_bank(factory: ProcessorFactory, statements: List[SyntheticStatement], repeat: int) -> Dict:
+    """Best-of-repeat phase timings over all statements of one bank, plus counts and a combined output hash"""
+    best = None
+    for _ in range(repeat):
+        runs = [run_once(factory, statement) for statement in statements]
+        result = {phase: sum(run[phase] for run in runs) for phase in PHASES}
+        result["total"] = sum(result[phase] for phase in PHASES)
+        result["transactions"] = sum(run["transactions"] for run in runs)
+        result["sha1"] = hashlib.sha1("".join(run["sha1"] for run in runs).encode()).hexdigest()
+        if best is not None and result["sha1"] != best["sha1"]:
+            raise SystemExit("❌ output differs between repeats of the same statements")
+        if best is None or result["total"] < best["total"]:
+            best = result
+    for phase in PHASES + ("total",):
+        best[phase] = round(best[phase], 6)
+    best["expected"] = sum(statement.expected_transactions for statement in statements)
+    return best
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:8.1f} ms"
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--pages", type=int, default=6)
+    ap.add_argument("--transactions", type=int, default=100, help="transactions per statement")
+    ap.add_argument("--statements", type=int, default=1, help="consecutive monthly statements per bank")
+    ap.add_argument("--banks", default=",".join(GENERATORS))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--baseline", help="JSON file of earlier results to compare against")
+    ap.add_argument("--save-baseline", action="store_true", help="store these results in --baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs the baseline (0.25 = 25%%)")
+    args = ap.parse_args()
+    if args.save_baseline and not args.baseline:
+        ap.error("--save-baseline needs --baseline FILE")
+
+    configure_logging("WARNING")
+    get_tabula_backend().warm_up()
+    factory = ProcessorFactory()
+
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    failures = []
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for bank in args.banks.split(","):
+            statements = make_statements(bank, tmp, args.pages, args.transactions, args.statements)
+            key = f"{bank}:pages={args.pages}:transactions={args.transactions}:statements={args.statements}"
+            result = results[key] = bench_bank(factory, statements, args.repeat)
+
+            rows = f"{result['transactions']}/{result['expected']} rows"
+            print(f"📄 {bank:16s} {rows:>13s} | " + " | ".join(f"{phase} {_ms(result[phase])}" for phase in PHASES)
+                  + f" | total {_ms(result['total'])}")
+
+            saved = baseline.get(key)
+            if saved is None or args.save_baseline:
+                continue
+            if result["sha1"] != saved["sha1"]:
+                failures.append(f"{bank}: output changed ({saved['transactions']} -> {result['transactions']} rows)")
+            print("   vs baseline  " + " | ".join(
+                f"{phase} {result[phase] / saved[phase]:5.2f}x" for phase in PHASES + ("total",) if saved[phase]))
+            if result["total"] > saved["total"] * (1 + args.tolerance):
+                failures.append(f"{bank}: {result['total'] / saved['total']:.2f}x the baseline total time")
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"💾 Saved {len(results)} result(s) to {args.baseline}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
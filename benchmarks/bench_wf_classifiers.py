@@ -0,0 +1,156 @@
+"""
+Benchmark: WellsFargoParser table classifiers (vectorized vs. legacy per-cell loop)
+
+Builds tabula-like tables for a long statement, checks the vectorized
+_is_transaction_table / _is_check_summary_table make exactly the same
+decisions as the original iloc loops, and reports the speedup.
+
+Usage: python -m benchmarks.bench_wf_classifiers [--pages 40] [--repeat 5]
+"""
+import argparse
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.bank_processors.wells_fargo.wf_parser import WellsFargoParser
+
+
+def legacy_is_transaction_table(table: pd.DataFrame) -> bool:
+    """Original per-cell implementation, kept as the reference"""
+    if table.shape[0] < 1:
+        return False
+    if table.shape[1] < 3:
+        return False
+    date_count = 0
+    amount_count = 0
+    keyword_count = 0
+    for row_idx in range(len(table)):
+        for col_idx in range(table.shape[1]):
+            cell = str(table.iloc[row_idx, col_idx]).strip()
+            if re.match(r'^\d{1,2}/\d{1,2}$', cell):
+                date_count += 1
+            if re.match(r'^\d{1,3}(,\d{3})*\.\d{2}$', cell):
+                amount_count += 1
+            cell_lower = cell.lower()
+            keywords = ['bankcard', 'purchase', 'ach', 'deposit', 'payment', 'tobacco', 'mtot', 'shell', 'authorized']
+            if any(keyword in cell_lower for keyword in keywords):
+                keyword_count += 1
+    if table.shape[0] <= 3:
+        return (date_count >= 1 and amount_count >= 1) or keyword_count >= 2
+    else:
+        return (date_count >= 2 and amount_count >= 2) or keyword_count >= 3
+
+
+def legacy_is_check_summary_table(table: pd.DataFrame) -> bool:
+    """Original per-cell implementation, kept as the reference"""
+    for row_idx in range(len(table)):
+        for col_idx in range(table.shape[1]):
+            cell = str(table.iloc[row_idx, col_idx]).strip().lower()
+            summary_keywords = [
+                'summary of checks', 'checks written', 'check images',
+                'account number:', 'check number:', 'amount:',
+                'gap in check sequence', 'checks listed are also displayed',
+                'number date amount'
+            ]
+            if any(keyword in cell for keyword in summary_keywords):
+                return True
+    if len(table) > 0:
+        first_row = []
+        for col_idx in range(min(9, table.shape[1])):
+            first_row.append(str(table.iloc[0, col_idx]).strip().lower())
+        header_pattern_count = 0
+        for i in range(0, len(first_row) - 2, 3):
+            if (i + 2 < len(first_row) and 'number' in first_row[i] and
+                    'date' in first_row[i + 1] and 'amount' in first_row[i + 2]):
+                header_pattern_count += 1
+        if header_pattern_count >= 2:
+            return True
+    check_count_first_col = 0
+    total_first_col = 0
+    for row_idx in range(1, min(10, len(table))):
+        if table.shape[1] > 0:
+            cell = str(table.iloc[row_idx, 0]).strip()
+            total_first_col += 1
+            if re.match(r'^\d{4}$', cell):
+                check_count_first_col += 1
+    if total_first_col > 0 and (check_count_first_col / total_first_col) > 0.5:
+        return True
+    check_date_pattern_count = 0
+    for row_idx in range(1, min(8, len(table))):
+        if table.shape[1] >= 2:
+            col1 = str(table.iloc[row_idx, 0]).strip()
+            col2 = str(table.iloc[row_idx, 1]).strip()
+            if re.match(r'^\d{4}$', col1) and re.match(r'^\d{1,2}/\d{1,2}$', col2):
+                check_date_pattern_count += 1
+    return check_date_pattern_count >= 3
+
+
+DESCRIPTIONS = [
+    "Purchase authorized on 09/01 Sheetz 0329 Rocky Mount",
+    "Bankcard 1131 Mtot Dep 220930 518353580128106 Tobacco",
+    "Business to Business ACH Debit - Mkb Realtors Web Pmts",
+    "Itg Brands, LLC EDI Pymnts Zltc1521307502 Tobacco House",
+    "Shell Oil 57444", "Online Transfer Ref #Ib0G", "Check",
+]
+
+
+def make_statement_tables(pages: int, rows_per_page: int = 40, seed: int = 7):
+    """Tabula-like tables for a statement: transaction pages plus a check summary"""
+    rng = random.Random(seed)
+    tables = []
+    for page in range(pages):
+        rows = []
+        for _ in range(rows_per_page):
+            month, day = rng.randint(1, 12), rng.randint(1, 28)
+            amount = f"{rng.randint(1, 9999):,}.{rng.randint(0, 99):02d}"
+            credit, debit = (amount, np.nan) if rng.random() < 0.4 else (np.nan, amount)
+            rows.append([f"{month}/{day}", rng.choice([np.nan, str(rng.randint(1000, 9999))]),
+                         rng.choice(DESCRIPTIONS), credit, debit, rng.choice([np.nan, 1234.56])])
+            if rng.random() < 0.3:  # wrapped description line
+                rows.append([np.nan, np.nan, "House & Vape I", np.nan, np.nan, np.nan])
+        tables.append(pd.DataFrame(rows))
+    summary = [["Number", "Date", "Amount", "Number", "Date", "Amount"]]
+    summary += [[str(1000 + i), f"9/{i % 28 + 1}", "100.00", str(2000 + i), "9/2", "5.00"] for i in range(30)]
+    tables.append(pd.DataFrame(summary))
+    tables.append(pd.DataFrame([["Summary of checks written", np.nan, np.nan]]))
+    tables.append(pd.DataFrame([[1, 2.5, None], ["x", "10/3", "1,000.00"]]))
+    return tables
+
+
+def _time(fn, tables, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for t in tables:
+            fn(t)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--pages", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    parser = WellsFargoParser()
+    tables = make_statement_tables(args.pages)
+    cells = sum(t.size for t in tables)
+    print(f"📄 {len(tables)} tables / {cells} cells ({args.pages} pages)")
+
+    for name, legacy, new in [
+        ("_is_transaction_table", legacy_is_transaction_table, parser._is_transaction_table),
+        ("_is_check_summary_table", legacy_is_check_summary_table, parser._is_check_summary_table),
+    ]:
+        mismatches = [i for i, t in enumerate(tables) if legacy(t) != new(t)]
+        assert not mismatches, f"{name}: decisions differ on tables {mismatches}"
+        t_old = _time(legacy, tables, args.repeat)
+        t_new = _time(new, tables, args.repeat)
+        print(f"{name:26s} legacy {t_old * 1000:8.1f} ms | vectorized {t_new * 1000:8.1f} ms | {t_old / t_new:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
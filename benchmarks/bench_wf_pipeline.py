@@ -0,0 +1,324 @@
+"""
+Benchmark: WellsFargoParser row post-processing (fused single pass vs. legacy six-step chain)
+
+Builds flattened WF rows (what process_tables hands to _process_raw_rows) for a
+long statement plus edge cases, checks the fused pipeline returns exactly the
+rows of the original remove-balance / summary / filter / sort / merge / clean
+chain, and reports the speedup.
+
+Usage: python -m benchmarks.bench_wf_pipeline [--pages 40] [--repeat 5]
+"""
+import argparse
+import copy
+import gc
+import random
+import re
+import time
+
+from core.bank_processors.wells_fargo.wf_parser import WellsFargoParser
+from core.interfaces.transaction import to_cents
+
+EDI = ['edi', 'edi payment', 'edi pymnts', 'japan tobac', 'itg brands']
+
+
+class LegacyPipeline:
+    """Original step-by-step implementation (copying the row list at every step), kept as the reference"""
+
+    def process(self, all_rows):
+        for step in (self.remove_ending_balance_column, self.add_monthly_summary, self.filter_deposits_keep_edi,
+                     self.sort_transactions_by_type, self.merge_amount_columns, self.remove_description_only_rows):
+            all_rows = step(all_rows)
+        return all_rows
+
+    def remove_ending_balance_column(self, all_rows):
+        if not all_rows or len(all_rows[0]) <= 4:
+            return all_rows
+        last_col_idx = len(all_rows[0]) - 1
+        balance_count = 0
+        non_empty_count = 0
+        for row in all_rows[:25]:
+            if last_col_idx < len(row):
+                cell = str(row[last_col_idx]).strip()
+                if cell and cell != "EMPTY":
+                    non_empty_count += 1
+                    if re.match(r'^\d{1,3}(,\d{3})*\.\d{2}$', cell):
+                        balance_count += 1
+        balance_ratio = balance_count / non_empty_count if non_empty_count > 0 else 0
+        if balance_ratio > 0.6:
+            for row in all_rows:
+                if len(row) > last_col_idx:
+                    row.pop()
+        return all_rows
+
+    def add_monthly_summary(self, all_rows):
+        if not all_rows:
+            return all_rows
+        deposits_cents = 0
+        month_year = None
+        for row in all_rows:
+            if len(row) > 0 and re.match(r'^\d{1,2}/\d{1,2}$', row[0].strip()):
+                if not month_year:
+                    month, day = row[0].strip().split('/')
+                    month_year = f"{month.zfill(2)}/2022"
+                if len(row) >= 5:
+                    if row[3] and row[3].strip():
+                        try:
+                            deposits_cents += to_cents(row[3].strip())
+                        except ValueError:
+                            pass
+        deposits_total = deposits_cents / 100
+        if month_year:
+            month_num = int(month_year.split('/')[0])
+            year_num = int(month_year.split('/')[1])
+            if month_num in [1, 3, 5, 7, 8, 10, 12]:
+                last_day = 31
+            elif month_num in [4, 6, 9, 11]:
+                last_day = 30
+            elif month_num == 2:
+                if year_num % 4 == 0 and (year_num % 100 != 0 or year_num % 400 == 0):
+                    last_day = 29
+                else:
+                    last_day = 28
+            last_date = f"{month_num:02d}/{last_day:02d}/{year_num}"
+            if len(all_rows[0]) >= 4:
+                summary_row = [last_date, "", "Deposits", f"{deposits_total:.2f}"]
+                while len(summary_row) < len(all_rows[0]):
+                    summary_row.append("")
+                all_rows.insert(0, summary_row)
+        return all_rows
+
+    def deposit_kind(self, row):
+        is_deposit = False
+        is_edi = False
+        if len(row) >= 5:
+            has_deposit = row[3] and row[3].strip() and row[3].strip() != ""
+            has_withdrawal = row[4] and row[4].strip() and row[4].strip() != ""
+            if has_deposit and not has_withdrawal:
+                is_deposit = True
+                description = ""
+                if len(row) >= 3:
+                    description = row[2].lower()
+                if any(edi_keyword in description for edi_keyword in EDI):
+                    is_edi = True
+        return is_deposit, is_edi
+
+    def filter_deposits_keep_edi(self, all_rows):
+        if not all_rows:
+            return all_rows
+        filtered_rows = []
+        for i, row in enumerate(all_rows):
+            if i == 0:
+                filtered_rows.append(row)
+                continue
+            is_deposit, is_edi = self.deposit_kind(row)
+            if not is_deposit or is_edi:
+                filtered_rows.append(row)
+        return filtered_rows
+
+    def sort_transactions_by_type(self, all_rows):
+        if not all_rows:
+            return all_rows
+        summary_rows, edi_payments, withdrawals, checks, other_rows = [], [], [], [], []
+        for i, row in enumerate(all_rows):
+            if i == 0:
+                summary_rows.append(row)
+                continue
+            transaction_type = self.classify_transaction(row)
+            if transaction_type == "EDI":
+                edi_payments.append(row)
+            elif transaction_type == "CHECK":
+                checks.append(row)
+            elif transaction_type == "WITHDRAWAL":
+                withdrawals.append(row)
+            else:
+                other_rows.append(row)
+        return (summary_rows + self.sort_by_date(edi_payments) + self.sort_by_date(withdrawals)
+                + self.sort_by_date(checks) + other_rows)
+
+    def classify_transaction(self, row):
+        if len(row) < 3:
+            return "OTHER"
+        check_number = row[1].strip() if len(row) > 1 else ""
+        if check_number and re.match(r'^\d{4}$', check_number):
+            return "CHECK"
+        description = row[2].lower() if len(row) > 2 else ""
+        if any(keyword in description for keyword in EDI):
+            return "EDI"
+        if len(row) >= 5:
+            withdrawal_amount = row[4].strip() if row[4] else ""
+            if withdrawal_amount and withdrawal_amount != "":
+                return "WITHDRAWAL"
+        if len(row) >= 4:
+            deposit_amount = row[3].strip() if row[3] else ""
+            if deposit_amount and deposit_amount != "":
+                return "EDI"
+        return "OTHER"
+
+    def sort_by_date(self, rows):
+        def get_date_key(row):
+            if len(row) > 0 and re.match(r'^\d{1,2}/\d{1,2}$', row[0].strip()):
+                try:
+                    month, day = row[0].strip().split('/')
+                    return (int(month), int(day))
+                except:
+                    pass
+            return (99, 99)
+        return sorted(rows, key=get_date_key)
+
+    def merge_amount_columns(self, all_rows):
+        if not all_rows:
+            return all_rows
+        merged_rows = []
+        year = "2022"
+        for row in all_rows:
+            if len(row) >= 5:
+                deposit_str = row[3].strip() if row[3] else ""
+                withdrawal_str = row[4].strip() if row[4] else ""
+                final_amount = ""
+                if deposit_str and deposit_str != "":
+                    try:
+                        final_amount = f"{float(deposit_str.replace(',', '')):.2f}"
+                    except ValueError:
+                        pass
+                if withdrawal_str and withdrawal_str != "":
+                    try:
+                        final_amount = f"-{float(withdrawal_str.replace(',', '').replace('-', '')):.2f}"
+                    except ValueError:
+                        pass
+                date_str = row[0]
+                if re.match(r'^\d{1,2}/\d{1,2}$', date_str.strip()):
+                    date_str = f"{date_str.strip()}/{year}"
+                merged_rows.append([date_str, row[1], row[2], final_amount])
+            elif len(row) >= 4:
+                date_str = row[0]
+                if re.match(r'^\d{1,2}/\d{1,2}$', date_str.strip()):
+                    date_str = f"{date_str.strip()}/{year}"
+                merged_rows.append([date_str, row[1], row[2], row[3]])
+            else:
+                merged_rows.append(row)
+        return merged_rows
+
+    def remove_description_only_rows(self, all_rows):
+        if not all_rows:
+            return all_rows
+        cleaned_rows = []
+        for i, row in enumerate(all_rows):
+            if i == 0:
+                cleaned_rows.append(row)
+                continue
+            has_date = False
+            has_amount = False
+            if len(row) >= 1:
+                date_cell = row[0].strip()
+                if date_cell and (re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', date_cell) or re.match(r'^\d{1,2}/\d{1,2}$', date_cell)):
+                    has_date = True
+            if len(row) >= 4:
+                amount_cell = row[3].strip()
+                if amount_cell and amount_cell != "":
+                    try:
+                        float(amount_cell.replace(',', '').replace('-', ''))
+                        has_amount = True
+                    except ValueError:
+                        pass
+            if not has_date and not has_amount:
+                row_text = " ".join(row).lower()
+                transaction_keywords = ['purchase authorized', 'shell oil', 'bankcard', 'mtot dep', 'ach debit']
+                if any(keyword in row_text for keyword in transaction_keywords):
+                    cleaned_rows.append(row)
+                    continue
+            if has_date or has_amount:
+                cleaned_rows.append(row)
+        return cleaned_rows
+
+
+DESCRIPTIONS = [
+    "Purchase authorized on 09/01 Sheetz 0329 Rocky Mount",
+    "Bankcard 1131 Mtot Dep 220930 518353580128106 Tobacco",
+    "Business to Business ACH Debit - Mkb Realtors Web Pmts",
+    "Itg Brands, LLC EDI Pymnts Zltc1521307502 Tobacco House",
+    "Japan Tobac Intl Payment 0930", "Shell Oil 57444", "Online Transfer Ref #Ib0G", "Check",
+]
+FRAGMENTS = ["House & Vape I", "S461263581253208 Card 1131", "Shell Oil 57444 Rocky Mount NC", "Ref #Ib0G"]
+
+
+def make_statement_rows(pages: int, rows_per_page: int = 40, seed: int = 7, balance: bool = True):
+    """Flattened WF rows: Date, Check#, Description, Deposits, Withdrawals[, Ending balance] as stripped strings"""
+    rng = random.Random(seed)
+    month = rng.randint(1, 12)
+    rows = []
+    for _ in range(pages * rows_per_page):
+        amount = f"{rng.randint(1, 99999):,}.{rng.randint(0, 99):02d}"
+        check = str(rng.randint(1000, 9999)) if rng.random() < 0.15 else ""
+        deposit, withdrawal = (amount, "") if rng.random() < 0.4 else ("", amount)
+        if rng.random() < 0.02:
+            deposit, withdrawal = amount, "12.00"  # both columns filled
+        row = [f"{month}/{rng.randint(1, 28)}" if rng.random() < 0.85 else "", check,
+               rng.choice(DESCRIPTIONS), deposit, withdrawal]
+        if balance:
+            row.append(f"{rng.randint(1, 99999):,}.{rng.randint(0, 99):02d}" if rng.random() < 0.5 else "")
+        rows.append(row)
+        if rng.random() < 0.3:  # wrapped description line
+            rows.append(["", "", rng.choice(FRAGMENTS), "", ""] + ([""] if balance else []))
+    return rows
+
+
+def edge_cases():
+    """Small inputs around the summary row and short rows"""
+    row = lambda *cells: list(cells)
+    return [
+        [],
+        [row("", "", "Beginning balance", "", "", "1,000.00")],
+        [row("Date", "Check", "Description", "Deposits", "Withdrawals", "Balance"),
+         row("", "", "no dates at all", "5.00", "", ""), row("", "", "Shell Oil fragment", "", "", "")],
+        [row("9/3", "", "short first row"), row("9/1", "", "Deposit", "10.00", "", "90.00"),
+         row("9/2", "", "EDI Pymnts", "20.00", "", "110.00"), row("9/2", "1234", "Check", "", "5.00", "105.00")],
+        [row("", "", "EDI Pymnts first", "7.00", "", ""), row("", "", "Deposit", "9.00", "", "")],
+        [row("", "", "Deposit first", "7.00", "", ""), row("x", "", "Deposit", "9.00", "", "")],
+        [row("9/5", "", "ach debit", "", "3.00"), row("9/1", "", "four cells", "2.00"),
+         row("9/1", "2222"), row("", "", "bankcard"), row("9/9", "", "Itg Brands", "1,234.50", "")],
+        [row("02/3", "", "leap", "1.00", "", ""), row("2/1", "", "x", "", "abc", ""),
+         row("2/2", "", "y", "nan", "", ""), row("2/2", "", "z", "", "-4.00", "")],
+        [row("12/31", "", "EDI", "1.00", "", "1.00"), row("1/1", "", "wd", "", "1.00", "0.00"),
+         row("12/31", "", "wd", "", "2.00", "EMPTY")],
+    ]
+
+
+def _time(fns, inputs, repeat):
+    """Best time of each fn over all inputs; the fns take turns within each repeat so load spikes hit both"""
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            copies = copy.deepcopy(inputs)  # both pipelines pop the balance column in place
+            gc.disable()  # as timeit does: collecting the copies isn't either pipeline's cost
+            try:
+                start = time.perf_counter()
+                for rows in copies:
+                    fn(rows)
+                best[i] = min(best[i], time.perf_counter() - start)
+            finally:
+                gc.enable()
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--pages", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    parser = WellsFargoParser()
+    legacy = LegacyPipeline()
+    statements = [make_statement_rows(args.pages, seed=seed, balance=seed % 2 == 0) for seed in range(4)]
+    checked = statements + edge_cases()
+    for i, rows in enumerate(checked):
+        expected = legacy.process(copy.deepcopy(rows))
+        got = parser._process_raw_rows(copy.deepcopy(rows))
+        assert got == expected, f"input {i}: fused pipeline differs from the legacy chain"
+    print(f"📄 {len(checked)} inputs match ({sum(map(len, statements))} statement rows, {args.pages} pages each)")
+
+    t_old, t_new = _time([legacy.process, parser._process_raw_rows], statements, args.repeat)
+    print(f"_process_raw_rows  legacy {t_old * 1000:8.1f} ms | fused {t_new * 1000:8.1f} ms | {t_old / t_new:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
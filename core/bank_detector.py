@@ -1,101 +1,115 @@
-import pdfplumber
-from typing import Optional
+import logging
+from typing import Dict, List, Optional, Tuple
 import re
+from .pdf_session import PdfSession
+
+logger = logging.getLogger(__name__)
+
+# Points per matched term; a bank is detected with MIN_SCORE points
+KEYWORD_POINTS, INDICATOR_POINTS, ACCOUNT_POINTS = 1, 2, 3
+MIN_SCORE = 2
+# Pages read at most; more than the first only when it is ambiguous
+MAX_PAGES = 3
 
 class BankDetector:
     """Service to detect which bank a PDF statement belongs to"""
-    
+
     def __init__(self):
         # Start with just BoA, we'll add more banks later
         self.bank_patterns = {
             "bank_of_america": {
+                "name": "Bank of America",
                 "keywords": ["BANK OF AMERICA", "BANKOFAMERICA.COM", "BUSINESS ADVANTAGE"],
                 "strong_indicators": ["P.O. Box 25118", "Tampa, FL 33622-5118", "1.888.BUSINESS"],
                 "account_patterns": [r"Account number:\s*\d{4}\s*\d{4}\s*\d{4}"],
                 "header_patterns": ["Your Business Advantage Fundamentals"]
             },
             "wells_fargo": {
+                "name": "Wells Fargo",
                 "keywords": ["WELLS FARGO", "NAVIGATE BUSINESS CHECKING", "WELLSFARGO.COM/BIZ"],
                 "strong_indicators": ["1-800-CALL-WELLS", "Portland, OR 97228-6995", "wellsfargo.com/biz"],
                 "account_patterns": [r"Account number:\s*\d{10}"],
                 "header_patterns": ["Navigate Business Checking"]
             }
         }
-    
-    def detect_bank(self, pdf_path: str) -> Optional[str]:
-        """Detect which bank this PDF belongs to"""
+        self._compile_terms()
+
+    def _compile_terms(self):
+        """
+        Build one scanner over every bank's keywords, indicators and account patterns.
+        Keywords and indicators are matched as upper-case literals against the
+        upper-cased text, account patterns case-insensitively. A term listed more
+        than once (e.g. as keyword and indicator) is one entry scoring for each listing.
+        """
+        terms: Dict[str, List[Tuple[str, int]]] = {}
+        for bank, patterns in self.bank_patterns.items():
+            for keyword in patterns["keywords"]:
+                terms.setdefault(re.escape(keyword.upper()), []).append((bank, KEYWORD_POINTS))
+            for indicator in patterns["strong_indicators"]:
+                terms.setdefault(re.escape(indicator.upper()), []).append((bank, INDICATOR_POINTS))
+            for pattern in patterns["account_patterns"]:
+                terms.setdefault(f"(?i:{pattern})", []).append((bank, ACCOUNT_POINTS))
+
+        self._terms = [(re.compile(source), points) for source, points in terms.items()]
+        # Zero-width, so it stops at every position where some term starts (also inside
+        # another match); the terms themselves are then tried only at those positions
+        self._scanner = re.compile("(?=" + "|".join(f"(?:{source})" for source in terms) + ")")
+
+    def detect_bank(self, pdf_path: str, session: Optional[PdfSession] = None) -> Optional[str]:
+        """Detect which bank this PDF belongs to (reuses the session's parsed pages if given)"""
         try:
-            text_content = self._extract_pdf_text(pdf_path)
-            if not text_content:
-                print("Could not extract text from PDF")
-                return None
-            
-            #check BoA
-            if self._is_bank_of_america(text_content):
-                print("Detected: Bank of America")
-                return "bank_of_america"
-            
-            # 🆕 CHECK WELLS FARGO:
-            if self._is_wells_fargo(text_content):
-                print("Detected: Wells Fargo")
-                return "wells_fargo"
-            
-            print("No bank patterns matched")
-            return None
-                
+            if session is None:
+                with PdfSession(pdf_path) as own_session:
+                    return self._detect(own_session)
+            return self._detect(session)
+
         except Exception as e:
-            print(f"Error detecting bank: {e}")
+            logger.error("Error detecting bank: %s", e)
             return None
-    
-    def _extract_pdf_text(self, pdf_path: str) -> str:
-        """Extract text from first few pages of PDF"""
+
+    def _detect(self, session: PdfSession) -> Optional[str]:
+        """
+        Score the banks on the first page's text and stop there if exactly one bank
+        reaches MIN_SCORE; otherwise add pages up to MAX_PAGES. The best score wins
+        (ties go to the bank listed first).
+        """
         text_content = ""
+        scores: Dict[str, int] = {}
+        pages_read = 0
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages[:3]):
-                    page_text = page.extract_text() or ""
-                    text_content += page_text + " "
+            for page_idx in range(min(MAX_PAGES, session.page_count)):
+                text_content += session.page_text(page_idx) + " "
+                pages_read += 1
+                scores = self.score_text(text_content)
+                if sum(1 for score in scores.values() if score >= MIN_SCORE) == 1:
+                    break
         except Exception as e:
-            print(f"Error extracting PDF text: {e}")
-        return text_content
-    
-    def _is_bank_of_america(self, text: str) -> bool:
-        """Check if this is a Bank of America statement"""
-        text_upper = text.upper()
-        patterns = self.bank_patterns["bank_of_america"]
-        
-        # Check keywords
-        keyword_matches = sum(1 for keyword in patterns["keywords"] if keyword in text_upper)
-        
-        # Check strong indicators  
-        indicator_matches = sum(1 for indicator in patterns["strong_indicators"] if indicator.upper() in text_upper)
-        
-        # Check account patterns
-        pattern_matches = sum(1 for pattern in patterns["account_patterns"] if re.search(pattern, text, re.IGNORECASE))
-        
-        total_score = keyword_matches + (indicator_matches * 2) + (pattern_matches * 3)
-        
-        print(f"BoA detection score: {total_score} (keywords: {keyword_matches}, indicators: {indicator_matches}, patterns: {pattern_matches})")
-        
-        return total_score >= 2  # Require at least 2 points to be confident
-    
-    # 🆕 ADD WELLS FARGO DETECTION METHOD:
-    def _is_wells_fargo(self, text: str) -> bool:
-        """Check if this is a Wells Fargo statement"""
+            logger.warning("Error extracting PDF text: %s", e)
+
+        if not text_content:
+            logger.warning("Could not extract text from PDF")
+            return None
+
+        logger.debug("Detection scores after %d page(s): %s", pages_read, scores)
+        bank = max(scores, key=scores.get)  # first of the best, in bank_patterns order
+        if scores[bank] < MIN_SCORE:
+            logger.info("No bank patterns matched")
+            return None
+        logger.info("Detected: %s", self.bank_patterns[bank]["name"])
+        return bank
+
+    def score_text(self, text: str) -> Dict[str, int]:
+        """Points per bank for the terms found in text, from a single scan of it"""
         text_upper = text.upper()
-        patterns = self.bank_patterns["wells_fargo"]
-        
-        # Check keywords
-        keyword_matches = sum(1 for keyword in patterns["keywords"] if keyword in text_upper)
-        
-        # Check strong indicators  
-        indicator_matches = sum(1 for indicator in patterns["strong_indicators"] if indicator.upper() in text_upper)
-        
-        # Check account patterns
-        pattern_matches = sum(1 for pattern in patterns["account_patterns"] if re.search(pattern, text, re.IGNORECASE))
-        
-        total_score = keyword_matches + (indicator_matches * 2) + (pattern_matches * 3)
-        
-        print(f"Wells Fargo detection score: {total_score} (keywords: {keyword_matches}, indicators: {indicator_matches}, patterns: {pattern_matches})")
-        
-        return total_score >= 2
\ No newline at end of file
+        found = set()
+        for match in self._scanner.finditer(text_upper):
+            pos = match.start()
+            for term_idx, (term, _) in enumerate(self._terms):
+                if term_idx not in found and term.match(text_upper, pos):
+                    found.add(term_idx)
+
+        scores = dict.fromkeys(self.bank_patterns, 0)
+        for term_idx in found:
+            for bank, points in self._terms[term_idx][1]:
+                scores[bank] += points
+        return scores
@@ -1,18 +1,44 @@
+import logging
 import re
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional
 import pandas as pd
+from ...interfaces import patterns
 from ...interfaces.base_parser import BaseParser
 from ...interfaces.transaction import Transaction
+from ...profiling import StageProfiler
+from ...statement_period import StatementPeriod
+
+logger = logging.getLogger(__name__)
+
+# BoA check numbers run longer than the 3-5 digits BaseParser looks for
+LONG_CHECK_LABEL = re.compile(r"Check\s*#?\s*(\d{3,})", re.IGNORECASE)
+LONG_CHECK_BEFORE_AMOUNT = re.compile(r"\b(\d{3,})\b(?=.*-?\$?\d[\d,]*\.\d{2})")
+LONG_NUMBER = re.compile(r"\b\d{3,}\b")
+CHECK_WITH_NUMBER = re.compile(r"\bcheck\b.*\d{3,}", re.IGNORECASE)
+# Side-by-side check entries: DATE  CHECKNO  AMOUNT (FIXED: 3+ digits for check number)
+CHECK_TRIPLET = re.compile(
+    r"""
+    (?P<date>\b\d{1,2}/\d{1,2}/\d{2,4}\b)    # date
+    \s+
+    (?P<check>\d{3,}\*?)                     # check number (3+ digits)
+    \s+
+    (?P<amount>[-+]?\$?\d[\d,]*\.\d{2})      # amount
+    """,
+    re.VERBOSE,
+)
+# What's left around numbers once dates/amounts are stripped from a ledger row
+LEDGER_PUNCTUATION = re.compile(r"[()\s,$\-]+")
+AMOUNT_PUNCTUATION = re.compile(r"[(),\s$]+")
 
 class BankOfAmericaParser(BaseParser):
     """Bank of America bank statement parser - trust the statement amounts as-is"""
     
     def __init__(self):
         super().__init__()
-        self.date_pat = re.compile(r"\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b")
-        self.money_pat = re.compile(r"[-+]?\$?\d[\d,]*\.\d{2}")
-        self.check_word_pat = re.compile(r"\bCHECK(?!CARD)\b", re.IGNORECASE)
-        self.checknum_pat = re.compile(r"\b\d{3,}\*?\b")
+        self.date_pat = patterns.DATE
+        self.money_pat = patterns.MONEY
+        self.check_word_pat = patterns.CHECK_WORD
+        self.checknum_pat = patterns.CHECK_NUMBER_TOKEN
 
         # Existing: requires 2+ date-amount pairs
         self.pure_ledger_pat = re.compile(
@@ -29,125 +55,143 @@ class BankOfAmericaParser(BaseParser):
     def get_detection_keywords(self) -> List[str]:
         return ["BANK OF AMERICA", "BANKOFAMERICA.COM", "BUSINESS ADVANTAGE"]
     
-    def process_tables(self, tables: List[pd.DataFrame]) -> List[Transaction]:
+    def process_tables(self, tables: Iterable[pd.DataFrame],
+                       on_transactions: Optional[Callable[[List[Transaction]], None]] = None,
+                       profiler: Optional[StageProfiler] = None,
+                       period: Optional[StatementPeriod] = None) -> List[Transaction]:
         """
         Simple Bank of America parsing:
         - Use amount signs exactly as they appear (positive = deposit, negative = withdrawal)
         - Only skip obvious "Daily ledger balances" tables
         - Process ALL other tables, including small/broken ones
+        Tables are parsed one at a time as they arrive (tables may be a generator);
+        on_transactions gets each table's transactions as soon as it is parsed.
+        profiler records the time spent classifying tables and parsing rows.
+        period dates rows printed as MM/DD (see BaseParser._standardize_date).
         """
         transactions: List[Transaction] = []
-        print(f"Processing {len(tables)} tables for Bank of America...")
+        logger.debug("Processing tables for Bank of America...")
+        profiler = profiler or StageProfiler()
 
         for t_idx, df in enumerate(tables):
             if df.empty:
-                print(f"Table {t_idx}: Empty - skipping")
+                logger.debug("Table %d: Empty - skipping", t_idx)
                 continue
 
-            print(f"Table {t_idx}: {df.shape[0]} rows, {df.shape[1]} cols")
+            logger.debug("Table %d: %d rows, %d cols", t_idx, df.shape[0], df.shape[1])
 
-            # Enhanced detection for Daily ledger balances tables
-            probe_text = " ".join(self._norm(self._row_to_text(r)) for _, r in df.head(3).iterrows())
+            with profiler.stage("classify_tables", rows_in=1) as stage:
+                # Enhanced detection for Daily ledger balances tables
+                probe_text = " ".join(self._norm(self._row_to_text(r)) for _, r in df.head(3).iterrows())
+                # Check for explicit header
+                ledger_header = "DAILY LEDGER BALANCES" in probe_text.upper()
+                # Additional check: if it's mostly simple date-balance pairs without check numbers
+                ledger_pattern = not ledger_header and self._is_simple_daily_ledger_table(df)
+                stage.rows_out = int(not (ledger_header or ledger_pattern))
             
-            # Check for explicit header
-            if "DAILY LEDGER BALANCES" in probe_text.upper():
-                print(f"  -> Skipping: Daily ledger balances table (header detected)")
+            if ledger_header:
+                logger.debug("  -> Skipping: Daily ledger balances table (header detected)")
                 continue
             
-            # Additional check: if it's mostly simple date-balance pairs without check numbers
-            if self._is_simple_daily_ledger_table(df):
-                print(f"  -> Skipping: Daily ledger balances table (pattern detected)")
+            if ledger_pattern:
+                logger.debug("  -> Skipping: Daily ledger balances table (pattern detected)")
                 continue
 
             # Process ALL other tables
             table_transactions = 0
-            for row_idx, row in df.iterrows():
-                row_text = self._norm(self._row_to_text(row))
-                if len(row_text) < 8:
-                    continue
-
-                # Skip ONLY pure ledger rows (date amount date amount...)
-                if self._is_pure_ledger_row(row_text):
-                    continue
-
-                # Handle side-by-side check tables
-                multi_checks = self._parse_checks_row_multi(row_text)
-                if multi_checks:
-                    transactions.extend(multi_checks)
-                    table_transactions += len(multi_checks)
-                    print(f"    Row {row_idx}: Found {len(multi_checks)} checks")
-                    continue
-
-                # Need a date and amount for regular transactions
-                date_str = self._extract_date_any(row_text)
-                if not date_str:
-                    continue
+            table_start = len(transactions)
+            with profiler.stage("parse_rows", rows_in=len(df)) as stage:
+                for row_idx, row in df.iterrows():
+                    row_text = self._norm(self._row_to_text(row))
+                    if len(row_text) < 8:
+                        continue
+
+                    # Skip ONLY pure ledger rows (date amount date amount...)
+                    if self._is_pure_ledger_row(row_text):
+                        continue
+
+                    # Handle side-by-side check tables
+                    multi_checks = self._parse_checks_row_multi(row_text)
+                    if multi_checks:
+                        transactions.extend(multi_checks)
+                        table_transactions += len(multi_checks)
+                        logger.debug("    Row %s: Found %d checks", row_idx, len(multi_checks))
+                        continue
+
+                    # Need a date and amount for regular transactions
+                    date_str = self._extract_date_any(row_text)
+                    if not date_str:
+                        continue
                     
-                amount = self._pick_amount(row_text)
-                if amount is None:
-                    continue
+                    amount = self._pick_amount(row_text)
+                    if amount is None:
+                        continue
 
-                upper = row_text.upper()
+                    upper = row_text.upper()
 
-                # FIXED: More specific check detection
-                # Only classify as check if: has CHECK word, has number, is negative, and is NOT a return/deposit/fee
-                has_check_word = self.check_word_pat.search(upper) is not None
-                has_check_number = self.checknum_pat.search(row_text) is not None
-                is_negative_amount = amount < 0
+                    # FIXED: More specific check detection
+                    # Only classify as check if: has CHECK word, has number, is negative, and is NOT a return/deposit/fee
+                    has_check_word = self.check_word_pat.search(upper) is not None
+                    has_check_number = self.checknum_pat.search(row_text) is not None
+                    is_negative_amount = amount < 0
                 
-                # Exclude descriptions that indicate it's NOT an actual check transaction
-                excluded_terms = ["RETURN", "DEPOSIT", "FEE", "REFUND", "CREDIT", "REVERSAL", "VOID", "RECEIVED"]
-                is_excluded = any(term in upper for term in excluded_terms)
+                    # Exclude descriptions that indicate it's NOT an actual check transaction
+                    excluded_terms = ["RETURN", "DEPOSIT", "FEE", "REFUND", "CREDIT", "REVERSAL", "VOID", "RECEIVED"]
+                    is_excluded = any(term in upper for term in excluded_terms)
                 
-                is_actual_check = (has_check_word and has_check_number and 
-                                 is_negative_amount and not is_excluded and 
-                                 "CHECKCARD" not in upper)
+                    is_actual_check = (has_check_word and has_check_number and 
+                                     is_negative_amount and not is_excluded and 
+                                     "CHECKCARD" not in upper)
+                
+                    if is_actual_check:
+                        check_number = self._extract_check_number(row_text)
+                        transactions.append(
+                            Transaction(
+                                date=self._standardize_date(date_str, period),
+                                description=self._clean_description(row_text) or "Check",
+                                amount=amount,  # Use amount exactly as extracted
+                                check_number=check_number,
+                                transaction_type="check",
+                            )
+                        )
+                        table_transactions += 1
+                        logger.debug("    Row %s: Check #%s, Amount: %s", row_idx, check_number, amount)
+                        continue
+
+                    # For all other transactions: Use sign to determine type
+                    if amount > 0:
+                        # Check if this is an EDI payment from specific companies
+                        if self._is_edi_payment(row_text):
+                            txn_type = "edi_payment"
+                        else:
+                            txn_type = "deposit"  # Regular deposit
+                    else:
+                        txn_type = "withdrawal"
                 
-                if is_actual_check:
-                    check_number = self._extract_check_number(row_text)
                     transactions.append(
                         Transaction(
-                            date=self._standardize_date(date_str),
-                            description=self._clean_description(row_text) or "Check",
+                            date=self._standardize_date(date_str, period),
+                            description=self._clean_description(row_text),
                             amount=amount,  # Use amount exactly as extracted
-                            check_number=check_number,
-                            transaction_type="check",
+                            check_number=None,
+                            transaction_type=txn_type,
                         )
                     )
                     table_transactions += 1
-                    print(f"    Row {row_idx}: Check #{check_number}, Amount: {amount}")
-                    continue
-
-                # For all other transactions: Use sign to determine type
-                if amount > 0:
-                    # Check if this is an EDI payment from specific companies
-                    if self._is_edi_payment(row_text):
-                        txn_type = "edi_payment"
-                    else:
-                        txn_type = "deposit"  # Regular deposit
-                else:
-                    txn_type = "withdrawal"
-                
-                transactions.append(
-                    Transaction(
-                        date=self._standardize_date(date_str),
-                        description=self._clean_description(row_text),
-                        amount=amount,  # Use amount exactly as extracted
-                        check_number=None,
-                        transaction_type=txn_type,
-                    )
-                )
-                table_transactions += 1
-                print(f"    Row {row_idx}: {txn_type.title()}, Amount: {amount}")
+                    logger.debug("    Row %s: %s, Amount: %s", row_idx, txn_type.title(), amount)
+                stage.rows_out = table_transactions
 
-            print(f"  -> Extracted {table_transactions} transactions from table {t_idx}")
+            logger.debug("  -> Extracted %d transactions from table %d", table_transactions, t_idx)
+            if on_transactions is not None and len(transactions) > table_start:
+                with profiler.stage("provisional", rows_in=len(transactions) - table_start):
+                    on_transactions(transactions[table_start:])
 
-        print(f"Total transactions extracted: {len(transactions)}")
+        logger.info("Total transactions extracted: %d", len(transactions))
         return transactions
     
     def _norm(self, s: str) -> str:
         """Normalize whitespace"""
-        return re.sub(r"\s+", " ", s.replace("\xa0", " ")).strip()
+        return " ".join(s.split())  # splits on \xa0 too
 
     def _is_pure_ledger_row(self, text: str) -> bool:
             """
@@ -156,13 +200,13 @@ class BankOfAmericaParser(BaseParser):
             - NEW: a single (date amount) with no other content
             """
             # Normalize parentheses negatives: (1,234.56) -> -1,234.56
-            t = self._norm(re.sub(r"\(([\d,]+\.\d{2})\)", r"-\1", text))
+            t = self._norm(patterns.PAREN_NEGATIVE.sub(r"-\1", text))
 
             # Remove dates and amounts to see what's left (e.g., descriptions, check #s)
             leftover = self.date_pat.sub("", t)
             leftover = self.money_pat.sub("", leftover)
             # Strip punctuation/whitespace/symbols commonly around numbers
-            leftover = re.sub(r"[()\s,$\-]+", "", leftover)
+            leftover = LEDGER_PUNCTUATION.sub("", leftover)
 
             # If there's real text or other numbers (e.g., check numbers) left, it's not a ledger-only line
             if len(leftover) > 3:
@@ -185,21 +229,9 @@ class BankOfAmericaParser(BaseParser):
         txns: List[Transaction] = []
 
         # Normalize parentheses negatives: (1,234.56) -> -1,234.56
-        text = re.sub(r"\(([\d,]+\.\d{2})\)", r"-\1", row_text)
-
-        # Pattern for: DATE  CHECKNO  AMOUNT (FIXED: 3+ digits for check number)
-        triplet = re.compile(
-            r"""
-            (?P<date>\b\d{1,2}/\d{1,2}/\d{2,4}\b)    # date
-            \s+
-            (?P<check>\d{3,}\*?)                     # check number (3+ digits)
-            \s+
-            (?P<amount>[-+]?\$?\d[\d,]*\.\d{2})      # amount
-            """,
-            re.VERBOSE,
-        )
+        text = patterns.PAREN_NEGATIVE.sub(r"-\1", row_text)
 
-        for m in triplet.finditer(text):
+        for m in CHECK_TRIPLET.finditer(text):
             date_str = m.group("date")
             check_raw = m.group("check")
             amt_str = m.group("amount")
@@ -229,7 +261,7 @@ class BankOfAmericaParser(BaseParser):
 
         # If we see check numbers, it's not a ledger table
         sample_text = " ".join(self._norm(self._row_to_text(r)) for _, r in df.head(5).iterrows())
-        if re.search(r"\bcheck\b.*\d{3,}", sample_text, re.IGNORECASE):
+        if CHECK_WITH_NUMBER.search(sample_text):
             return False
 
         simple_rows = 0
@@ -242,9 +274,9 @@ class BankOfAmericaParser(BaseParser):
                 continue
 
             # Fallback: strip dates/amounts and see if little remains
-            temp = re.sub(r"\b\d{1,2}/\d{1,2}\b", "", row_text)
-            temp = re.sub(r"\d[\d,]*\.\d{2}", "", temp)
-            temp = re.sub(r"[(),\s$]+", "", temp).strip()
+            temp = patterns.MONTH_DAY_WORD.sub("", row_text)
+            temp = patterns.UNSIGNED_MONEY.sub("", temp)
+            temp = AMOUNT_PUNCTUATION.sub("", temp).strip()
             if len(temp) <= 5:
                 simple_rows += 1
 
@@ -277,17 +309,17 @@ class BankOfAmericaParser(BaseParser):
     def _extract_check_number(self, text: str) -> Optional[str]:
         """Extract check number from text - updated for longer check numbers"""
         # First try: Look for "Check #123456" format
-        m = re.search(r"Check\s*#?\s*(\d{3,})", text, flags=re.IGNORECASE)
+        m = LONG_CHECK_LABEL.search(text)
         if m:
             return m.group(1)
         
         # Second try: Look for any sequence of 3+ digits near an amount
-        m2 = re.search(r"\b(\d{3,})\b(?=.*-?\$?\d[\d,]*\.\d{2})", text)
+        m2 = LONG_CHECK_BEFORE_AMOUNT.search(text)
         if m2:
             return m2.group(1)
         
         # Third try: Just find the longest number sequence
-        numbers = re.findall(r"\b\d{3,}\b", text)
+        numbers = LONG_NUMBER.findall(text)
         if numbers:
             return numbers[-1]  # Return the last (rightmost) number found
         
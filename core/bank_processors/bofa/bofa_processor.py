@@ -1,161 +1,301 @@
+import bisect
+import dataclasses
+import logging
 import pandas as pd
-import tabula
 import pdfplumber
-from typing import List, Optional, Tuple
-from datetime import datetime
+from pdfplumber.table import TableSettings
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import date
 import re
+import sys
+import numpy as np
 from ...interfaces.transaction import Transaction
+from ...interfaces.transaction_table import TransactionTable
+from ...page_pool import PROCESS_MIN_PAGES, map_in_order, page_chunks, page_workers
+from ...pdf_session import PdfSession
+from ...profiling import StageProfiler
+from ...progress import ExtractionCancelled, ProgressReporter
+from ...statement_period import StatementPeriod
+from ...table_fingerprint import table_fingerprint
+from ...tabula_backend import get_tabula_backend
+from ...extraction_cache import ExtractionCache, code_version, get_extraction_cache
+from ... import pdf_session, tabula_backend
+from ... import table_fingerprint as table_fingerprint_module
 from .bofa_parser import BankOfAmericaParser
 
+logger = logging.getLogger(__name__)
+
 class BankOfAmericaProcessor:
     """Bank of America specific PDF processor - optimized for BoA statements"""
     
-    def __init__(self):
+    # tabula options used for BoA statements (single file and batch)
+    TABULA_OPTIONS = {
+        "pages": "all",
+        "multiple_tables": True,
+        "lattice": False,
+        "stream": True,
+        "guess": False,
+        "pandas_options": {"header": None},
+        "relative_area": True,
+        "area": (0, 0, 100, 100)
+    }
+
+    def __init__(self, session: Optional[PdfSession] = None, cache: Optional[ExtractionCache] = None):
         # BoA-specific parser only
         self.parser = BankOfAmericaParser()
         self.bank_name = "bank_of_america"
+        # Shared PDF session handed over by the factory after detection
+        self.session = session
+        # Persistent in-process tabula-java JVM shared by all processors
+        self.tabula_backend = get_tabula_backend()
+        # Raw-table cache keyed by PDF hash + the code that produces this bank's tables
+        # (the parser runs on the loaded tables, so parser edits don't invalidate it)
+        self.cache = cache if cache is not None else get_extraction_cache()
+        self.cache_version = code_version(sys.modules[__name__], pdf_session, table_fingerprint_module, tabula_backend)
 
-    def extract_transactions(self, pdf_path: str) -> Tuple[str, List[Transaction]]:
+    def extract_transactions(self, pdf_path: str, tabula_tables: Optional[List[pd.DataFrame]] = None,
+                             progress: Optional[ProgressReporter] = None,
+                             on_transactions: Optional[Callable[[List[Transaction]], None]] = None,
+                             profiler: Optional[StageProfiler] = None,
+                             cache_key: Optional[str] = None) -> Tuple[str, TransactionTable]:
         """
         Bank of America specific transaction extraction
+        tabula_tables: tables from a tabula batch run (skips the per-file tabula call)
+        progress: receives stage events; raises ExtractionCancelled once cancelled
+        on_transactions: receives each table's transactions as soon as it is parsed
+        profiler: filled with per-stage timings and row counts (see core.profiling)
+        cache_key: this PDF's cache key if already computed (hashing the PDF again is skipped)
         Returns: (bank_name, list_of_transactions)
         """
-        print(f"Processing BoA PDF: {pdf_path}")
-        
-        # BoA-specific table extraction
-        tables = self.extract_tables_tabula_boa(pdf_path)
+        logger.info("Processing BoA PDF: %s", pdf_path)
+        progress = progress or ProgressReporter()
+        profiler = profiler or StageProfiler()
         
-        # Additional debugging for BoA small tables
-        small_tables = [t for t in tables if t.shape[0] <= 5]
-        if small_tables:
-            print(f"Found {len(small_tables)} small BoA tables (≤5 rows)")
-            for i, t in enumerate(small_tables):
-                print(f"  Small BoA table {i}: {t.shape[0]}x{t.shape[1]} rows")
-
-        # Process using BoA parser
-        transactions = self.parser.process_tables(tables)
+        # Reuse the session opened during detection (or open one now)
+        session = PdfSession.reuse(self.session, pdf_path)
+        try:
+            progress.report("tables", "Extracting tables...")
+            # Cached raw tables for this exact PDF skip PDF parsing entirely
+            with profiler.stage("cache_read"):
+                if cache_key is None:
+                    cache_key = self.cache.key(pdf_path, self.cache_version)
+                tables = self.cache.get(cache_key)
+            collected = None
+            failed_pages = []  # a table set missing a page's tables must not be cached
+            if tables is not None:
+                logger.info("Using %d cached tables", len(tables))
+            else:
+                # BoA-specific table extraction, streamed page by page into the parser
+                tables = self.iter_tables_boa(pdf_path, session, tabula_tables, progress, profiler, failed_pages)
+                if cache_key is not None:
+                    collected = []  # only kept when the tables are going into the cache
+                    tables = self._collecting(tables, collected)
+            
+            # Statement period from the header text detection already read; dates the MM/DD rows
+            with profiler.stage("statement_period"):
+                period = session.statement_period()
+            if period is None:
+                logger.warning("⚠️ Statement period not found, dating rows in %d", self.FALLBACK_YEAR)
+
+            # Process using BoA parser
+            transactions = self.parser.process_tables(profiler.iterate("tables", tables), on_transactions, profiler, period)
+            if failed_pages:
+                logger.warning("⚠️ Not caching tables: page(s) %s failed to read", ", ".join(map(str, failed_pages)))
+            elif collected:
+                with profiler.stage("cache_write", rows_in=len(collected)):
+                    self.cache.put(cache_key, collected)
+        finally:
+            session.close()
         
         # BoA-specific monthly summaries
-        transactions = self._add_boa_monthly_summaries(transactions)
+        progress.report("parse", f"Parsed {len(transactions)} transactions")
+        progress.report("summarize", f"Summarizing {len(transactions)} transactions...")
+        with profiler.stage("monthly_summaries", rows_in=len(transactions)) as stage:
+            transactions = self._add_boa_monthly_summaries(transactions, period)
+            stage.rows_out = len(transactions)
 
-        print(f"Extracted {len(transactions)} BoA transactions")
+        logger.info("Extracted %d BoA transactions", len(transactions))
         return self.bank_name, transactions
+
+    @staticmethod
+    def _collecting(tables: Iterable[pd.DataFrame], collected: List[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Pass tables through while keeping them for the extraction cache"""
+        for table in tables:
+            collected.append(table)
+            yield table
+
+    def extract_transactions_batch(self, pdf_paths: List[str]) -> Dict[str, TransactionTable]:
+        """
+        Extract many BoA statements with one tabula batch run
+        Returns: {pdf_path: list_of_transactions}
+        """
+        # Only statements missing from the cache go through tabula
+        # Each PDF is hashed once, here, and its key handed to extract_transactions
+        keys = {path: self.cache.key(path, self.cache_version) for path in pdf_paths}
+        uncached = [path for path in pdf_paths if not self.cache.contains(keys[path])]
+        batch_tables = self.tabula_backend.read_pdf_batch(uncached, **self.TABULA_OPTIONS)
+        results = {}
+        for pdf_path in pdf_paths:
+            _, results[pdf_path] = self.extract_transactions(pdf_path, tabula_tables=batch_tables.get(pdf_path),
+                                                           cache_key=keys[pdf_path])
+        return results
     
-    def extract_tables_tabula_boa(self, pdf_path: str) -> List[pd.DataFrame]:
+    def extract_tables_tabula_boa(self, pdf_path: str, session: Optional[PdfSession] = None,
+                                  tabula_tables: Optional[List[pd.DataFrame]] = None,
+                                  progress: Optional[ProgressReporter] = None) -> List[pd.DataFrame]:
         """
         Bank of America optimized table extraction
         """
-        frames: List[pd.DataFrame] = []
+        return list(self.iter_tables_boa(pdf_path, session, tabula_tables, progress))
+
+    def iter_tables_boa(self, pdf_path: str, session: Optional[PdfSession] = None,
+                        tabula_tables: Optional[List[pd.DataFrame]] = None,
+                        progress: Optional[ProgressReporter] = None,
+                        profiler: Optional[StageProfiler] = None,
+                        failed_pages: Optional[List[int]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield BoA tables page by page as tabula reads them (pdfplumber fallback at the end)
+        failed_pages receives the pages tabula failed to read (their tables are missing)
+        """
+        failed_pages = failed_pages if failed_pages is not None else []
+        session = PdfSession.reuse(session, pdf_path)
+        progress = progress or ProgressReporter()
+        profiler = profiler or StageProfiler()
+        collected = 0
         seen_signatures = set()
 
-        def _collect(dfs: List[pd.DataFrame], method_name: str):
-            """Deduplicate and collect dataframes"""
+        def _collect(dfs: List[pd.DataFrame], method_name: str) -> List[pd.DataFrame]:
+            """Deduplicate dataframes; returns the ones not seen before"""
+            new_frames = []
             for i, df in enumerate(dfs or []):
                 if df is None or df.empty:
                     continue
-                sig = (df.shape[0], df.shape[1],
-                    tuple(df.head(2).fillna("").astype(str).agg("|".join, axis=1)))
+                sig = table_fingerprint(df)
                 if sig not in seen_signatures:
                     seen_signatures.add(sig)
-                    frames.append(df)
-                    print(f"  Collected BoA table from {method_name}: {df.shape[0]}x{df.shape[1]}")
+                    new_frames.append(df)
+                    logger.debug("  Collected BoA table from %s: %dx%d", method_name, df.shape[0], df.shape[1])
+                    if df.shape[0] <= 5:
+                        logger.debug("  Small BoA table (≤5 rows): %dx%d", df.shape[0], df.shape[1])
+            return new_frames
 
-        print("Extracting BoA tables with tabula-py (using advanced methods only)...")
+        logger.debug("Extracting BoA tables with tabula-py (using advanced methods only)...")
 
         # BoA-specific extraction method
-        try:
-            print("  Using BoA-specific extraction...")
+        logger.debug("  Using BoA-specific extraction...")
+        if tabula_tables is not None:
+            # Tables already extracted by a tabula batch run
+            for df in _collect(tabula_tables, "BoA-specific (batch)"):
+                collected += 1
+                yield df
+        else:
+            # Pages are read on a thread pool (tabula-java runs outside the GIL) and merged back in page order
+            page_count = session.page_count
+            workers = page_workers(page_count)
+            if workers > 1:
+                # Start the JVM on this thread: JPype can't shut down a JVM a pool thread started
+                self.tabula_backend.warm_up()
+            pages = map_in_order(lambda page_num: self._read_tabula_page(pdf_path, page_num),
+                                 range(1, page_count + 1), workers)
             try:
-                dfs_area = tabula.read_pdf(
-                    pdf_path, pages="all", multiple_tables=True,
-                    lattice=False, stream=True, guess=False,
-                    pandas_options={"header": None},
-                    relative_area=True, area=(0, 0, 100, 100)
-                )
-                _collect(dfs_area, "BoA-specific")
-            except TypeError:
-                dfs_area_fb = tabula.read_pdf(
-                    pdf_path, pages="all", multiple_tables=True,
-                    lattice=False, stream=True, guess=False,
-                    pandas_options={"header": None},
-                )
-                _collect(dfs_area_fb, "BoA-specific (fallback)")
-            except Exception as e:
-                print(f"  BoA-specific extraction error: {e}")
-        except Exception as e:
-            print(f"  BoA extraction error: {e}")
+                # Waiting on the pool is the "tabula" stage; it counts the tables read
+                timed_pages = profiler.iterate("tabula", pages, count=lambda page: len(page[1][1]))
+                for page_num, (method_name, dfs, error) in timed_pages:
+                    progress.report("tables", f"Reading page {page_num} of {page_count}", page_num, page_count)
+                    if error is not None:
+                        logger.warning("  BoA-specific extraction error on page %d: %s", page_num, error)
+                        failed_pages.append(page_num)
+                        continue
+                    for df in _collect(dfs, method_name):
+                        collected += 1
+                        yield df
+            finally:
+                pages.close()
 
         # BoA-specific pdfplumber fallback
-        if len(frames) < 3:
-            print("  Very few BoA tables found, trying pdfplumber as fallback...")
-            tables_plumber = self.extract_tables_pdfplumber_boa(pdf_path)
-            for i, tbl in enumerate(tables_plumber):
+        if collected < 3:
+            logger.info("  Very few BoA tables found, trying pdfplumber as fallback...")
+            with profiler.stage("pdfplumber_fallback") as stage:
+                tables_plumber = self.extract_tables_pdfplumber_boa(pdf_path, session, progress)
+                stage.rows_out = len(tables_plumber)
+            frames = []
+            for tbl in tables_plumber:
                 try:
-                    df = pd.DataFrame(tbl)
-                    if not df.empty:
-                        frames.append(df)
-                        print(f"  Collected BoA table from pdfplumber: {df.shape[0]}x{df.shape[1]}")
+                    frames.append(pd.DataFrame(tbl))
                 except Exception:
                     continue
+            # Same fingerprints as the tabula tables, so a table both methods found is kept once
+            for df in _collect(frames, "pdfplumber"):
+                collected += 1
+                yield df
 
-        print(f"Total BoA tables extracted: {len(frames)}")
-        return frames
+        logger.info("Total BoA tables extracted: %d", collected)
 
-    def extract_tables_pdfplumber_boa(self, pdf_path: str) -> List[List[List]]:
+    def _read_tabula_page(self, pdf_path: str, page_num: int) -> Tuple[str, List[pd.DataFrame], Optional[Exception]]:
+        """Read one page with the BoA options; returns (method name, tables, error) so it can run on a worker thread"""
+        options = {key: value for key, value in self.TABULA_OPTIONS.items() if key != "pages"}
+        try:
+            try:
+                return "BoA-specific", self.tabula_backend.read_pdf(pdf_path, pages=page_num, **options), None
+            except TypeError:
+                dfs_area_fb = self.tabula_backend.read_pdf(
+                    pdf_path, pages=page_num, multiple_tables=True,
+                    lattice=False, stream=True, guess=False,
+                    pandas_options={"header": None},
+                )
+                return "BoA-specific (fallback)", dfs_area_fb, None
+        except Exception as e:
+            return "BoA-specific", [], e
+
+    def extract_tables_pdfplumber_boa(self, pdf_path: str, session: Optional[PdfSession] = None,
+                                      progress: Optional[ProgressReporter] = None) -> List[List[List]]:
         """BoA-specific pdfplumber extraction"""
         all_tables = []
+        seen = set()  # signatures of the tables in all_tables
+        session = PdfSession.reuse(session, pdf_path)
+        progress = progress or ProgressReporter()
+        page_count = session.page_count
+        # Short statements are read from the session's already open pages
+        workers = page_workers(page_count, min_pages=PROCESS_MIN_PAGES)
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    tables = page.extract_tables()
+            if workers > 1:
+                # pdfplumber is pure Python and holds the GIL, so threads wouldn't overlap it;
+                # contiguous page ranges go to worker processes, each reopening the PDF
+                chunks = map_in_order(_pdfplumber_boa_pages, [(pdf_path, chunk) for chunk in page_chunks(list(range(page_count)), workers)],
+                                      workers, use_processes=True)
+                pages = (page for _, chunk_pages in chunks for page in chunk_pages)
+            else:
+                chunks = None
+                pages = ((page_num, *_pdfplumber_boa_page(session.page(page_num))) for page_num in range(page_count))
+
+            try:
+                for page_num, tables, tables_lenient in pages:
+                    progress.report("tables", f"Scanning page {page_num + 1} of {page_count}", page_num + 1, page_count)
                     if tables:
                         all_tables.extend(tables)
-                        print(f"    BoA Page {page_num + 1}: found {len(tables)} tables")
-                    
-                    # BoA-specific lenient settings
-                    tables_lenient = page.extract_tables(
-                        table_settings={
-                            "vertical_strategy": "lines_strict",
-                            "horizontal_strategy": "lines_strict",
-                            "intersection_tolerance": 3,
-                            "join_tolerance": 3
-                        }
-                    )
-                    if tables_lenient:
-                        for tbl in tables_lenient:
-                            if tbl not in all_tables:
-                                all_tables.append(tbl)
-                                
+                        logger.debug("    BoA Page %d: found %d tables", page_num + 1, len(tables))
+                    seen.update(_table_signature(tbl) for tbl in tables)
+                    for tbl in tables_lenient or ():
+                        sig = _table_signature(tbl)
+                        if sig not in seen:
+                            seen.add(sig)
+                            all_tables.append(tbl)
+            finally:
+                if chunks is not None:
+                    chunks.close()
+
+        except ExtractionCancelled:
+            raise
         except Exception as e:
-            print(f"BoA PDFPlumber extraction error: {e}")
+            logger.warning("BoA PDFPlumber extraction error: %s", e)
         return all_tables
     
-    def export_to_csv(self, transactions: List[Transaction], output_path: str):
+    def export_to_csv(self, transactions: TransactionTable, output_path: str):
         """Export BoA transactions to CSV"""
-        data = []
-        for txn in transactions:
-            data.append({
-                "Date": txn.date,
-                "Check No": txn.check_number or "",
-                "Description": txn.description,
-                "Amount": txn.amount
-            })
-        
-        df = pd.DataFrame(data)
+        df = TransactionTable.coerce(transactions).to_frame()
         df.to_csv(output_path, index=False)
-        print(f"Exported {len(data)} BoA transactions to {output_path}")
+        logger.info("Exported %d BoA transactions to %s", len(df), output_path)
     
-    def _parse_date_for_sort(self, s: str) -> datetime:
-        """Robust date key (supports ISO and MM/DD/YY or MM/DD/YYYY)."""
-        if not s:
-            return datetime.max
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
-            try:
-                return datetime.strptime(s.strip(), fmt)
-            except Exception:
-                continue
-        return datetime.max
-
     def _sort_txns(self, txns: List[Transaction]) -> List[Transaction]:
         """
         Sort so UI naturally shows sections in expected order:
@@ -163,58 +303,79 @@ class BankOfAmericaProcessor:
         """
         priority = {"deposit": 0, "withdrawal": 1, "check": 2}
         def key(t: Transaction):
-            ttype = (getattr(t, "transaction_type", "") or "").lower()
-            return (priority.get(ttype, 9), self._parse_date_for_sort(getattr(t, "date", "")), getattr(t, "description", ""))
+            # posted_date is parsed once when the transaction is built; undated rows sort last
+            return (priority.get(t.transaction_type, 9), t.posted_date or date.max, t.description)
         return sorted(txns, key=key)
 
-    def _add_boa_monthly_summaries(self, transactions: List[Transaction]) -> List[Transaction]:
+    # Year of MM/DD dates when the statement period isn't found in the header
+    FALLBACK_YEAR = 2024
+
+    @classmethod
+    def _boa_month_key(cls, date: str, period: Optional[StatementPeriod] = None) -> str:
+        """
+        YYYY-MM bucket of a BoA date string (MM/DD[/YY[YY]]), 'unknown' if unparseable.
+        MM/DD dates take their year from the statement period (FALLBACK_YEAR without one).
+        """
+        try:
+            date_parts = date.split("/")
+            month = int(date_parts[0])
+            if len(date_parts) == 3:
+                year = int(date_parts[2])
+            else:
+                year = period.year_for(month) if period is not None else cls.FALLBACK_YEAR
+            if year < 100:
+                year += 2000
+            return f"{year}-{month:02d}"
+        except (ValueError, IndexError):
+            return "unknown"
+
+    def _add_boa_monthly_summaries(self, transactions, period: Optional[StatementPeriod] = None) -> TransactionTable:
         """Add monthly deposit summaries for Bank of America with EDI payment structure"""
-        from collections import defaultdict
         import calendar
         
-        print("Adding BoA monthly summaries with EDI structure...")
+        logger.debug("Adding BoA monthly summaries with EDI structure...")
+        table = TransactionTable.coerce(transactions)
+        trace = logger.isEnabledFor(logging.DEBUG)
+        if trace:
+            logger.debug("Transaction types before filtering: %s", table.type_counts())
         
-        # DEBUG: Check what transaction types we have
-        type_counts = {}
-        for txn in transactions:
-            ttype = txn.transaction_type
-            type_counts[ttype] = type_counts.get(ttype, 0) + 1
-        print(f"Transaction types before filtering: {type_counts}")
+        # Month key per distinct date string, broadcast to rows (sorted keys, same order as sorted())
+        date_ids, row_date = np.unique(table.date_ids, return_inverse=True)
+        date_month_keys = np.array([self._boa_month_key(table.strings[i], period) for i in date_ids] or [""], dtype=object)
+        month_keys, date_month = np.unique(date_month_keys, return_inverse=True)
+        row_month = date_month[row_date] if len(table) else np.zeros(0, dtype=np.intp)
         
-        # Group by month and calculate deposit totals
-        monthly_groups = defaultdict(list)
-        monthly_deposit_totals = defaultdict(float)
+        # Sum ALL deposits (both regular deposits and EDI payments) per month, in cents
+        deposit_cents = np.zeros(len(month_keys), dtype=np.int64)
+        is_deposit = table.type_mask("deposit", "edi_payment") & (table.cents > 0)
+        np.add.at(deposit_cents, row_month[is_deposit], table.cents[is_deposit])
         
-        for txn in transactions:
-            try:
-                date_parts = txn.date.split("/")
-                month = int(date_parts[0])
-                year = int(date_parts[2]) if len(date_parts) == 3 else 2024
-                if year < 100:
-                    year += 2000
-                
-                month_key = f"{year}-{month:02d}"
-                monthly_groups[month_key].append(txn)
-                
-                # Sum ALL deposits (both regular deposits and EDI payments) for summary
-                if txn.transaction_type in ["deposit", "edi_payment"] and txn.amount > 0:
-                    monthly_deposit_totals[month_key] += txn.amount
-                    
-            except (ValueError, IndexError):
-                monthly_groups["unknown"].append(txn)
+        # Include: EDI payments, withdrawals, and checks - regular deposits are only summarized
+        # Sort: EDI payments first, then withdrawals, then checks, each by date text and description
+        priority = np.full(len(table.type_names), 9, dtype=np.int8)
+        for rank, ttype in enumerate(["edi_payment", "withdrawal", "check"]):
+            if ttype in table.type_names:
+                priority[table.type_names.index(ttype)] = rank
+        row_priority = priority[table.type_codes]
+        ranks = table.string_ranks()
+        row_order = np.lexsort((ranks[table.desc_ids], ranks[table.date_ids], row_priority))
+        is_listed = row_priority[row_order] < 9
         
-        # Build final list with new structure
-        final_transactions = []
+        summaries = []
+        final_rows = []  # row indices into table; summaries are numbered after its last row
         
-        for month_key in sorted(monthly_groups.keys()):
+        for m, month_key in enumerate(month_keys):
+            if month_key == "":
+                continue
             if month_key == "unknown":
-                final_transactions.extend(monthly_groups[month_key])
+                final_rows.append(np.flatnonzero(row_month == m))
                 continue
             
-            month_txns = monthly_groups[month_key]
-            deposit_total = monthly_deposit_totals[month_key]
+            month_rows = row_order[(row_month[row_order] == m) & is_listed]
+            deposit_total = int(deposit_cents[m]) / 100
             
-            print(f"Month {month_key}: ${deposit_total:.2f} total deposits, {len(month_txns)} transactions")
+            if trace:
+                logger.debug("Month %s: $%.2f total deposits, %d transactions", month_key, deposit_total, int((row_month == m).sum()))
             
             # 1. Add deposit summary first (based on ALL deposits)
             if deposit_total > 0:
@@ -229,46 +390,114 @@ class BankOfAmericaProcessor:
                     check_number=None,
                     transaction_type="deposit_summary"
                 )
-                final_transactions.append(summary)
-                print(f"Added summary: {summary.date} - ${deposit_total:.2f}")
-            
-            # 2. Filter and sort transactions for this month
-            filtered_month_txns = []
+                final_rows.append(np.array([len(table) + len(summaries)]))
+                summaries.append(summary)
+                logger.info("Added summary: %s - $%.2f", summary.date, deposit_total)
             
-            # DEBUG: Check transaction types in this month
-            month_type_counts = {}
-            for txn in month_txns:
-                ttype = txn.transaction_type
-                month_type_counts[ttype] = month_type_counts.get(ttype, 0) + 1
-            print(f"  Month {month_key} transaction types: {month_type_counts}")
+            if trace:
+                logger.debug("  Month %s transaction types: %s", month_key, table.take(row_month == m).type_counts())
             
-            for txn in month_txns:
-                # Include: EDI payments, withdrawals, and checks
-                # EXCLUDE: regular deposits (keep only EDI payments from deposits)
-                if txn.transaction_type == "edi_payment":
-                    filtered_month_txns.append(txn)
-                    print(f"  Included EDI: {txn.description[:30]} - ${txn.amount}")
-                elif txn.transaction_type == "withdrawal":
-                    filtered_month_txns.append(txn)
-                    print(f"  Included withdrawal: {txn.description[:30]} - ${txn.amount}")
-                elif txn.transaction_type == "check":
-                    filtered_month_txns.append(txn)
-                    print(f"  Included check #{txn.check_number}: {txn.description[:30]} - ${txn.amount}")
-                elif txn.transaction_type == "deposit":
-                    # Skip regular deposits - they're summarized but not listed individually
-                    print(f"  Filtered out regular deposit: {txn.description[:30]} - ${txn.amount}")
-                else:
-                    print(f"  Unknown type '{txn.transaction_type}': {txn.description[:30]} - ${txn.amount}")
-            
-            # 3. Sort: EDI payments first, then withdrawals, then checks
-            def sort_key(t):
-                priority = {"edi_payment": 0, "withdrawal": 1, "check": 2}
-                return (priority.get(t.transaction_type, 9), t.date, t.description)
-            
-            sorted_filtered_txns = sorted(filtered_month_txns, key=sort_key)
-            final_transactions.extend(sorted_filtered_txns)
-            
-            print(f"  Added {len(sorted_filtered_txns)} individual transactions")
+            # 2./3. Filtered and sorted transactions for this month
+            final_rows.append(month_rows)
+            logger.debug("  Added %d individual transactions", len(month_rows))
+        
+        combined = table.take(np.arange(len(table)))
+        combined.extend(summaries)
+        final_transactions = combined.take(np.concatenate(final_rows) if final_rows else np.zeros(0, dtype=np.intp))
         
-        print(f"Final structure: {len(final_transactions)} transactions")
-        return final_transactions
\ No newline at end of file
+        logger.info("Final structure: %d transactions", len(final_transactions))
+        return final_transactions
+
+
+# BoA lenient pdfplumber settings for the fallback's second pass
+BOA_LENIENT_TABLE_SETTINGS = {
+    "vertical_strategy": "lines_strict",
+    "horizontal_strategy": "lines_strict",
+    "intersection_tolerance": 3,
+    "join_tolerance": 3
+}
+# Whether the lenient settings are the defaults restricted to line edges
+_LENIENT_IS_LINES_ONLY_DEFAULT = dataclasses.replace(
+    TableSettings.resolve(BOA_LENIENT_TABLE_SETTINGS), vertical_strategy="lines", horizontal_strategy="lines",
+) == TableSettings.resolve(None)
+
+
+class _PageChars:
+    """A page's chars with their midpoints, indexed by vertical midpoint for row lookups"""
+
+    def __init__(self, chars: List[Dict]):
+        self.chars = chars
+        self.v_mid = [(char["top"] + char["bottom"]) / 2 for char in chars]
+        self.h_mid = [(char["x0"] + char["x1"]) / 2 for char in chars]
+        self.by_v_mid = sorted(range(len(chars)), key=self.v_mid.__getitem__)
+        self.sorted_v_mid = [self.v_mid[i] for i in self.by_v_mid]
+
+    def in_bbox(self, bbox, candidates: Optional[List[int]] = None) -> List[int]:
+        """Indexes (in page order) of the chars, or of the candidates, whose midpoint lies in bbox"""
+        x0, top, x1, bottom = bbox
+        if candidates is None:
+            lo, hi = bisect.bisect_left(self.sorted_v_mid, top), bisect.bisect_left(self.sorted_v_mid, bottom)
+            return sorted(i for i in self.by_v_mid[lo:hi] if x0 <= self.h_mid[i] < x1)
+        return [i for i in candidates if x0 <= self.h_mid[i] < x1 and top <= self.v_mid[i] < bottom]
+
+
+def _extract_table(table, page_chars: _PageChars) -> List[List]:
+    """
+    pdfplumber's Table.extract() (default text settings), looking chars up by row instead of
+    scanning the page per cell. Mirrors the pinned pdfplumber 0.10.2; test_bofa_processor.py
+    compares the two, so re-check it when upgrading pdfplumber.
+    """
+    table_arr = []
+    for row in table.rows:
+        row_chars = page_chars.in_bbox(row.bbox)
+        arr = []
+        for cell in row.cells:
+            if cell is None:
+                arr.append(None)
+                continue
+            cell_chars = page_chars.in_bbox(cell, row_chars)
+            if cell_chars:
+                arr.append(pdfplumber.utils.extract_text([page_chars.chars[i] for i in cell_chars],
+                                                         x_shift=cell[0], y_shift=cell[1]))
+            else:
+                arr.append("")
+        table_arr.append(arr)
+    return table_arr
+
+
+def _pdfplumber_boa_page(page) -> Tuple[List[List[List]], List[List[List]]]:
+    """
+    (default tables, lenient tables) of one pdfplumber page. The lenient settings only
+    differ from the defaults by ignoring rect and curve edges, so on a page drawn with
+    lines alone both finders see the same edges and the lenient tables are the default
+    ones again. Otherwise the two finders share the page's char index, and a table both
+    build from the same cells is read once.
+    """
+    page_chars = None  # built for the page's first table
+    extracted = {}
+
+    def extract(table) -> List[List]:
+        nonlocal page_chars
+        key = tuple(table.cells)
+        if key not in extracted:
+            if page_chars is None:
+                page_chars = _PageChars(page.chars)
+            extracted[key] = _extract_table(table, page_chars)
+        return extracted[key]
+
+    tables = [extract(table) for table in page.find_tables()]
+    if _LENIENT_IS_LINES_ONLY_DEFAULT and not page.rect_edges and not page.curve_edges:
+        return tables, tables
+    return tables, [extract(table) for table in page.find_tables(BOA_LENIENT_TABLE_SETTINGS)]
+
+
+def _table_signature(table: List[List]) -> Tuple[Tuple, ...]:
+    """Hashable form of an extracted table; equal tables have equal signatures"""
+    return tuple(map(tuple, table))
+
+
+def _pdfplumber_boa_pages(job: Tuple[str, List[int]]) -> List[Tuple[int, List[List[List]], List[List[List]]]]:
+    """Worker-process entry point: pdfplumber tables for a range of 0-based pages"""
+    pdf_path, page_numbers = job
+    with pdfplumber.open(pdf_path) as pdf:
+        return [(page_num, *_pdfplumber_boa_page(pdf.pages[page_num])) for page_num in page_numbers]
@@ -666,21 +666,29 @@
         
 #         return transactions
 
+import calendar
+import logging
 import re
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+from ...interfaces import patterns
 from ...interfaces.base_parser import BaseParser
-from ...interfaces.transaction import Transaction
+from ...interfaces.transaction import Transaction, to_cents
+from ...profiling import StageProfiler
+from ...statement_period import StatementPeriod
+
+logger = logging.getLogger(__name__)
 
 class WellsFargoParser(BaseParser):
     """Wells Fargo bank statement parser - with early deduplication to fix deposit totals"""
     
     def __init__(self):
         super().__init__()
-        self.date_pat = re.compile(r"\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b")
-        self.money_pat = re.compile(r"[-+]?\$?\d[\d,]*\.\d{2}")
-        self.check_word_pat = re.compile(r"\bCHECK(?!CARD)\b", re.IGNORECASE)
-        self.checknum_pat = re.compile(r"\b\d{3,}\*?\b")
+        self.date_pat = patterns.DATE
+        self.money_pat = patterns.MONEY
+        self.check_word_pat = patterns.CHECK_WORD
+        self.checknum_pat = patterns.CHECK_NUMBER_TOKEN
     
     def get_bank_name(self) -> str:
         return "wells_fargo"
@@ -688,106 +696,131 @@ class WellsFargoParser(BaseParser):
     def get_detection_keywords(self) -> List[str]:
         return ["WELLS FARGO", "NAVIGATE BUSINESS CHECKING", "WELLSFARGO.COM/BIZ"]
     
-    def process_tables(self, tables: List[pd.DataFrame]) -> List[Transaction]:
-        """Process Wells Fargo tables with early deduplication to fix deposit totals"""
-        print(f"Processing {len(tables)} tables for Wells Fargo...")
+    def process_tables(self, tables: Iterable[pd.DataFrame],
+                       on_transactions: Optional[Callable[[List[Transaction]], None]] = None,
+                       profiler: Optional[StageProfiler] = None,
+                       period: Optional[StatementPeriod] = None) -> List[Transaction]:
+        """
+        Process Wells Fargo tables with early deduplication to fix deposit totals.
+        tables may be a generator of tables whose rows were already deduplicated
+        (the processor's drop_seen_rows stage): each table is classified and
+        flattened as it arrives. on_transactions gets that table's provisional
+        transactions right away. The returned list is the final result, with the
+        monthly summary, deposit filtering and type ordering applied.
+        profiler records each step's time and row counts.
+        period is the statement period (PdfSession.statement_period) that dates the M/D rows.
+        """
+        logger.debug("Processing tables for Wells Fargo...")
+        profiler = profiler or StageProfiler()
 
-        # Find transaction tables (exclude check summaries)
-        transaction_tables = []
+        # Find transaction tables (exclude check summaries) and combine them into raw rows
+        all_rows = []
+        max_cols = 0
+        table_count = 0
+        transaction_table_count = 0
         
         for i, table in enumerate(tables):
+            table_count += 1
             if table.empty:
-                print(f"Table {i}: Empty - skipping")
+                logger.debug("Table %d: Empty - skipping", i)
                 continue
 
-            print(f"Table {i}: {table.shape[0]} rows, {table.shape[1]} cols")
+            logger.debug("Table %d: %d rows, %d cols", i, table.shape[0], table.shape[1])
+            
+            with profiler.stage("classify_tables", rows_in=1) as stage:
+                is_check_summary = self._is_check_summary_table(table)
+                is_transaction_table = not is_check_summary and self._is_transaction_table(table)
+                stage.rows_out = int(is_transaction_table)
             
-            if self._is_check_summary_table(table):
-                print(f"  -> Skipping: Check summary table")
+            if is_check_summary:
+                logger.debug("  -> Skipping: Check summary table")
                 continue
             
-            if self._is_transaction_table(table):
-                print(f"  -> Including: Transaction table")
-                transaction_tables.append((i, table))
-            else:
-                print(f"  -> Skipping: Not a transaction table")
-
-        if not transaction_tables:
-            print("No transaction tables found")
-            return []
+            if not is_transaction_table:
+                logger.debug("  -> Skipping: Not a transaction table")
+                continue
 
-        # Combine all transaction tables into raw rows
-        all_rows = []
-        max_cols = 0
-        
-        for table_idx, table in transaction_tables:
-            print(f"Processing table {table_idx}...")
+            logger.debug("  -> Including: Transaction table")
+            transaction_table_count += 1
             max_cols = max(max_cols, table.shape[1])
-            
-            for row_idx in range(len(table)):
-                row_data = []
-                for col_idx in range(table.shape[1]):
-                    cell = table.iloc[row_idx, col_idx]
-                    if pd.isna(cell):
-                        row_data.append("")
-                    else:
-                        row_data.append(str(cell).strip())
-                
-                # Pad row to max columns
-                while len(row_data) < max_cols:
-                    row_data.append("")
-                
-                all_rows.append(row_data)
 
-        print(f"Combined {len(all_rows)} total rows from all transaction tables")
+            # Rows are already deduplicated across tables (WellsFargoProcessor._drop_seen_rows)
+            with profiler.stage("flatten", rows_in=len(table)) as stage:
+                table_rows = self._table_to_rows(table, max_cols)
+                stage.rows_out = len(table_rows)
+            all_rows.extend(table_rows)
 
-        # 🆕 NEW: Deduplicate raw rows BEFORE processing to fix deposit totals
-        all_rows = self._deduplicate_raw_rows(all_rows)
+            if on_transactions is not None and table_rows:
+                with profiler.stage("provisional", rows_in=len(table_rows)) as stage:
+                    provisional = self._provisional_transactions(table_rows, period)
+                    stage.rows_out = len(provisional)
+                    if provisional:
+                        on_transactions(provisional)
+
+        logger.info("Processed %d tables", table_count)
+        if not transaction_table_count:
+            logger.warning("No transaction tables found")
+            return []
+
+        logger.info("Combined %d unique rows from all transaction tables", len(all_rows))
 
         # Process the deduplicated raw rows using exact test file logic
-        processed_rows = self._process_raw_rows(all_rows)
+        processed_rows = self._process_raw_rows(all_rows, profiler, period)
         
         # Convert to Transaction objects
-        transactions = self._convert_to_transactions(processed_rows)
+        with profiler.stage("convert", rows_in=len(processed_rows)) as stage:
+            transactions = self._convert_to_transactions(processed_rows)
+            stage.rows_out = len(transactions)
         
-        print(f"Total transactions extracted: {len(transactions)}")
+        logger.info("Total transactions extracted: %d", len(transactions))
         return transactions
     
-    def _deduplicate_raw_rows(self, all_rows: List[List[str]]) -> List[List[str]]:
+    def _provisional_transactions(self, rows: List[List[str]],
+                                  period: Optional[StatementPeriod] = None) -> List[Transaction]:
         """
-        🆕 NEW: Deduplicate raw rows - only remove EXACT duplicates, preserve legitimate transactions on different dates
+        Row-level view of one table's rows for early display: regular deposits
+        dropped, amount columns merged. The monthly summary, balance-column
+        removal and type ordering need every row and only happen in the final pass.
         """
-        print("🔍 Deduplicating raw rows (exact matches only)...")
-        
-        unique_rows = []
-        seen_signatures = set()
-        duplicates_removed = 0
-        
-        for row in all_rows:
-            # Create a signature using ALL meaningful columns (including date)
-            # This ensures we only remove EXACT duplicates, not similar transactions on different dates
-            signature_parts = []
-            for i, cell in enumerate(row):
-                cleaned_cell = str(cell).strip()
-                signature_parts.append(cleaned_cell)
-            
-            # Create signature from the entire row content
-            signature = tuple(signature_parts)
-            
-            if signature not in seen_signatures:
-                seen_signatures.add(signature)
-                unique_rows.append(row)
-            else:
-                duplicates_removed += 1
-                # Only show first few parts for readability
-                preview = [str(cell)[:20] for cell in row[:4]]
-                print(f"   Removed exact duplicate: {preview}")
+        kept = [list(row) for row in rows if not self._is_regular_deposit(row)]
+        return self._convert_to_transactions(self._merge_amount_columns(kept, period))
+    
+    def _table_to_rows(self, table: pd.DataFrame, width: int) -> List[List[str]]:
+        """Flatten a table into stripped string rows padded to width ("" for missing cells)"""
+        values = table.to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = ""
+        
+        # str() + strip over every cell in one pass, then back to the table's shape
+        cells = pd.Series(values.ravel(), dtype=object).astype(str).str.strip().to_numpy().reshape(values.shape)
         
-        print(f"✅ Deduplication complete: {duplicates_removed} exact duplicates removed")
-        print(f"   Total rows: {len(all_rows)} → {len(unique_rows)}")
+        if width > cells.shape[1]:
+            padding = np.full((cells.shape[0], width - cells.shape[1]), "", dtype=object)
+            cells = np.hstack([cells, padding])
         
-        return unique_rows
+        return cells.tolist()
     
+    # Whole-cell patterns for the table classifiers; surrounding \s* stands in for str(cell).strip()
+    WF_DATE_CELL = r'\s*\d{1,2}/\d{1,2}\s*$'
+    WF_AMOUNT_CELL = r'\s*\d{1,3}(,\d{3})*\.\d{2}\s*$'
+    CHECK_NUMBER_CELL = r'\s*\d{4}\s*$'
+    TRANSACTION_KEYWORDS = ['bankcard', 'purchase', 'ach', 'deposit', 'payment', 'tobacco', 'mtot', 'shell', 'authorized']
+    SUMMARY_KEYWORDS = [
+        'summary of checks', 'checks written', 'check images',
+        'account number:', 'check number:', 'amount:',
+        'gap in check sequence', 'checks listed are also displayed',
+        'number date amount'
+    ]
+
+    def _cell_strings(self, table: pd.DataFrame) -> pd.Series:
+        """All cells as str(cell) in one flat Series (row-major)"""
+        # Convert a copy: DataFrame.astype(str) can write into the caller's object block (e.g. unpickled cached tables)
+        values = table.to_numpy(dtype=object, copy=True).ravel()
+        return pd.Series(values, dtype=object).astype(str)
+
+    def is_transaction_table(self, table: pd.DataFrame) -> bool:
+        """Whether process_tables parses this table as transactions (a transaction table that isn't a check summary)"""
+        return not self._is_check_summary_table(table) and self._is_transaction_table(table)
+
     def _is_transaction_table(self, table: pd.DataFrame) -> bool:
         """Check if table contains Wells Fargo transactions"""
         if table.shape[0] < 1:
@@ -796,29 +829,18 @@ class WellsFargoParser(BaseParser):
         if table.shape[1] < 3:
             return False
         
-        # Count transaction indicators
-        date_count = 0
-        amount_count = 0
-        keyword_count = 0
+        # Count transaction indicators over all cells at once
+        cells = self._cell_strings(table)
         
-        # Check all rows for patterns
-        for row_idx in range(len(table)):
-            for col_idx in range(table.shape[1]):
-                cell = str(table.iloc[row_idx, col_idx]).strip()
-                
-                # Wells Fargo date format
-                if re.match(r'^\d{1,2}/\d{1,2}$', cell):
-                    date_count += 1
-                
-                # Amount format
-                if re.match(r'^\d{1,3}(,\d{3})*\.\d{2}$', cell):
-                    amount_count += 1
-                
-                # Transaction keywords
-                cell_lower = cell.lower()
-                keywords = ['bankcard', 'purchase', 'ach', 'deposit', 'payment', 'tobacco', 'mtot', 'shell', 'authorized']
-                if any(keyword in cell_lower for keyword in keywords):
-                    keyword_count += 1
+        # Wells Fargo date format
+        date_count = int(cells.str.match(self.WF_DATE_CELL).sum())
+        
+        # Amount format
+        amount_count = int(cells.str.match(self.WF_AMOUNT_CELL).sum())
+        
+        # Transaction keywords (one alternation instead of a scan per keyword)
+        keyword_pattern = "|".join(re.escape(k) for k in self.TRANSACTION_KEYWORDS)
+        keyword_count = int(cells.str.contains(keyword_pattern, case=False, regex=True).sum())
         
         # More lenient criteria for small tables
         if table.shape[0] <= 3:
@@ -828,96 +850,168 @@ class WellsFargoParser(BaseParser):
 
     def _is_check_summary_table(self, table: pd.DataFrame) -> bool:
         """Detect check summary tables and check image tables to exclude them"""
+        if table.shape[0] == 0 or table.shape[1] == 0:
+            return False
+        
+        cells = self._cell_strings(table)
+        grid = cells.to_numpy().reshape(table.shape)
+        
         # Check all cells for summary indicators
-        for row_idx in range(len(table)):
-            for col_idx in range(table.shape[1]):
-                cell = str(table.iloc[row_idx, col_idx]).strip().lower()
-                
-                summary_keywords = [
-                    'summary of checks', 'checks written', 'check images',
-                    'account number:', 'check number:', 'amount:',
-                    'gap in check sequence', 'checks listed are also displayed',
-                    'number date amount'
-                ]
-                
-                if any(keyword in cell for keyword in summary_keywords):
-                    return True
+        summary_pattern = "|".join(re.escape(k) for k in self.SUMMARY_KEYWORDS)
+        if cells.str.contains(summary_pattern, case=False, regex=True).any():
+            return True
         
         # Look for repeating "Number Date Amount" pattern
-        if len(table) > 0:
-            first_row = []
-            for col_idx in range(min(9, table.shape[1])):
-                cell = str(table.iloc[0, col_idx]).strip().lower()
-                first_row.append(cell)
-            
-            header_pattern_count = 0
-            for i in range(0, len(first_row) - 2, 3):
-                if (i + 2 < len(first_row) and 
-                    'number' in first_row[i] and 
-                    'date' in first_row[i + 1] and 
-                    'amount' in first_row[i + 2]):
-                    header_pattern_count += 1
-            
-            if header_pattern_count >= 2:
-                return True
+        first_row = [cell.strip().lower() for cell in grid[0, :9]]
         
-        # Count check numbers in first column
-        check_count_first_col = 0
-        total_first_col = 0
+        header_pattern_count = 0
+        for i in range(0, len(first_row) - 2, 3):
+            if (i + 2 < len(first_row) and 
+                'number' in first_row[i] and 
+                'date' in first_row[i + 1] and 
+                'amount' in first_row[i + 2]):
+                header_pattern_count += 1
         
-        for row_idx in range(1, min(10, len(table))):
-            if table.shape[1] > 0:
-                cell = str(table.iloc[row_idx, 0]).strip()
-                total_first_col += 1
-                
-                if re.match(r'^\d{4}$', cell):
-                    check_count_first_col += 1
+        if header_pattern_count >= 2:
+            return True
         
-        if total_first_col > 0 and (check_count_first_col / total_first_col) > 0.5:
+        # Count check numbers in first column
+        first_col = pd.Series(grid[1:10, 0], dtype=object)
+        check_count_first_col = int(first_col.str.match(self.CHECK_NUMBER_CELL).sum())
+        
+        if len(first_col) > 0 and (check_count_first_col / len(first_col)) > 0.5:
             return True
         
         # Look for check number + date pattern
-        check_date_pattern_count = 0
+        if table.shape[1] < 2:
+            return False
         
-        for row_idx in range(1, min(8, len(table))):
-            if table.shape[1] >= 2:
-                col1 = str(table.iloc[row_idx, 0]).strip()
-                col2 = str(table.iloc[row_idx, 1]).strip()
-                
-                if (re.match(r'^\d{4}$', col1) and re.match(r'^\d{1,2}/\d{1,2}$', col2)):
-                    check_date_pattern_count += 1
+        col1 = pd.Series(grid[1:8, 0], dtype=object)
+        col2 = pd.Series(grid[1:8, 1], dtype=object)
+        check_date_pattern_count = int((col1.str.match(self.CHECK_NUMBER_CELL) & col2.str.match(self.WF_DATE_CELL)).sum())
         
         return check_date_pattern_count >= 3
 
-    def _process_raw_rows(self, all_rows: List[List[str]]) -> List[List[str]]:
-        """Process raw rows through the Wells Fargo pipeline"""
-        print("Processing raw Wells Fargo data...")
-        print(f"Starting with {len(all_rows)} total rows")
-        
-        # Step 1: Remove ending balance column
-        processed_rows = self._remove_ending_balance_column(all_rows)
-        print(f"After removing balance column: {len(processed_rows)} rows")
-        
-        # Step 2: Add monthly summary (now using deduplicated data for accurate totals)
-        processed_rows = self._add_monthly_summary(processed_rows)
-        print(f"After adding monthly summary: {len(processed_rows)} rows")
-        
-        # Step 3: Filter deposits (keep only EDI)
-        processed_rows = self._filter_deposits_keep_edi(processed_rows)
-        print(f"After filtering deposits: {len(processed_rows)} rows")
-        
-        # Step 4: Sort by transaction type
-        processed_rows = self._sort_transactions_by_type(processed_rows)
-        print(f"After sorting by type: {len(processed_rows)} rows")
-        
-        # Step 5: Merge amount columns
-        processed_rows = self._merge_amount_columns(processed_rows)
-        print(f"After merging amount columns: {len(processed_rows)} rows")
-        
-        # Step 6: Remove description-only rows
-        processed_rows = self._remove_description_only_rows(processed_rows)
-        print(f"Final processed rows: {len(processed_rows)} rows")
-        
+    # Descriptions of EDI payments, the only deposits listed individually
+    EDI_KEYWORDS = ('edi', 'edi payment', 'edi pymnts', 'japan tobac', 'itg brands')
+    EDI_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in EDI_KEYWORDS))  # on lower-cased text
+    # Rows without a date or amount are kept if they look like part of a transaction
+    FRAGMENT_KEYWORDS = ('purchase authorized', 'shell oil', 'bankcard', 'mtot dep', 'ach debit')
+    FRAGMENT_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in FRAGMENT_KEYWORDS))  # on lower-cased text
+    # Order after the summary row: EDI payments, withdrawals, checks (each by date), then the rest as read
+    TYPE_ORDER = {"EDI": 0, "WITHDRAWAL": 1, "CHECK": 2}
+    OTHER_ORDER = 3
+    # Year of M/D dates when the statement period isn't found in the header
+    FALLBACK_YEAR = 2022
+
+    def _process_raw_rows(self, all_rows: List[List[str]], profiler: Optional[StageProfiler] = None,
+                          period: Optional[StatementPeriod] = None) -> List[List[str]]:
+        """
+        Turn the raw rows into Date, Check#, Description, Amount rows, in one pass over them:
+        1. drop the ending balance column
+        2. put a monthly deposits summary first
+        3. drop regular deposits (EDI payments stay)
+        4. order EDI payments, withdrawals and checks, each by date, then the rest
+        5. merge the deposit and withdrawal columns into one amount
+        6. drop description-only rows
+        Without a summary row, the first row takes its place and is kept as is.
+        M/D dates get their year from the statement period (FALLBACK_YEAR without one).
+        """
+        logger.debug("Processing raw Wells Fargo data...")
+        logger.debug("Starting with %d total rows", len(all_rows))
+        profiler = profiler or StageProfiler()
+        if not all_rows:
+            return all_rows
+
+        with profiler.stage("remove_balance_column", rows_in=len(all_rows)) as stage:
+            self._remove_ending_balance_column(all_rows)
+            stage.rows_out = len(all_rows)
+
+        with profiler.stage("post_process", rows_in=len(all_rows)) as stage:
+            # The summary's month is the first M/D date's; without one, the first row leads instead
+            first_date = next((row[0].strip() for row in all_rows
+                               if row and patterns.MONTH_DAY_CELL.match(row[0].strip())), None)
+            with_summary = first_date is not None and len(all_rows[0]) >= 4
+            deposits_cents = 0
+            deposits_removed = 0
+            edi_kept = 0
+            description_only = 0
+            keyed_rows = []  # (order, date key, merged row) of the rows kept
+
+            for row in all_rows if with_summary else all_rows[1:]:
+                width = len(row)
+                date_cell = row[0].strip() if width > 0 else ""
+                month_day = patterns.MONTH_DAY_CELL.match(date_cell)
+                date_key = (9999, 99, 99)
+                year = None
+                if month_day:
+                    month, day = (int(part) for part in date_cell.split('/'))
+                    year = self._year_for(month, period)
+                    date_key = (year, month, day)
+                    # Monthly deposits total from the dated rows' deposits column
+                    if width >= 5 and row[3].strip():
+                        try:
+                            deposits_cents += to_cents(row[3].strip())
+                        except ValueError:
+                            pass
+
+                deposit = row[3].strip() if width >= 4 else ""
+                withdrawal = row[4].strip() if width >= 5 else ""
+                is_edi = width >= 3 and self.EDI_PATTERN.search(row[2].lower()) is not None
+
+                # Regular deposits only count in the summary
+                if width >= 5 and deposit and not withdrawal:
+                    if not is_edi:
+                        deposits_removed += 1
+                        continue
+                    edi_kept += 1
+
+                merged = self._merged_row(row, year)
+
+                # Description-only rows (no date, no amount, not a transaction fragment)
+                has_date = bool(month_day) or bool(patterns.FULL_DATE_CELL.match(date_cell))
+                if not has_date and not self._has_amount(merged):
+                    if not self.FRAGMENT_PATTERN.search(" ".join(merged).lower()):
+                        description_only += 1
+                        logger.debug("    Removed description-only: %s", merged[:3])
+                        continue
+                    logger.debug("    Found potential transaction fragment: %s", merged[:3])
+
+                # Transaction type, for the order
+                if width < 3:
+                    order = self.OTHER_ORDER
+                elif patterns.CHECK_NUMBER_CELL.match(row[1].strip()):
+                    order = self.TYPE_ORDER["CHECK"]
+                elif is_edi:
+                    order = self.TYPE_ORDER["EDI"]
+                elif withdrawal:
+                    order = self.TYPE_ORDER["WITHDRAWAL"]
+                elif deposit:
+                    order = self.TYPE_ORDER["EDI"]
+                else:
+                    order = self.OTHER_ORDER
+                if order == self.OTHER_ORDER:
+                    date_key = (0, 0, 0)  # the rest keeps its order
+                keyed_rows.append((order, date_key, merged))
+
+            if with_summary:
+                month = int(first_date.split('/')[0])
+                year = self._year_for(month, period)
+                last_date = f"{month:02d}/{calendar.monthrange(year, month)[1]:02d}/{year}"
+                deposits_total = deposits_cents / 100
+                logger.info("📊 Summary created with deduplicated data: %s | Deposits: $%.2f", last_date, deposits_total)
+                head = [last_date, "", "Deposits", f"{deposits_total:.2f}"]
+            else:
+                # The first row leads as it is, exempt from the filters and the ordering
+                head = self._merged_row(all_rows[0], self._month_day_year(all_rows[0], period))
+            logger.info("Removed %d regular deposits, kept %d EDI payments", deposits_removed, edi_kept)
+            logger.debug("Removed %d description-only rows", description_only)
+
+            keyed_rows.sort(key=lambda keyed: keyed[:2])
+            processed_rows = [head] + [merged for _, _, merged in keyed_rows]
+            stage.rows_out = len(processed_rows)
+
+        logger.debug("Final processed rows: %d rows", len(processed_rows))
         return processed_rows
 
     def _remove_ending_balance_column(self, all_rows: List[List[str]]) -> List[List[str]]:
@@ -937,338 +1031,108 @@ class WellsFargoParser(BaseParser):
                 if cell and cell != "EMPTY":
                     non_empty_count += 1
                     
-                    if re.match(r'^\d{1,3}(,\d{3})*\.\d{2}$', cell):
+                    if patterns.AMOUNT_CELL.match(cell):
                         balance_count += 1
         
         # Remove if >60% look like balances
         balance_ratio = balance_count / non_empty_count if non_empty_count > 0 else 0
         
         if balance_ratio > 0.6:
-            print(f"Removing balance column: {balance_count}/{non_empty_count} cells are amounts")
+            logger.debug("Removing balance column: %d/%d cells are amounts", balance_count, non_empty_count)
             for row in all_rows:
                 if len(row) > last_col_idx:
                     row.pop()
         
         return all_rows
 
-    def _add_monthly_summary(self, all_rows: List[List[str]]) -> List[List[str]]:
-        """Add monthly summary row at the top with deposits total"""
-        if not all_rows:
-            return all_rows
-        
-        print("Creating monthly summary...")
-        
-        # Calculate totals from all transactions (now using deduplicated data)
-        deposits_total = 0.0
-        month_year = None
-        
-        for row in all_rows:
-            # Look for date in first column (format: M/D)
-            if len(row) > 0 and re.match(r'^\d{1,2}/\d{1,2}$', row[0].strip()):
-                if not month_year:
-                    # Use first date to determine month/year
-                    month, day = row[0].strip().split('/')
-                    month_year = f"{month.zfill(2)}/2022"
-                
-                # Calculate totals from deposits/credits column
-                if len(row) >= 5:
-                    # Deposits (Column 4)
-                    if row[3] and row[3].strip():
-                        try:
-                            amount = float(row[3].strip().replace(',', ''))
-                            deposits_total += amount
-                        except ValueError:
-                            pass
+    def _deposit_kind(self, row: List[str]) -> Tuple[bool, bool]:
+        """(is_deposit, is_edi) for a raw row: a deposit amount without a withdrawal amount, EDI by description"""
+        is_deposit = False
+        is_edi = False
         
-        if month_year:
-            # Get last day of the month
-            month_num = int(month_year.split('/')[0])
-            year_num = int(month_year.split('/')[1])
-            
-            # Calculate last day of month
-            if month_num in [1, 3, 5, 7, 8, 10, 12]:
-                last_day = 31
-            elif month_num in [4, 6, 9, 11]:
-                last_day = 30
-            elif month_num == 2:
-                if year_num % 4 == 0 and (year_num % 100 != 0 or year_num % 400 == 0):
-                    last_day = 29
-                else:
-                    last_day = 28
-            
-            last_date = f"{month_num:02d}/{last_day:02d}/{year_num}"
+        if len(row) >= 5:
+            # Has deposit amount but no withdrawal amount
+            has_deposit = row[3] and row[3].strip() and row[3].strip() != ""
+            has_withdrawal = row[4] and row[4].strip() and row[4].strip() != ""
             
-            # Create summary row
-            if len(all_rows[0]) >= 4:
-                summary_row = [
-                    last_date,
-                    "",
-                    "Deposits",
-                    f"{deposits_total:.2f}"
-                ]
-                
-                # Pad to match row length
-                while len(summary_row) < len(all_rows[0]):
-                    summary_row.append("")
+            if has_deposit and not has_withdrawal:
+                is_deposit = True
                 
-                print(f"📊 Summary created with deduplicated data: {last_date} | Deposits: ${deposits_total:.2f}")
+                # Check if it's an EDI payment
+                description = ""
+                if len(row) >= 3:
+                    description = row[2].lower()
                 
-                # Insert at the beginning
-                all_rows.insert(0, summary_row)
+                if any(edi_keyword in description for edi_keyword in self.EDI_KEYWORDS):
+                    is_edi = True
         
-        return all_rows
+        return is_deposit, is_edi
 
-    def _filter_deposits_keep_edi(self, all_rows: List[List[str]]) -> List[List[str]]:
-        """Remove regular deposit entries but keep EDI payments"""
-        if not all_rows:
-            return all_rows
-        
-        print("Filtering deposits - keeping only EDI payments...")
-        
-        filtered_rows = []
-        deposits_removed = 0
-        edi_kept = 0
-        
-        for i, row in enumerate(all_rows):
-            # Keep the first row (summary row)
-            if i == 0:
-                filtered_rows.append(row)
-                continue
-            
-            # Check if this is a deposit entry
-            is_deposit = False
-            is_edi = False
-            
-            if len(row) >= 5:
-                # Has deposit amount but no withdrawal amount
-                has_deposit = row[3] and row[3].strip() and row[3].strip() != ""
-                has_withdrawal = row[4] and row[4].strip() and row[4].strip() != ""
-                
-                if has_deposit and not has_withdrawal:
-                    is_deposit = True
-                    
-                    # Check if it's an EDI payment
-                    description = ""
-                    if len(row) >= 3:
-                        description = row[2].lower()
-                    
-                    if any(edi_keyword in description for edi_keyword in [
-                        'edi', 'edi payment', 'edi pymnts', 'japan tobac', 'itg brands'
-                    ]):
-                        is_edi = True
-            
-            # Keep non-deposits, or EDI payments
-            if not is_deposit or is_edi:
-                filtered_rows.append(row)
-                if is_edi:
-                    edi_kept += 1
-            else:
-                deposits_removed += 1
-        
-        print(f"Removed {deposits_removed} regular deposits, kept {edi_kept} EDI payments")
-        return filtered_rows
+    def _is_regular_deposit(self, row: List[str]) -> bool:
+        """Deposit that is only counted in the monthly summary (not an EDI payment)"""
+        is_deposit, is_edi = self._deposit_kind(row)
+        return is_deposit and not is_edi
 
-    def _sort_transactions_by_type(self, all_rows: List[List[str]]) -> List[List[str]]:
-        """Sort transactions: Summary → EDI Payments → Withdrawals → Checks"""
+    def _merge_amount_columns(self, all_rows: List[List[str]],
+                              period: Optional[StatementPeriod] = None) -> List[List[str]]:
+        """Merge deposit and withdrawal columns into one amount column"""
         if not all_rows:
             return all_rows
-        
-        print("Sorting transactions by type...")
-        
-        # Separate transactions by type
-        summary_rows = []
-        edi_payments = []
-        withdrawals = []
-        checks = []
-        other_rows = []
-        
-        for i, row in enumerate(all_rows):
-            # First row is always summary
-            if i == 0:
-                summary_rows.append(row)
-                continue
-            
-            # Classify each transaction
-            transaction_type = self._classify_transaction(row)
-            
-            if transaction_type == "EDI":
-                edi_payments.append(row)
-            elif transaction_type == "CHECK":
-                checks.append(row)
-            elif transaction_type == "WITHDRAWAL":
-                withdrawals.append(row)
-            else:
-                other_rows.append(row)
-        
-        # Sort each category by date
-        edi_payments = self._sort_by_date(edi_payments)
-        withdrawals = self._sort_by_date(withdrawals)
-        checks = self._sort_by_date(checks)
-        
-        # Combine in desired order
-        sorted_rows = summary_rows + edi_payments + withdrawals + checks + other_rows
-        
-        print(f"Sorted: {len(summary_rows)} summary, {len(edi_payments)} EDI, {len(withdrawals)} withdrawals, {len(checks)} checks")
-        
-        return sorted_rows
 
-    def _classify_transaction(self, row: List[str]) -> str:
-        """Classify a transaction as EDI, CHECK, WITHDRAWAL, or OTHER"""
-        if len(row) < 3:
-            return "OTHER"
-        
-        # Check if it has a check number (column 2)
-        check_number = row[1].strip() if len(row) > 1 else ""
-        if check_number and re.match(r'^\d{4}$', check_number):
-            return "CHECK"
-        
-        # Check description for EDI keywords
-        description = row[2].lower() if len(row) > 2 else ""
-        edi_keywords = ['edi', 'edi payment', 'edi pymnts', 'japan tobac', 'itg brands']
-        if any(keyword in description for keyword in edi_keywords):
-            return "EDI"
-        
-        # Check if it's a withdrawal
-        if len(row) >= 5:
-            withdrawal_amount = row[4].strip() if row[4] else ""
-            if withdrawal_amount and withdrawal_amount != "":
-                return "WITHDRAWAL"
-        
-        # Check if it's a deposit
-        if len(row) >= 4:
-            deposit_amount = row[3].strip() if row[3] else ""
-            if deposit_amount and deposit_amount != "":
-                return "EDI"
-        
-        return "OTHER"
+        logger.debug("Merging deposit and withdrawal columns into one amount column...")
+        return [self._merged_row(row, self._month_day_year(row, period)) for row in all_rows]
 
-    def _sort_by_date(self, rows: List[List[str]]) -> List[List[str]]:
-        """Sort rows by date (if date is available in first column)"""
-        def get_date_key(row):
-            if len(row) > 0 and re.match(r'^\d{1,2}/\d{1,2}$', row[0].strip()):
-                try:
-                    month, day = row[0].strip().split('/')
-                    return (int(month), int(day))
-                except:
-                    pass
-            return (99, 99)
-        
-        return sorted(rows, key=get_date_key)
+    def _year_for(self, month: int, period: Optional[StatementPeriod]) -> int:
+        """Year of a M/D date in the statement period (December before a January end is the year before)"""
+        return period.year_for(month) if period is not None else self.FALLBACK_YEAR
 
-    def _merge_amount_columns(self, all_rows: List[List[str]]) -> List[List[str]]:
-        """Merge deposit and withdrawal columns into one amount column"""
-        if not all_rows:
-            return all_rows
-        
-        print("Merging deposit and withdrawal columns into one amount column...")
-        
-        merged_rows = []
-        year = "2022"
-        
-        for row in all_rows:
-            if len(row) >= 5:
-                # Get deposit and withdrawal amounts
-                deposit_str = row[3].strip() if row[3] else ""
-                withdrawal_str = row[4].strip() if row[4] else ""
-                
-                # Calculate final amount
-                final_amount = ""
-                
-                if deposit_str and deposit_str != "":
-                    try:
-                        deposit_amount = float(deposit_str.replace(',', ''))
-                        final_amount = f"{deposit_amount:.2f}"
-                    except ValueError:
-                        pass
-                
-                if withdrawal_str and withdrawal_str != "":
-                    try:
-                        withdrawal_amount = float(withdrawal_str.replace(',', '').replace('-', ''))
-                        final_amount = f"-{withdrawal_amount:.2f}"
-                    except ValueError:
-                        pass
-                
-                # Fix date format to include year
-                date_str = row[0]
-                if re.match(r'^\d{1,2}/\d{1,2}$', date_str.strip()):
-                    date_str = f"{date_str.strip()}/{year}"
-                
-                # Create new row: Date, Check#, Description, Amount
-                new_row = [
-                    date_str,
-                    row[1],
-                    row[2],
-                    final_amount
-                ]
-                
-                merged_rows.append(new_row)
-            
-            elif len(row) >= 4:
-                # Handle rows with fewer columns
-                date_str = row[0]
-                if re.match(r'^\d{1,2}/\d{1,2}$', date_str.strip()):
-                    date_str = f"{date_str.strip()}/{year}"
-                
-                new_row = [date_str, row[1], row[2], row[3]]
-                merged_rows.append(new_row)
-            else:
-                # Keep shorter rows as-is
-                merged_rows.append(row)
-        
-        return merged_rows
+    def _month_day_year(self, row: List[str], period: Optional[StatementPeriod]) -> Optional[int]:
+        """Year to append to a raw row's date, None unless it is a M/D date"""
+        date_cell = row[0].strip() if row else ""
+        if not patterns.MONTH_DAY_CELL.match(date_cell):
+            return None
+        return self._year_for(int(date_cell.split('/')[0]), period)
 
-    def _remove_description_only_rows(self, all_rows: List[List[str]]) -> List[List[str]]:
-        """Remove rows that only have descriptions but no dates or amounts"""
-        if not all_rows:
-            return all_rows
-        
-        print("Removing description-only rows...")
-        
-        cleaned_rows = []
-        removed_count = 0
-        
-        for i, row in enumerate(all_rows):
-            # Always keep the first row (summary)
-            if i == 0:
-                cleaned_rows.append(row)
-                continue
-            
-            # Check if row has date and/or amount
-            has_date = False
-            has_amount = False
-            
-            if len(row) >= 1:
-                date_cell = row[0].strip()
-                if date_cell and (re.match(r'^\d{1,2}/\d{1,2}/\d{4}$', date_cell) or re.match(r'^\d{1,2}/\d{1,2}$', date_cell)):
-                    has_date = True
-            
-            if len(row) >= 4:
-                amount_cell = row[3].strip()
-                if amount_cell and amount_cell != "":
-                    try:
-                        float(amount_cell.replace(',', '').replace('-', ''))
-                        has_amount = True
-                    except ValueError:
-                        pass
-            
-            # Special case: if row contains transaction keywords but no date/amount, check if it's a partial transaction
-            if not has_date and not has_amount:
-                row_text = " ".join(row).lower()
-                transaction_keywords = ['purchase authorized', 'shell oil', 'bankcard', 'mtot dep', 'ach debit']
-                if any(keyword in row_text for keyword in transaction_keywords):
-                    print(f"    Found potential transaction fragment: {row[:3]}")
-                    cleaned_rows.append(row)
-                    continue
-            
-            # Keep rows that have either date or amount (or both)
-            if has_date or has_amount:
-                cleaned_rows.append(row)
-            else:
-                removed_count += 1
-                print(f"    Removed description-only: {row[:3]}")
-        
-        print(f"Removed {removed_count} description-only rows")
-        return cleaned_rows
+    @staticmethod
+    def _merged_row(row: List[str], year: Optional[int]) -> List[str]:
+        """
+        Date, Check#, Description, Amount of one raw row (rows shorter than 4 cells stay as they are).
+        The amount is the deposit, or minus the withdrawal; a M/D date gets the year appended (year is None otherwise).
+        """
+        if len(row) < 4:
+            return row
+        date_str = f"{row[0].strip()}/{year}" if year is not None else row[0]
+        if len(row) == 4:
+            return [date_str, row[1], row[2], row[3]]
+
+        deposit_str = row[3].strip() if row[3] else ""
+        withdrawal_str = row[4].strip() if row[4] else ""
+        final_amount = ""
+        if deposit_str:
+            try:
+                final_amount = f"{float(deposit_str.replace(',', '')):.2f}"
+            except ValueError:
+                pass
+        if withdrawal_str:
+            try:
+                final_amount = f"-{float(withdrawal_str.replace(',', '').replace('-', '')):.2f}"
+            except ValueError:
+                pass
+        return [date_str, row[1], row[2], final_amount]
+
+    @staticmethod
+    def _has_amount(row: List[str]) -> bool:
+        """Whether a merged row's amount cell holds a number"""
+        if len(row) < 4:
+            return False
+        amount_cell = row[3].strip()
+        if not amount_cell:
+            return False
+        try:
+            float(amount_cell.replace(',', '').replace('-', ''))
+            return True
+        except ValueError:
+            return False
 
     def _convert_to_transactions(self, processed_rows: List[List[str]]) -> List[Transaction]:
         """Convert processed rows to Transaction objects"""
@@ -1294,7 +1158,7 @@ class WellsFargoParser(BaseParser):
             # Determine transaction type
             if description == "Deposits":
                 transaction_type = "deposit_summary"
-            elif check_number and re.match(r'^\d{4}$', check_number):
+            elif check_number and patterns.CHECK_NUMBER_CELL.match(check_number):
                 transaction_type = "check"
             elif any(keyword in description.lower() for keyword in ['edi', 'japan tobac', 'itg brands']):
                 transaction_type = "edi_payment"
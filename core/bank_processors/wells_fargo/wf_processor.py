@@ -1,19 +1,98 @@
+import itertools
+import logging
+from collections import defaultdict
+import numpy as np
 import pandas as pd
-import tabula
-import pdfplumber
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
-import re
+import sys
 from ...interfaces.transaction import Transaction
+from ...interfaces.transaction_table import TransactionTable
+from ...page_pool import map_in_order, page_workers
+from ...pdf_session import PdfSession
+from ...profiling import StageProfiler
+from ...progress import ExtractionCancelled, ProgressReporter
+from ...tabula_backend import get_tabula_backend
+from ...extraction_cache import ExtractionCache, code_version, get_extraction_cache
+from ...interfaces import patterns
+from ... import pdf_session, tabula_backend
+from . import wf_parser
 from .wf_parser import WellsFargoParser
 
+logger = logging.getLogger(__name__)
+
+class RowTextIndex:
+    """
+    Whitespace-normalized text of every table row, for the footer safeguard's
+    "did tabula already read this row" check. Full row texts go into a set;
+    rows are also listed as token tuples under their first token (the date), so
+    a footer line covering only part of a row is found without scanning every
+    table. A partial line must match whole tokens: "9/8 Check 25.00" is not
+    in "9/8 Check 25.005", nor is "9/8 Shell" in "9/8 Shellfish".
+    """
+
+    def __init__(self):
+        self.rows = set()
+        self.by_token = defaultdict(list)
+        self.table_count = 0  # tables[:table_count] are indexed
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.split())
+
+    def add_row(self, cells: Iterable):
+        text = self.normalize(" ".join(str(cell) for cell in cells if not pd.isna(cell)))
+        if text and text not in self.rows:
+            self.rows.add(text)
+            tokens = tuple(text.split(" "))
+            self.by_token[tokens[0]].append(tokens)
+
+    def add_tables(self, tables: List[pd.DataFrame]):
+        """Index the tables added since the last call (the table list only grows at the end)"""
+        for table in tables[self.table_count:]:
+            for row in table.itertuples(index=False, name=None):
+                self.add_row(row)
+        self.table_count = len(tables)
+
+    def contains(self, row_text: str) -> bool:
+        """Whether row_text is a row, or a run of whole tokens of a row starting with the same token"""
+        text = self.normalize(row_text)
+        if text in self.rows:
+            return True
+        if not text:
+            return False
+        tokens = tuple(text.split(" "))
+        size = len(tokens)
+        return any(row[i:i + size] == tokens
+                   for row in self.by_token.get(tokens[0], ())
+                   for i in range(len(row) - size + 1))
+
+
 class WellsFargoProcessor:
     """Wells Fargo specific PDF processor - exact implementation from test file"""
     
-    def __init__(self):
+    # tabula options used for Wells Fargo statements (single file and batch)
+    TABULA_OPTIONS = {
+        "pages": "all",
+        "multiple_tables": True,
+        "pandas_options": {"header": None}
+    }
+
+    # Height of the page footer band the pdfplumber safeguard scans for rows tabula missed
+    FOOTER_BAND_HEIGHT = 120
+
+    def __init__(self, session: Optional[PdfSession] = None, cache: Optional[ExtractionCache] = None):
         # Wells Fargo-specific parser
         self.parser = WellsFargoParser()
         self.bank_name = "wells_fargo"
+        # Shared PDF session handed over by the factory after detection
+        self.session = session
+        # Persistent in-process tabula-java JVM shared by all processors
+        self.tabula_backend = get_tabula_backend()
+        # Raw-table cache keyed by PDF hash + the code that produces this bank's tables
+        # (wf_parser included: its table classifier picks the pages that get safeguard rows)
+        self.cache = cache if cache is not None else get_extraction_cache()
+        self.cache_version = code_version(sys.modules[__name__], wf_parser, patterns, pdf_session, tabula_backend)
 
     # def extract_transactions(self, pdf_path: str) -> Tuple[str, List[Transaction]]:
     #     """
@@ -119,97 +198,282 @@ class WellsFargoProcessor:
     #     return tables
 
 
-    def _extract_tables_exact_test_method(self, pdf_path: str) -> List[pd.DataFrame]:
-        print("📄 Extracting Wells Fargo tables using test file method...")
+    def _extract_tables_exact_test_method(self, pdf_path: str, session: Optional[PdfSession] = None,
+                                          tabula_tables: Optional[List[pd.DataFrame]] = None,
+                                          progress: Optional[ProgressReporter] = None) -> List[pd.DataFrame]:
+        return list(self.iter_tables(pdf_path, session, tabula_tables, progress))
+
+    def iter_tables(self, pdf_path: str, session: Optional[PdfSession] = None,
+                    tabula_tables: Optional[List[pd.DataFrame]] = None,
+                    progress: Optional[ProgressReporter] = None,
+                    profiler: Optional[StageProfiler] = None,
+                    failed_pages: Optional[List[int]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the statement's cleaned tables page by page.
+        failed_pages receives the pages whose tabula read or safeguard failed (their tables may be incomplete).
+        tabula reads pages ahead on a worker pool; the footer safeguard runs on each
+        page, in page order, as soon as that page's tables arrive. A missed row is appended to table number page_num - 1, as the
+        all-pages method always did. That table can only receive rows from its own
+        page's safeguard, so it is yielded as soon as that page has been checked.
+        """
+        logger.debug("📄 Extracting Wells Fargo tables using test file method...")
+
+        session = PdfSession.reuse(session, pdf_path)
+        progress = progress or ProgressReporter()
+        profiler = profiler or StageProfiler()
+        failed_pages = failed_pages if failed_pages is not None else []
+        page_count = session.page_count
+        options = {key: value for key, value in self.TABULA_OPTIONS.items() if key != "pages"}
+
+        tables = []  # every table read so far, in statement order
+
+        if tabula_tables is not None:
+            # Tables already extracted by a tabula batch run
+            tables.extend(tabula_tables)
+            logger.info("Using %d tables from Tabula batch", len(tables))
+            reads = None
+        else:
+            # Pages are read ahead on a thread pool (tabula-java runs outside the GIL);
+            # the safeguard below still consumes them one page at a time, in order
+            workers = page_workers(page_count)
+            if workers > 1:
+                # Start the JVM on this thread: JPype can't shut down a JVM a pool thread started
+                self.tabula_backend.warm_up()
+            reads = map_in_order(lambda page: self._read_tabula_page(pdf_path, page, options),
+                                 range(1, page_count + 1), workers)
+
+        try:
+            yield from self._merge_pages(session, page_count, tables, reads, progress, profiler, failed_pages)
+        finally:
+            if reads is not None:
+                reads.close()
 
-        tables = []
+    def _read_tabula_page(self, pdf_path: str, page_num: int, options: Dict) -> Tuple[List[pd.DataFrame], Optional[Exception]]:
+        """(tables, error) of one page, so a failing page doesn't abort the pool"""
         try:
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages="all",
-                multiple_tables=True,
-                pandas_options={"header": None}
-            )
-            print(f"Found {len(tables)} tables with Tabula")
+            return self.tabula_backend.read_pdf(pdf_path, pages=page_num, **options), None
         except Exception as e:
-            print(f"❌ Error extracting tables: {e}")
+            return [], e
+
+    def _merge_pages(self, session: PdfSession, page_count: int, tables: List[pd.DataFrame],
+                     reads: Optional[Iterator], progress: ProgressReporter,
+                     profiler: StageProfiler, failed_pages: List[int]) -> Iterator[pd.DataFrame]:
+        """Apply the footer safeguard page by page and yield each table once it's final"""
+        pending = defaultdict(list)  # table index -> missed rows waiting for that table to be read
+        released = 0                 # tables[:released] have been yielded
+        seen = set()                 # row signatures across all yielded tables
+        row_index = RowTextIndex()   # text of every row read so far, for the safeguard
+
+        for page_num in range(1, page_count + 1):
+            progress.report("tables", f"Reading page {page_num} of {page_count}", page_num, page_count)
+
+            truncated = True  # batch tables aren't split by page, so every page gets checked
+            if reads is not None:
+                with profiler.stage("tabula") as stage:
+                    _, (page_tables, error) = next(reads)
+                    stage.rows_out = len(page_tables)
+                if error is None:
+                    tables.extend(page_tables)
+                    logger.debug("Page %d: found %d tables with Tabula", page_num, len(page_tables))
+                else:
+                    logger.warning("❌ Error extracting tables on page %d: %s", page_num, error)
+                    failed_pages.append(page_num)
+                truncated = self._looks_truncated(page_tables, error)
+
+            # --- SAFEGUARD: scan bottom of this page ---
+            try:
+                with profiler.stage("safeguard", rows_in=int(truncated)) as stage:
+                    missed_rows = []
+                    if truncated:
+                        row_index.add_tables(tables)
+                        missed_rows = self._missed_footer_rows(session, page_num, row_index)
+                    stage.rows_out = len(missed_rows)
+                    for words in missed_rows:
+                        row_index.add_row(words)
+                        if page_num <= len(tables):
+                            tables[page_num - 1].loc[len(tables[page_num - 1])] = words
+                        else:
+                            pending[page_num - 1].append(words)
+            except ExtractionCancelled:
+                raise
+            except Exception as e:
+                logger.warning("⚠️ pdfplumber safeguard failed on page %d: %s", page_num, e)
+                if not failed_pages or failed_pages[-1] != page_num:
+                    failed_pages.append(page_num)
+
+            # tables[:page_num] can't receive any more missed rows
+            while released < min(page_num, len(tables)):
+                table = tables[released]
+                with profiler.stage("drop_seen_rows", rows_in=len(table)) as stage:
+                    for words in pending.pop(released, []):
+                        self._append_missed_row(table, words)
+                    table = self._drop_seen_rows(table, seen)
+                    stage.rows_out = len(table)
+                yield table
+                released += 1
+
+        # Remaining tables, then missed rows whose target table was never read (new tables, as before)
+        for idx in sorted(pending):
+            for words in pending[idx]:
+                if idx < len(tables):
+                    self._append_missed_row(tables[idx], words)
+                else:
+                    tables.append(pd.DataFrame([words]))
+        for table in tables[released:]:
+            with profiler.stage("drop_seen_rows", rows_in=len(table)) as stage:
+                table = self._drop_seen_rows(table, seen)
+                stage.rows_out = len(table)
+            yield table
+
+    def _looks_truncated(self, page_tables: List[pd.DataFrame], error: Optional[Exception]) -> bool:
+        """
+        Whether tabula may have cut off the bottom of a page.
+        That happens when the transaction table runs on to the page footer, so
+        it is the last table on the page. The parser's own classification decides
+        (tabula may split or merge columns, so the width can't). Pages that end
+        with another table (check summary, worksheet) or have no table are skipped.
+        """
+        if error is not None:
+            return True
+        return bool(page_tables) and self.parser.is_transaction_table(page_tables[-1])
+
+    def _missed_footer_rows(self, session: PdfSession, page_num: int, row_index: RowTextIndex) -> List[List[str]]:
+        """Dated rows in the bottom 120px of a page that tabula's tables don't contain, split into 6 WF columns"""
+        chars = list(session.footer_chars(page_num - 1, self.FOOTER_BAND_HEIGHT))
+        if not chars:
             return []
 
-        # --- SAFEGUARD: scan bottom of every page ---
+        missed = []
+        chars.sort(key=lambda c: (round(c["top"]), c["x0"]))
+        for y, group in itertools.groupby(chars, key=lambda c: round(c["top"])):
+            row_chars = list(group)
+            row_text = "".join(c["text"] for c in row_chars).strip()
+
+            if patterns.LEADING_MONTH_DAY.match(row_text):
+                if row_index.contains(row_text):
+                    continue  # ✅ skip duplicates here
+
+                logger.info("⚠️ Adding missed row on page %d: %s", page_num, row_text)
+
+                # Split into words based on spacing
+                words = []
+                current = row_chars[0]["text"]
+                last_x1 = row_chars[0]["x1"]
+                for ch in row_chars[1:]:
+                    if ch["x0"] - last_x1 > 3:  # gap = new word
+                        words.append(current.strip())
+                        current = ch["text"]
+                    else:
+                        current += ch["text"]
+                    last_x1 = ch["x1"]
+                words.append(current.strip())
+
+                # Pad/truncate to 6 columns (WF structure)
+                while len(words) < 6:
+                    words.append("")
+                missed.append(words[:6])
+        return missed
+
+    def _append_missed_row(self, table: pd.DataFrame, words: List[str]):
         try:
-            import pdfplumber, itertools, re
-
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    chars = [c for c in page.chars if c["top"] > page.height - 120]  # bottom 120px
-                    if not chars:
-                        continue
-
-                    chars.sort(key=lambda c: (round(c["top"]), c["x0"]))
-                    for y, group in itertools.groupby(chars, key=lambda c: round(c["top"])):
-                        row_chars = list(group)
-                        row_text = "".join(c["text"] for c in row_chars).strip()
-
-                        if re.match(r"^\d{1,2}/\d{1,2}", row_text):
-                            already_exists = any(row_text in str(df.values) for df in tables)
-                            if already_exists:
-                                continue  # ✅ skip duplicates here
-
-                            print(f"⚠️ Adding missed row on page {page_num}: {row_text}")
-
-                            # Split into words based on spacing
-                            words = []
-                            current = row_chars[0]["text"]
-                            last_x1 = row_chars[0]["x1"]
-                            for ch in row_chars[1:]:
-                                if ch["x0"] - last_x1 > 3:  # gap = new word
-                                    words.append(current.strip())
-                                    current = ch["text"]
-                                else:
-                                    current += ch["text"]
-                                last_x1 = ch["x1"]
-                            words.append(current.strip())
-
-                            # Pad/truncate to 6 columns (WF structure)
-                            while len(words) < 6:
-                                words.append("")
-                            words = words[:6]
-
-                            # Append to the table for this page
-                            if page_num <= len(tables):
-                                tables[page_num - 1].loc[len(tables[page_num - 1])] = words
-                            else:
-                                tables.append(pd.DataFrame([words]))
+            table.loc[len(table)] = words
         except Exception as e:
-            print(f"⚠️ pdfplumber safeguard failed: {e}")
-
-        # ✅ Deduplicate across all tables
-        cleaned_tables = []
-        seen = set()
-        for df in tables:
-            new_rows = []
-            for row in df.itertuples(index=False, name=None):
-                signature = tuple(str(x).strip() for x in row)
-                if signature not in seen:
-                    seen.add(signature)
-                    new_rows.append(row)
-            cleaned_tables.append(pd.DataFrame(new_rows))
-
-        return cleaned_tables
+            logger.warning("⚠️ pdfplumber safeguard failed: %s", e)
 
+    def _drop_seen_rows(self, table: pd.DataFrame, seen: set) -> pd.DataFrame:
+        """
+        ✅ Deduplicate across all tables: keep rows whose stripped cells weren't seen in an earlier table.
+        This is the only row dedup (the parser relies on it); the table is returned as is unless rows go.
+        """
+        keep = self._unseen_rows_mask(table, seen)
+        if keep.all():
+            return table
+        return table[keep].reset_index(drop=True)
 
-    def extract_transactions(self, pdf_path: str) -> Tuple[str, List[Transaction]]:
+    @staticmethod
+    def _unseen_rows_mask(table: pd.DataFrame, seen: set) -> np.ndarray:
+        """
+        Keep-mask of the rows whose signature isn't in seen yet; adds the kept ones.
+        The signature is str(cell).strip() per cell with NaN/None as "" and trailing
+        empty cells dropped, so a safeguard row ("" cells) matches the same row read
+        by tabula (NaN cells), and rows match across tables of different widths.
+        """
+        width = table.shape[1]
+        values = table.to_numpy(dtype=object)
+        missing = pd.isna(values).ravel().tolist()
+        cells = ["" if na else str(x).strip() for x, na in zip(values.ravel().tolist(), missing)]
+        keep = np.ones(len(table), dtype=bool)
+        for i in range(len(table)):
+            end = (i + 1) * width
+            while end > i * width and not cells[end - 1]:
+                end -= 1
+            signature = tuple(cells[i * width:end])
+            if signature in seen:
+                keep[i] = False
+            else:
+                seen.add(signature)
+        return keep
+
+
+    def extract_transactions(self, pdf_path: str, tabula_tables: Optional[List[pd.DataFrame]] = None,
+                             progress: Optional[ProgressReporter] = None,
+                             on_transactions: Optional[Callable[[List[Transaction]], None]] = None,
+                             profiler: Optional[StageProfiler] = None,
+                             cache_key: Optional[str] = None) -> Tuple[str, TransactionTable]:
         """
         Wells Fargo specific transaction extraction using exact test file logic
+        tabula_tables: tables from a tabula batch run (skips the per-file tabula call)
+        progress: receives stage events; raises ExtractionCancelled once cancelled
+        on_transactions: receives provisional transactions as each page's tables are parsed
+        profiler: filled with per-stage timings and row counts (see core.profiling)
+        cache_key: this PDF's cache key if already computed (hashing the PDF again is skipped)
         Returns: (bank_name, list_of_transactions)
         """
-        print(f"Processing Wells Fargo PDF: {pdf_path}")
+        logger.info("Processing Wells Fargo PDF: %s", pdf_path)
+        progress = progress or ProgressReporter()
+        profiler = profiler or StageProfiler()
         
-        # Wells Fargo-specific table extraction using exact test file method
-        tables = self._extract_tables_exact_test_method(pdf_path)
+        # Reuse the session opened during detection (or open one now)
+        session = PdfSession.reuse(self.session, pdf_path)
+        try:
+            progress.report("tables", "Extracting tables...")
+            # Cached raw tables for this exact PDF skip PDF parsing entirely
+            with profiler.stage("cache_read"):
+                if cache_key is None:
+                    cache_key = self.cache.key(pdf_path, self.cache_version)
+                tables = self.cache.get(cache_key)
+            collected = None
+            failed_pages = []  # a table set missing a page's rows must not be cached
+            if tables is not None:
+                logger.info("Using %d cached tables", len(tables))
+            else:
+                # Wells Fargo-specific table extraction, streamed page by page into the parser
+                tables = self.iter_tables(pdf_path, session, tabula_tables, progress, profiler, failed_pages)
+                if cache_key is not None:
+                    collected = []  # only kept when the tables are going into the cache
+                    tables = self._collecting(tables, collected)
+            
+            # Statement period from the header text detection already read; dates the M/D rows
+            with profiler.stage("statement_period"):
+                period = session.statement_period()
+            if period is None:
+                logger.warning("⚠️ Statement period not found, dating rows in %d", self.parser.FALLBACK_YEAR)
+
+            # Process using Wells Fargo parser with test file logic
+            parsed = self.parser.process_tables(profiler.iterate("tables", tables), on_transactions, profiler, period)
+            if failed_pages:
+                logger.warning("⚠️ Not caching tables: page(s) %s failed to read", ", ".join(map(str, failed_pages)))
+            elif collected:
+                with profiler.stage("cache_write", rows_in=len(collected)):
+                    self.cache.put(cache_key, collected)
+        finally:
+            session.close()
         
-        # Process using Wells Fargo parser with test file logic
-        transactions = self.parser.process_tables(tables)
+        progress.report("parse", f"Parsed {len(parsed)} transactions")
+        progress.report("summarize", f"Building {len(parsed)} transactions...")
+        with profiler.stage("build_table", rows_in=len(parsed)) as stage:
+            transactions = TransactionTable.from_transactions(parsed)
+            stage.rows_out = len(transactions)
 
         # # ✅ Final safeguard: deduplicate after parsing
         # unique_txns = []
@@ -220,21 +484,35 @@ class WellsFargoProcessor:
         #         seen.add(signature)
         #         unique_txns.append(txn)
 
-        print(f"Extracted {len(transactions)} unique Wells Fargo transactions")
+        logger.info("Extracted %d unique Wells Fargo transactions", len(transactions))
         return self.bank_name, transactions
 
+    @staticmethod
+    def _collecting(tables: Iterable[pd.DataFrame], collected: List[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Pass tables through while keeping them for the extraction cache"""
+        for table in tables:
+            collected.append(table)
+            yield table
 
-    def export_to_csv(self, transactions: List[Transaction], output_path: str):
+    def extract_transactions_batch(self, pdf_paths: List[str]) -> Dict[str, TransactionTable]:
+        """
+        Extract many Wells Fargo statements with one tabula batch run
+        Returns: {pdf_path: list_of_transactions}
+        """
+        # Only statements missing from the cache go through tabula
+        # Each PDF is hashed once, here, and its key handed to extract_transactions
+        keys = {path: self.cache.key(path, self.cache_version) for path in pdf_paths}
+        uncached = [path for path in pdf_paths if not self.cache.contains(keys[path])]
+        batch_tables = self.tabula_backend.read_pdf_batch(uncached, **self.TABULA_OPTIONS)
+        results = {}
+        for pdf_path in pdf_paths:
+            _, results[pdf_path] = self.extract_transactions(pdf_path, tabula_tables=batch_tables.get(pdf_path),
+                                                           cache_key=keys[pdf_path])
+        return results
+
+
+    def export_to_csv(self, transactions: TransactionTable, output_path: str):
         """Export Wells Fargo transactions to CSV in exact test file format"""
-        data = []
-        for txn in transactions:
-            data.append({
-                "Date": txn.date,
-                "Check No": txn.check_number or "",
-                "Description": txn.description,
-                "Amount": txn.amount
-            })
-        
-        df = pd.DataFrame(data)
+        df = TransactionTable.coerce(transactions).to_frame()
         df.to_csv(output_path, index=False)
-        print(f"Exported {len(data)} Wells Fargo transactions to {output_path}")
\ No newline at end of file
+        logger.info("Exported %d Wells Fargo transactions to %s", len(df), output_path)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Headless batch extraction of bank statements.
+
+Usage:
+    python -m core.batch <directory or glob> [--output-dir DIR] [--workers N] [--no-cache] [--verbose] [--profile FILE]
+
+Each PDF is detected and extracted in a worker process; per-file CSVs and a
+combined CSV are written to the output directory, followed by a throughput
+summary (files/sec, p50/p95 per-file latency). --profile appends each file's
+per-stage timings and row counts (core.profiling) to a JSON-lines file.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .log import configure_logging
+from .processor_factory import ProcessorFactory
+from .profiling import StageProfiler
+from .tabula_backend import get_tabula_backend
+
+# Set per worker process by _init_worker
+_factory: Optional[ProcessorFactory] = None
+
+
+def collect_pdfs(target: str) -> List[str]:
+    """Resolve a directory or glob pattern into a sorted list of PDF paths"""
+    if os.path.isdir(target):
+        paths = glob.glob(os.path.join(target, "*.pdf")) + glob.glob(os.path.join(target, "*.PDF"))
+    else:
+        paths = glob.glob(target, recursive=True)
+    return sorted({p for p in paths if p.lower().endswith(".pdf") and os.path.isfile(p)})
+
+
+def _log_level(verbose: bool) -> str:
+    """Processors only report warnings/errors unless running verbose (BANK_EXTRACTOR_LOG_LEVEL overrides)"""
+    return "DEBUG" if verbose else os.environ.get("BANK_EXTRACTOR_LOG_LEVEL", "WARNING")
+
+
+def _init_worker(verbose: bool):
+    """Create one factory and one warm tabula JVM per worker process"""
+    global _factory
+    configure_logging(_log_level(verbose))
+    get_tabula_backend().warm_up()
+    _factory = ProcessorFactory()
+
+
+def process_file(pdf_path: str, output_dir: str) -> Dict:
+    """Detect + extract a single PDF inside a worker; writes its CSV and returns the rows"""
+    factory = _factory or ProcessorFactory()
+    profiler = StageProfiler()
+    start = time.perf_counter()
+    result = {"file": pdf_path, "bank": None, "rows": [], "error": None}
+
+    try:
+        with profiler.stage("detect"):
+            bank_type, processor = factory.create_processor(pdf_path)
+        if processor is None:
+            result["bank"] = bank_type
+            result["error"] = "unsupported or undetected bank"
+        else:
+            bank_type, transactions = processor.extract_transactions(pdf_path, profiler=profiler)
+            result["bank"] = bank_type
+
+            csv_name = os.path.splitext(os.path.basename(pdf_path))[0] + ".csv"
+            with profiler.stage("export_csv", rows_in=len(transactions)):
+                processor.export_to_csv(transactions, os.path.join(output_dir, csv_name))
+
+            result["rows"] = transactions.to_frame().to_dict("records")
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["seconds"] = time.perf_counter() - start
+    result["profile"] = profiler.to_dict()
+    return result
+
+
+def run_batch(pdf_paths: List[str], output_dir: str, workers: Optional[int] = None, verbose: bool = False,
+              profile_path: Optional[str] = None) -> List[Dict]:
+    """Fan PDFs out over a process pool and write per-file plus combined CSVs (and per-file profiles to profile_path)"""
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(pdf_paths)))
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(verbose,)) as pool:
+        futures = {pool.submit(process_file, path, output_dir): path for path in pdf_paths}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = f"ERROR: {result['error']}" if result["error"] else f"{len(result['rows'])} transactions"
+            print(f"[{len(results)}/{len(pdf_paths)}] {os.path.basename(result['file'])} "
+                  f"({result['bank'] or 'unknown'}) - {status} in {result['seconds']:.2f}s")
+    wall_seconds = time.perf_counter() - start
+
+    order = {path: idx for idx, path in enumerate(pdf_paths)}
+    results.sort(key=lambda r: order[r["file"]])
+    _write_combined(results, os.path.join(output_dir, "combined_transactions.csv"))
+    if profile_path:
+        _write_profiles(results, profile_path)
+    _print_summary(results, wall_seconds, workers)
+    return results
+
+
+def _write_combined(results: List[Dict], output_path: str):
+    """Write every file's transactions into one CSV with File/Bank columns"""
+    data = []
+    for result in results:
+        for row in result["rows"]:
+            data.append({"File": os.path.basename(result["file"]), "Bank": result["bank"], **row})
+
+    df = pd.DataFrame(data, columns=["File", "Bank", "Date", "Check No", "Description", "Amount"])
+    df.to_csv(output_path, index=False)
+    print(f"Exported {len(df)} combined transactions to {output_path}")
+
+
+def _write_profiles(results: List[Dict], output_path: str):
+    """Append one JSON line per file: its stage profile plus file, bank, row count and error"""
+    with open(output_path, "a", encoding="utf-8") as f:
+        for result in results:
+            record = {"timestamp": time.time(), "file": result["file"], "bank": result["bank"],
+                      "transactions": len(result["rows"]), "error": result["error"],
+                      "seconds": result["seconds"], **result["profile"]}
+            f.write(json.dumps(record) + "\n")
+    print(f"Appended {len(results)} stage profiles to {output_path}")
+
+
+def _print_summary(results: List[Dict], wall_seconds: float, workers: int):
+    """Throughput summary: files/sec and per-file latency percentiles"""
+    latencies = np.array([r["seconds"] for r in results]) if results else np.zeros(1)
+    failed = sum(1 for r in results if r["error"])
+    files_per_sec = len(results) / wall_seconds if wall_seconds > 0 else 0.0
+
+    print("=" * 50)
+    print(f"Files: {len(results)} ({failed} failed) with {workers} workers in {wall_seconds:.2f}s")
+    print(f"Throughput: {files_per_sec:.2f} files/sec")
+    print(f"Per-file latency: p50 {np.percentile(latencies, 50):.2f}s, "
+          f"p95 {np.percentile(latencies, 95):.2f}s, max {latencies.max():.2f}s")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Extract transactions from a folder of bank statement PDFs")
+    parser.add_argument("target", help="Directory of PDFs or glob pattern (quote it), e.g. 'statements/**/*.pdf'")
+    parser.add_argument("-o", "--output-dir", default="batch_output", help="Where CSVs are written (default: batch_output)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't write the extraction cache")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show the processors' detailed output")
+    parser.add_argument("--profile", metavar="FILE", default=None,
+                        help="Append per-file stage timings/row counts to FILE as JSON lines")
+    args = parser.parse_args(argv)
+    configure_logging(_log_level(args.verbose))
+
+    if args.no_cache:
+        os.environ["BANK_EXTRACTOR_CACHE"] = "0"  # inherited by the worker processes
+    # Files already run in parallel; don't also split each file's pages across the CPUs
+    os.environ.setdefault("BANK_EXTRACTOR_PAGE_WORKERS", "1")
+
+    pdf_paths = collect_pdfs(args.target)
+    if not pdf_paths:
+        print(f"No PDF files found for {args.target}")
+        return 1
+
+    results = run_batch(pdf_paths, args.output_dir, args.workers, args.verbose, args.profile)
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
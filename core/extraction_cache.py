@@ -0,0 +1,150 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from types import ModuleType
+from typing import List, Optional
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bank_extractor")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_version(*modules: ModuleType) -> Optional[str]:
+    """
+    Version string derived from the source of the given modules, so cached
+    tables are invalidated whenever the code that extracts them changes.
+    Returns None if a source file can't be read (e.g. frozen builds).
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        try:
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+        except (OSError, TypeError, AttributeError):
+            return None
+    return digest.hexdigest()[:16]
+
+
+class ExtractionCache:
+    """
+    On-disk cache of the raw tables extracted from a PDF.
+
+    Entries are keyed by the SHA-256 of the PDF bytes plus the code version of
+    the modules that extract the bank's tables, and stored as pickled DataFrames (exact dtype
+    round-trip, no extra dependency). The directory is capped at max_bytes and
+    the least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        self.cache_dir = cache_dir or os.environ.get("BANK_EXTRACTOR_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.enabled = enabled and os.environ.get("BANK_EXTRACTOR_CACHE", "1") != "0"
+
+    def key(self, pdf_path: str, version: Optional[str]) -> Optional[str]:
+        """Cache key for this PDF + code version (None when caching is off or unversioned)"""
+        if not self.enabled or version is None:
+            return None
+        try:
+            return hashlib.sha256(f"{file_sha256(pdf_path)}:{version}".encode()).hexdigest()
+        except OSError:
+            return None
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def contains(self, key: Optional[str]) -> bool:
+        return key is not None and os.path.exists(self._entry_path(key))
+
+    def get(self, key: Optional[str]) -> Optional[List[pd.DataFrame]]:
+        """Return the cached tables for this key, or None on a miss"""
+        if key is None:
+            return None
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as f:
+                tables = pickle.load(f)
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("⚠️ Ignoring unreadable cache entry %s: %s", key[:12], e)
+            return None
+        return tables
+
+    def put(self, key: Optional[str], tables: List[pd.DataFrame]):
+        """Store the tables under this key, then enforce the size cap"""
+        if key is None:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(key))  # atomic, safe with concurrent batch workers
+            tmp_path = None
+            self._evict()
+        except Exception as e:
+            # A cache failure must never fail the extraction that produced the tables
+            logger.warning("⚠️ Could not write cache entry %s: %s", key[:12], e)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # removed by a concurrent batch worker
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+    def clear(self):
+        """Remove every cache entry"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pkl"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    continue
+
+_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Return the process-wide extraction cache"""
+    global _cache
+    if _cache is None:
+        _cache = ExtractionCache()
+    return _cache
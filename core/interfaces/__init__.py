@@ -1,4 +1,5 @@
 from .base_parser import BaseParser
-from .transaction import Transaction
+from .transaction import Transaction, TransactionType
+from .transaction_table import TransactionTable, TransactionView
 
-__all__ = ['BaseParser', 'Transaction']
\ No newline at end of file
+__all__ = ['BaseParser', 'Transaction', 'TransactionType', 'TransactionTable', 'TransactionView']
\ No newline at end of file
@@ -1,17 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional
 import pandas as pd
-import re
-from dataclasses import dataclass
-
-@dataclass
-class Transaction:
-    date: str
-    description: str
-    amount: float
-    check_number: Optional[str] = None
-    balance: Optional[float] = None
-    transaction_type: str = "unknown"  # deposit, withdrawal, check
+from .transaction import Transaction
+from ..profiling import StageProfiler
+from ..statement_period import StatementPeriod
+from . import patterns
 
 class BaseParser(ABC):
     """Abstract base class for bank statement parsers"""
@@ -31,8 +24,13 @@ class BaseParser(ABC):
         pass
     
     @abstractmethod
-    def process_tables(self, tables: List[pd.DataFrame]) -> List[Transaction]:
-        """Process extracted tables and return transactions"""
+    def process_tables(self, tables: Iterable[pd.DataFrame],
+                       on_transactions: Optional[Callable[[List[Transaction]], None]] = None,
+                       profiler: Optional[StageProfiler] = None,
+                       period: Optional[StatementPeriod] = None) -> List[Transaction]:
+        """Process extracted tables (possibly a page-by-page generator) and return transactions;
+        on_transactions receives transactions early, as tables are parsed; profiler records per-step stats;
+        period is the statement period (PdfSession.statement_period) giving dates without a year theirs"""
         pass
     
     def can_parse(self, pdf_text: str) -> bool:
@@ -44,26 +42,25 @@ class BaseParser(ABC):
     def _row_to_text(self, row: pd.Series) -> str:
         """Convert pandas row to clean text"""
         parts = [(str(x) if pd.notna(x) else "") for x in row.tolist()]
-        txt = " ".join(p.strip() for p in parts if p is not None).strip()
-        return re.sub(r"\s+", " ", txt)
+        return " ".join(" ".join(parts).split())
     
     def _extract_date_any(self, text: str) -> Optional[str]:
         """Extract date from text - matches various formats"""
-        m = re.search(r"\b(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b", text)
+        m = patterns.DATE_GROUP.search(text)
         return m.group(1) if m else None
     
     def _extract_check_number(self, text: str) -> Optional[str]:
         """Extract check number from text"""
-        m = re.search(r"Check\s*#?\s*(\d{3,5})", text, flags=re.IGNORECASE)
+        m = patterns.CHECK_LABEL.search(text)
         if m:
             return m.group(1)
-        m2 = re.search(r"\b(\d{3,5})\b(?=.*-?\$?\d[\d,]*\.\d{2})", text)
+        m2 = patterns.CHECK_BEFORE_AMOUNT.search(text)
         return m2.group(1) if m2 else None
     
     def _pick_amount(self, text: str) -> Optional[float]:
         """Choose the rightmost plausible monetary value"""
-        t = re.sub(r"\(([\d,]+\.\d{2})\)", r"-\1", text)
-        candidates = re.findall(r"[-+]?\$?\d[\d,]*\.\d{2}", t)
+        t = patterns.PAREN_NEGATIVE.sub(r"-\1", text)
+        candidates = patterns.MONEY.findall(t)
         if not candidates:
             return None
         amount = None
@@ -78,20 +75,21 @@ class BaseParser(ABC):
     
     def _clean_description(self, text: str) -> str:
         """Clean and standardize transaction descriptions"""
-        cleaned = re.sub(r"\s+", " ", text).strip()
+        cleaned = " ".join(text.split())
         # Strip dates
-        cleaned = re.sub(r"\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b", " ", cleaned)
+        if "/" in cleaned:
+            cleaned = patterns.DATE.sub(" ", cleaned)
         # Strip currency/amounts
-        cleaned = re.sub(r"[-+]?\$?\d[\d,]*\.\d{2}", " ", cleaned)
-        # Strip common bank codes/tokens
-        cleaned = re.sub(r"\b(CKCD|CCD|PPD)\b\s*\d*", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"Card\s+\d{4}", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"X{4,}\d+", " ", cleaned)  # masked digits
-        cleaned = re.sub(r"DES:[A-Z0-9\s]*", " ", cleaned)
-        cleaned = re.sub(r"ID:\s*[A-Z0-9\-]+", " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"INDN:[A-Z0-9\s]*", " ", cleaned)
-        cleaned = re.sub(r"Check\s*#?\s*\d{3,5}", " Check ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        if "." in cleaned:
+            cleaned = patterns.MONEY.sub(" ", cleaned)
+        # Strip common bank codes/tokens, running only the rules whose literal text occurs.
+        # re.IGNORECASE also folds a few non-ASCII letters (e.g. the Kelvin sign), so those rows run every rule
+        upper = cleaned.upper()
+        run_all = not upper.isascii()
+        for pattern, replacement, literals in patterns.DESCRIPTION_NOISE_RULES:
+            if run_all or any(literal in upper for literal in literals):
+                cleaned = pattern.sub(replacement, cleaned)
+        cleaned = " ".join(cleaned.split())
         
         # Fallback labels
         up = text.upper()
@@ -106,8 +104,8 @@ class BaseParser(ABC):
                 cleaned = "Transaction"
         return cleaned[:80]
     
-    def _standardize_date(self, date_str: str) -> str:
-        """Convert to MM/DD/YYYY format"""
+    def _standardize_date(self, date_str: str, period: Optional[StatementPeriod] = None) -> str:
+        """Convert to MM/DD/YYYY format (MM/DD takes its year from the statement period, if given)"""
         try:
             parts = date_str.split("/")
             if len(parts) == 3:
@@ -115,6 +113,8 @@ class BaseParser(ABC):
                 if len(yy) == 2:
                     return f"{mm}/{dd}/20{yy}"
                 return f"{mm}/{dd}/{yy}"
+            if len(parts) == 2 and period is not None:
+                return f"{date_str}/{period.year_for(int(parts[0]))}"
             return date_str  # keep MM/DD; caller can add year context
         except Exception:
             return date_str
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Precompiled regular expressions shared by the statement parsers.
+
+Compiled once at import instead of being looked up in re's pattern cache on
+every call from the per-row helpers. Whitespace is collapsed with
+" ".join(text.split()), which splits on exactly the characters \s matches.
+"""
+import re
+
+# Dates / amounts anywhere in a row's text
+DATE = re.compile(r"\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b")
+DATE_GROUP = re.compile(r"\b(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\b")
+MONTH_DAY_WORD = re.compile(r"\b\d{1,2}/\d{1,2}\b")
+LEADING_MONTH_DAY = re.compile(r"^\d{1,2}/\d{1,2}")  # a line starting with a M/D date (WF footer rows)
+MONEY = re.compile(r"[-+]?\$?\d[\d,]*\.\d{2}")
+UNSIGNED_MONEY = re.compile(r"\d[\d,]*\.\d{2}")
+PAREN_NEGATIVE = re.compile(r"\(([\d,]+\.\d{2})\)")  # (1,234.56) -> -1,234.56 via sub(r"-\1", ...)
+
+# Whole-cell formats (Wells Fargo table columns)
+MONTH_DAY_CELL = re.compile(r"^\d{1,2}/\d{1,2}$")
+FULL_DATE_CELL = re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$")
+AMOUNT_CELL = re.compile(r"^\d{1,3}(,\d{3})*\.\d{2}$")
+CHECK_NUMBER_CELL = re.compile(r"^\d{4}$")
+
+# Check numbers
+CHECK_WORD = re.compile(r"\bCHECK(?!CARD)\b", re.IGNORECASE)
+CHECK_NUMBER_TOKEN = re.compile(r"\b\d{3,}\*?\b")
+CHECK_LABEL = re.compile(r"Check\s*#?\s*(\d{3,5})", re.IGNORECASE)
+CHECK_BEFORE_AMOUNT = re.compile(r"\b(\d{3,5})\b(?=.*-?\$?\d[\d,]*\.\d{2})")
+
+# Bank codes / tokens stripped from descriptions, applied in this order. Each rule
+# lists the (upper-case) literal text it can't match without, so rows that don't
+# contain it skip the regex; replacements can't create those literals.
+DESCRIPTION_NOISE_RULES = (
+    (re.compile(r"\b(CKCD|CCD|PPD)\b\s*\d*", re.IGNORECASE), " ", ("CKCD", "CCD", "PPD")),
+    (re.compile(r"Card\s+\d{4}", re.IGNORECASE), " ", ("CARD",)),
+    (re.compile(r"X{4,}\d+"), " ", ("XXXX",)),  # masked digits
+    (re.compile(r"DES:[A-Z0-9\s]*"), " ", ("DES:",)),
+    (re.compile(r"ID:\s*[A-Z0-9\-]+", re.IGNORECASE), " ", ("ID:",)),
+    (re.compile(r"INDN:[A-Z0-9\s]*"), " ", ("INDN:",)),
+    (re.compile(r"Check\s*#?\s*\d{3,5}", re.IGNORECASE), " Check ", ("CHECK",)),
+)
@@ -1,12 +1,86 @@
 # Extract the Transaction class from your base_parser.py
 from dataclasses import dataclass
-from typing import Optional
+from datetime import date as Date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Union
 
-@dataclass
+DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d")
+
+
+class TransactionType(str, Enum):
+    """Transaction categories; members compare equal to their plain string value"""
+    UNKNOWN = "unknown"
+    DEPOSIT = "deposit"
+    WITHDRAWAL = "withdrawal"
+    CHECK = "check"
+    EDI_PAYMENT = "edi_payment"
+    DEPOSIT_SUMMARY = "deposit_summary"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@lru_cache(maxsize=8192)
+def parse_statement_date(text: str) -> Optional[Date]:
+    """Parse a statement date (MM/DD/YYYY, MM/DD/YY or ISO) once; None if it isn't a full date"""
+    if not text:
+        return None
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def to_cents(amount: Union[int, float, str]) -> int:
+    """Dollar amount (number or '1,234.56' text) to integer cents"""
+    if isinstance(amount, str):
+        amount = float(amount.replace(",", ""))
+    return int(round(amount * 100))
+
+
+@dataclass(frozen=True, init=False)
 class Transaction:
-    date: str
+    """
+    Immutable parsed transaction.
+
+    The amount and balance are stored as integer cents and the date text is
+    parsed once into posted_date, so sorting and totals never re-parse strings
+    or accumulate float error. amount/balance are still exposed as floats and
+    transaction_type compares equal to the plain strings ("check", ...).
+    """
+    __slots__ = ("date", "description", "amount_cents", "check_number", "balance_cents", "transaction_type", "posted_date")
+
+    date: str  # as printed on the statement / exported
     description: str
-    amount: float
-    check_number: Optional[str] = None
-    balance: Optional[float] = None
-    transaction_type: str = "unknown"  # deposit, withdrawal, check
\ No newline at end of file
+    amount_cents: int
+    check_number: Optional[str]
+    balance_cents: Optional[int]
+    transaction_type: TransactionType
+    posted_date: Optional[Date]
+
+    def __init__(self, date: str, description: str, amount: float, check_number: Optional[str] = None,
+                 balance: Optional[float] = None, transaction_type: Union[str, TransactionType] = "unknown"):
+        set_field = object.__setattr__  # frozen dataclass: fields can only be set here
+        set_field(self, "date", date)
+        set_field(self, "description", description)
+        set_field(self, "amount_cents", to_cents(amount))
+        set_field(self, "check_number", check_number)
+        set_field(self, "balance_cents", None if balance is None else to_cents(balance))
+        set_field(self, "transaction_type", TransactionType(transaction_type))
+        set_field(self, "posted_date", parse_statement_date(date) if date else None)
+
+    @property
+    def amount(self) -> float:
+        return self.amount_cents / 100
+
+    @property
+    def balance(self) -> Optional[float]:
+        return None if self.balance_cents is None else self.balance_cents / 100
+
+    def __reduce__(self):
+        # Frozen + slots: rebuild through __init__ when pickled (e.g. sent back from a worker process)
+        return (self.__class__, (self.date, self.description, self.amount, self.check_number,
+                                 self.balance, self.transaction_type.value))
@@ -0,0 +1,236 @@
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from .transaction import Transaction, TransactionType
+
+NO_DATE = 0   # ordinal stored for dates that can't be parsed
+NO_ID = -1    # string id stored for missing check numbers
+
+
+class TransactionView:
+    """Read-only Transaction look-alike backed by one row of a TransactionTable"""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "TransactionTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def date(self) -> str:
+        return self._table.strings[self._table.date_ids[self._row]]
+
+    @property
+    def description(self) -> str:
+        return self._table.strings[self._table.desc_ids[self._row]]
+
+    @property
+    def amount_cents(self) -> int:
+        return int(self._table.cents[self._row])
+
+    @property
+    def amount(self) -> float:
+        return self.amount_cents / 100
+
+    @property
+    def check_number(self) -> Optional[str]:
+        check_id = self._table.check_ids[self._row]
+        return None if check_id == NO_ID else self._table.strings[check_id]
+
+    @property
+    def balance_cents(self) -> Optional[int]:
+        if not self._table.has_balance[self._row]:
+            return None
+        return int(self._table.balance_cents[self._row])
+
+    @property
+    def balance(self) -> Optional[float]:
+        balance_cents = self.balance_cents
+        return None if balance_cents is None else balance_cents / 100
+
+    @property
+    def transaction_type(self) -> Union[TransactionType, str]:
+        return self._table.type_names[self._table.type_codes[self._row]]
+
+    @property
+    def posted_date(self) -> Optional[date]:
+        ordinal = int(self._table.ordinals[self._row])
+        return None if ordinal == NO_DATE else date.fromordinal(ordinal)
+
+    def to_transaction(self) -> Transaction:
+        return Transaction(
+            date=self.date,
+            description=self.description,
+            amount=self.amount,
+            check_number=self.check_number,
+            balance=self.balance,
+            transaction_type=self.transaction_type
+        )
+
+    def __repr__(self) -> str:
+        return (f"TransactionView(date={self.date!r}, description={self.description!r}, amount={self.amount!r}, "
+                f"check_number={self.check_number!r}, transaction_type={self.transaction_type!r})")
+
+
+class TransactionTable:
+    """
+    Columnar transaction store.
+
+    Dates are kept as int32 ordinals (plus the original date text for display),
+    amounts as int64 cents, transaction types as int8 codes and descriptions,
+    date texts and check numbers as ids into one interned string pool. Totals,
+    grouping and sorting run as NumPy operations; indexing or iterating yields
+    TransactionView objects that read straight from the columns, so existing
+    code written against List[Transaction] keeps working.
+    """
+
+    TYPE_NAMES = list(TransactionType)
+
+    def __init__(self, strings: Optional[List[str]] = None, type_names: Optional[List[str]] = None):
+        # Interned string pool shared by descriptions, date texts and check numbers
+        self.strings: List[str] = strings if strings is not None else []
+        self._string_ids: Dict[str, int] = {s: i for i, s in enumerate(self.strings)}
+        self.type_names: List[str] = type_names if type_names is not None else list(self.TYPE_NAMES)
+
+        self.ordinals = np.zeros(0, dtype=np.int32)
+        self.cents = np.zeros(0, dtype=np.int64)
+        self.type_codes = np.zeros(0, dtype=np.int8)
+        self.desc_ids = np.zeros(0, dtype=np.int32)
+        self.date_ids = np.zeros(0, dtype=np.int32)
+        self.check_ids = np.zeros(0, dtype=np.int32)
+        self.balance_cents = np.zeros(0, dtype=np.int64)
+        self.has_balance = np.zeros(0, dtype=bool)
+
+    # ---- construction -------------------------------------------------
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable) -> "TransactionTable":
+        table = cls()
+        table.extend(transactions)
+        return table
+
+    @classmethod
+    def coerce(cls, transactions) -> "TransactionTable":
+        """Return transactions as a TransactionTable (no copy if it already is one)"""
+        if isinstance(transactions, TransactionTable):
+            return transactions
+        return cls.from_transactions(transactions)
+
+    def intern(self, text: str) -> int:
+        """Id of text in the string pool, adding it if new"""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(text)
+            self._string_ids[text] = string_id
+        return string_id
+
+    def type_code(self, type_name: str) -> int:
+        """Categorical code of a transaction type, registering unknown names"""
+        try:
+            return self.type_names.index(type_name)
+        except ValueError:
+            self.type_names.append(type_name)
+            return len(self.type_names) - 1
+
+    def extend(self, transactions: Iterable) -> range:
+        """Append transactions (Transaction or TransactionView); returns the new row indices"""
+        ordinals, cents, codes, desc_ids, date_ids, check_ids, balances, has_balance = [], [], [], [], [], [], [], []
+        for txn in transactions:
+            date_text = txn.date or ""
+            posted_date = txn.posted_date
+            ordinals.append(NO_DATE if posted_date is None else posted_date.toordinal())
+            cents.append(txn.amount_cents)
+            codes.append(self.type_code(txn.transaction_type))
+            desc_ids.append(self.intern(txn.description))
+            date_ids.append(self.intern(date_text))
+            check_ids.append(NO_ID if txn.check_number is None else self.intern(txn.check_number))
+            balances.append(txn.balance_cents or 0)
+            has_balance.append(txn.balance_cents is not None)
+
+        start = len(self)
+        self.ordinals = np.concatenate([self.ordinals, np.asarray(ordinals, dtype=np.int32)])
+        self.cents = np.concatenate([self.cents, np.asarray(cents, dtype=np.int64)])
+        self.type_codes = np.concatenate([self.type_codes, np.asarray(codes, dtype=np.int8)])
+        self.desc_ids = np.concatenate([self.desc_ids, np.asarray(desc_ids, dtype=np.int32)])
+        self.date_ids = np.concatenate([self.date_ids, np.asarray(date_ids, dtype=np.int32)])
+        self.check_ids = np.concatenate([self.check_ids, np.asarray(check_ids, dtype=np.int32)])
+        self.balance_cents = np.concatenate([self.balance_cents, np.asarray(balances, dtype=np.int64)])
+        self.has_balance = np.concatenate([self.has_balance, np.asarray(has_balance, dtype=bool)])
+        return range(start, len(self))
+
+    def append(self, transaction) -> int:
+        return self.extend([transaction])[0]
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> "TransactionTable":
+        """New table with the given rows (or boolean mask), sharing this table's string pool"""
+        table = TransactionTable.__new__(TransactionTable)
+        table.strings = self.strings
+        table._string_ids = self._string_ids
+        table.type_names = self.type_names
+        for column in ("ordinals", "cents", "type_codes", "desc_ids", "date_ids", "check_ids", "balance_cents", "has_balance"):
+            setattr(table, column, getattr(self, column)[indices])
+        return table
+
+    # ---- sequence protocol (List[Transaction] compatibility) ----------
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            row = int(key)
+            if row < 0:
+                row += len(self)
+            if not 0 <= row < len(self):
+                raise IndexError("transaction index out of range")
+            return TransactionView(self, row)
+        return self.take(key)
+
+    def __iter__(self) -> Iterator[TransactionView]:
+        for row in range(len(self)):
+            yield TransactionView(self, row)
+
+    def to_transactions(self) -> List[Transaction]:
+        return [view.to_transaction() for view in self]
+
+    # ---- columnar helpers ---------------------------------------------
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self.cents / 100
+
+    def type_mask(self, *type_names: str) -> np.ndarray:
+        """Boolean mask of rows whose type is one of type_names"""
+        codes = [self.type_names.index(name) for name in type_names if name in self.type_names]
+        return np.isin(self.type_codes, codes)
+
+    def type_counts(self) -> Dict[str, int]:
+        """Rows per transaction type, in order of first appearance"""
+        codes, first_rows, counts = np.unique(self.type_codes, return_index=True, return_counts=True)
+        order = np.argsort(first_rows)
+        return {str(self.type_names[codes[i]]): int(counts[i]) for i in order}
+
+    def string_ranks(self) -> np.ndarray:
+        """Lexicographic rank of every pooled string, for sorting by text columns"""
+        order = sorted(range(len(self.strings)), key=self.strings.__getitem__)
+        ranks = np.empty(len(self.strings), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        return ranks
+
+    def totals(self) -> Tuple[float, float]:
+        """(total withdrawals, total deposits) as shown in the GUI: withdrawals/checks below zero, deposit summaries above"""
+        withdrawals = self.type_mask("withdrawal", "check") & (self.cents < 0)
+        deposits = self.type_mask("deposit_summary") & (self.cents > 0)
+        return int(-self.cents[withdrawals].sum()) / 100, int(self.cents[deposits].sum()) / 100
+
+    def to_frame(self) -> pd.DataFrame:
+        """Date / Check No / Description / Amount frame used by the CSV and Excel exports"""
+        pool = np.array(self.strings + [""], dtype=object)  # trailing "" serves NO_ID check numbers
+        return pd.DataFrame({
+            "Date": pool[self.date_ids],
+            "Check No": pool[self.check_ids],
+            "Description": pool[self.desc_ids],
+            "Amount": self.amounts
+        })
@@ -0,0 +1,63 @@
+"""
+Logging setup for the extractor.
+
+Every module logs through logging.getLogger(__name__). Per-statement
+summaries are INFO, per-table / per-row traces DEBUG, so the default level
+shows summaries only. Messages use %-style arguments, so DEBUG traces
+aren't even formatted unless enabled.
+
+    BANK_EXTRACTOR_LOG_LEVEL=DEBUG                     everything
+    BANK_EXTRACTOR_LOG_MODULES="bank_processors.wells_fargo.wf_parser=DEBUG,bank_detector=WARNING"
+                                                       per-module levels (names relative to core)
+"""
+import logging
+import os
+import sys
+from typing import Dict, Optional, TextIO
+
+# Loggers the extractor's modules live under
+LOGGER_ROOTS = ("core", "gui")
+DEFAULT_LEVEL = "INFO"
+
+
+def parse_module_levels(spec: str) -> Dict[str, str]:
+    """'a.b=DEBUG,c=WARNING' -> {'core.a.b': 'DEBUG', 'core.c': 'WARNING'}"""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        name, level = name.strip(), level.strip().upper()
+        if not name or not level:
+            continue
+        if not name.startswith(LOGGER_ROOTS):
+            name = f"core.{name}"
+        levels[name] = level
+    return levels
+
+
+def configure_logging(level: Optional[str] = None, module_levels: Optional[Dict[str, str]] = None,
+                      stream: Optional[TextIO] = None):
+    """
+    Print the extractor's log records as plain lines (stdout by default).
+    level defaults to BANK_EXTRACTOR_LOG_LEVEL or INFO; module_levels are
+    added to BANK_EXTRACTOR_LOG_MODULES. Safe to call more than once: the
+    handler is replaced, not duplicated. Third-party loggers (pdfminer, ...)
+    are left at WARNING.
+    """
+    level = (level or os.environ.get("BANK_EXTRACTOR_LOG_LEVEL") or DEFAULT_LEVEL).upper()
+    levels = parse_module_levels(os.environ.get("BANK_EXTRACTOR_LOG_MODULES", ""))
+    levels.update(module_levels or {})
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler._bank_extractor = True
+
+    for root_name in LOGGER_ROOTS:
+        logger = logging.getLogger(root_name)
+        for old in [h for h in logger.handlers if getattr(h, "_bank_extractor", False)]:
+            logger.removeHandler(old)
+        logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
+
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
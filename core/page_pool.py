@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Statements shorter than this are read sequentially: pool start-up would cost more than it saves
+PARALLEL_MIN_PAGES = 4
+# Same for worker processes: each one spends ~0.5s importing pandas/pdfplumber and
+# reparses the PDF, which only pays off against ~0.1s of pdfplumber work per page
+# once a statement runs to a dozen pages or so
+PROCESS_MIN_PAGES = 12
+
+
+def page_workers(page_count: int, min_pages: int = PARALLEL_MIN_PAGES) -> int:
+    """
+    Worker count for splitting one statement's pages; 1 below min_pages.
+    BANK_EXTRACTOR_PAGE_WORKERS overrides the default (CPU count); the batch CLI
+    sets it to 1 so its per-file worker processes don't oversubscribe the CPUs.
+    """
+    try:
+        workers = int(os.environ.get("BANK_EXTRACTOR_PAGE_WORKERS", "0"))
+    except ValueError:
+        workers = 0
+    workers = workers or os.cpu_count() or 1
+    if page_count < min_pages:
+        return 1
+    return max(1, min(workers, page_count))
+
+
+def page_chunks(page_numbers: List[int], workers: int) -> List[List[int]]:
+    """Split pages into contiguous ranges, a few per worker so a slow page doesn't stall the rest"""
+    if not page_numbers:
+        return []
+    size = max(1, -(-len(page_numbers) // (workers * 2)))
+    return [page_numbers[i:i + size] for i in range(0, len(page_numbers), size)]
+
+
+def map_in_order(fn: Callable[[T], R], items: Iterable[T], workers: int,
+                 use_processes: bool = False) -> Iterator[Tuple[T, R]]:
+    """
+    Run fn over items on a pool and yield (item, result) in input order.
+
+    At most 2 * workers items are in flight, so results are streamed rather
+    than collected, and closing the generator (e.g. on cancellation) drops the
+    items that haven't started. workers <= 1 runs inline without a pool.
+    Processes use the spawn context: forking a process that hosts the tabula
+    JVM or the Tk main loop isn't safe.
+    """
+    if workers <= 1:
+        for item in items:
+            yield item, fn(item)
+        return
+
+    if use_processes:
+        pool: Executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    try:
+        in_flight = deque()
+        for item in items:
+            in_flight.append((item, pool.submit(fn, item)))
+            if len(in_flight) >= workers * 2:
+                done_item, future = in_flight.popleft()
+                yield done_item, future.result()
+        while in_flight:
+            done_item, future = in_flight.popleft()
+            yield done_item, future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
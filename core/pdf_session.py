@@ -0,0 +1,99 @@
+import os
+import pdfplumber
+from typing import Dict, List, Optional, Tuple
+from .statement_period import StatementPeriod, parse_statement_period
+
+# Not parsed yet (None is a parsed header without a period)
+_UNPARSED = object()
+
+class PdfSession:
+    """
+    Single-open PDF document shared by bank detection and the bank processors.
+
+    The pdfplumber document is opened lazily on first use and page objects,
+    extracted text and footer characters are cached per page, so detection,
+    extraction and the safeguards parse each page at most once. The statement
+    period is parsed once from the first page's text.
+    """
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self._pdf = None
+        self._pages: Dict[int, object] = {}
+        self._text: Dict[int, str] = {}
+        self._footer_chars: Dict[Tuple[int, float], List[dict]] = {}
+        self._period = _UNPARSED
+
+    @classmethod
+    def reuse(cls, session: Optional["PdfSession"], pdf_path: str) -> "PdfSession":
+        """Return the given session if it belongs to pdf_path, otherwise open a new one"""
+        if session is not None and session.matches(pdf_path):
+            return session
+        return cls(pdf_path)
+
+    def matches(self, pdf_path: str) -> bool:
+        """Check if this session was opened for the given file"""
+        return os.path.abspath(self.pdf_path) == os.path.abspath(pdf_path)
+
+    @property
+    def pdf(self):
+        """The underlying pdfplumber document, opened on first access"""
+        if self._pdf is None:
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pdf.pages)
+
+    def page(self, page_idx: int):
+        """Return the cached pdfplumber page (0-based index)"""
+        if page_idx not in self._pages:
+            self._pages[page_idx] = self.pdf.pages[page_idx]
+        return self._pages[page_idx]
+
+    def page_text(self, page_idx: int) -> str:
+        """Return the cached text of a page (0-based index)"""
+        if page_idx not in self._text:
+            self._text[page_idx] = self.page(page_idx).extract_text() or ""
+        return self._text[page_idx]
+
+    def footer_chars(self, page_idx: int, band_height: float) -> List[dict]:
+        """Return the cached characters in the bottom band_height points of a page (0-based index)"""
+        key = (page_idx, band_height)
+        if key not in self._footer_chars:
+            page = self.page(page_idx)
+            band_top = page.height - band_height
+            # The crop only hands over objects touching the band; chars straddling its edge are clipped, so drop them
+            footer = page.crop((0, band_top, page.width, page.height), strict=False)
+            self._footer_chars[key] = [c for c in footer.chars if c["top"] > band_top]
+        return self._footer_chars[key]
+
+    def statement_period(self) -> Optional[StatementPeriod]:
+        """Return the cached statement period from the first page's header (None if not found)"""
+        if self._period is _UNPARSED:
+            # The detector has usually read the first page already; only then is the file left unopened
+            has_first_page = 0 in self._text or self.page_count > 0
+            self._period = parse_statement_period(self.page_text(0)) if has_first_page else None
+        return self._period
+
+    def text(self, max_pages: Optional[int] = None) -> str:
+        """Return the text of the first max_pages pages (all pages if None)"""
+        count = self.page_count if max_pages is None else min(max_pages, self.page_count)
+        text_content = ""
+        for page_idx in range(count):
+            text_content += self.page_text(page_idx) + " "
+        return text_content
+
+    def close(self):
+        """Release the file handle; cached text and chars stay available"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+            self._pages.clear()
+
+    def __enter__(self) -> "PdfSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
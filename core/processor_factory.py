@@ -1,8 +1,14 @@
-from typing import Optional, Tuple
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 from .bank_detector import BankDetector
+from .pdf_session import PdfSession
+from .progress import ProgressReporter
 from .bank_processors.bofa.bofa_processor import BankOfAmericaProcessor
 from .bank_processors.wells_fargo.wf_processor import WellsFargoProcessor
 
+logger = logging.getLogger(__name__)
+
 class ProcessorFactory:
     """Factory to create the appropriate processor for each bank"""
     
@@ -15,31 +21,64 @@ class ProcessorFactory:
             "wells_fargo": WellsFargoProcessor,
         }
     
-    def create_processor(self, pdf_path: str) -> Tuple[Optional[str], Optional[object]]:
+    def create_processor(self, pdf_path: str, session: Optional[PdfSession] = None,
+                         progress: Optional[ProgressReporter] = None) -> Tuple[Optional[str], Optional[object]]:
         """
         Detect bank and create appropriate processor
+        The PDF is opened once; the same PdfSession is handed to the processor
+        so extraction reuses the pages parsed during detection.
         Returns: (bank_name, processor_instance)
         """
+        if progress is not None:
+            progress.report("detect", "Detecting bank...")
+        session = PdfSession.reuse(session, pdf_path)
+
         # Step 1: Detect which bank this PDF belongs to
-        detected_bank = self.detector.detect_bank(pdf_path)
+        detected_bank = self.detector.detect_bank(pdf_path, session=session)
         
         if not detected_bank:
-            print("Could not detect bank type")
+            logger.warning("Could not detect bank type")
+            session.close()
             return None, None
         
         # Step 2: Create the appropriate processor for this bank
         processor_class = self.processor_classes.get(detected_bank)
         
         if not processor_class:
-            print(f"No processor available for {detected_bank}")
+            logger.warning("No processor available for %s", detected_bank)
+            session.close()
             return detected_bank, None
         
-        # Step 3: Create and return the processor instance
-        processor = processor_class()
-        print(f"Created {detected_bank} processor")
+        # Step 3: Create and return the processor instance (it takes ownership of the session)
+        processor = processor_class(session=session)
+        logger.info("Created %s processor", detected_bank)
         
         return detected_bank, processor
     
     def get_supported_banks(self) -> list[str]:
         """Get list of banks with available processors"""
-        return list(self.processor_classes.keys())
\ No newline at end of file
+        return list(self.processor_classes.keys())
+
+    def extract_batch(self, pdf_paths: List[str]) -> Dict[str, Tuple[Optional[str], list]]:
+        """
+        Detect every PDF, then extract each bank's files with a single tabula batch run
+        Returns: {pdf_path: (bank_name, transactions)}; undetected/unsupported files get []
+        """
+        results: Dict[str, Tuple[Optional[str], list]] = {}
+        files_by_bank: Dict[str, List[str]] = defaultdict(list)
+
+        for pdf_path in pdf_paths:
+            with PdfSession(pdf_path) as session:
+                detected_bank = self.detector.detect_bank(pdf_path, session=session)
+            if detected_bank in self.processor_classes:
+                files_by_bank[detected_bank].append(pdf_path)
+            else:
+                logger.warning("Skipping %s: unsupported or undetected bank", pdf_path)
+                results[pdf_path] = (detected_bank, [])
+
+        for bank_name, bank_files in files_by_bank.items():
+            processor = self.processor_classes[bank_name]()
+            for pdf_path, transactions in processor.extract_transactions_batch(bank_files).items():
+                results[pdf_path] = (bank_name, transactions)
+
+        return {pdf_path: results[pdf_path] for pdf_path in pdf_paths}
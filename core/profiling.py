@@ -0,0 +1,162 @@
+"""
+Per-stage timing and counters for one extraction.
+
+The processors wrap each stage (tabula, footer safeguard, dedup, the parser's
+pipeline steps, ...) in StageProfiler.stage(). Stages nest: a stage's times
+are its own, with the stages that ran inside it subtracted, so the stages of
+one extraction add up to its total. Tables are streamed, so the time spent
+waiting for the next table is the "tables" stage, not part of the parser's.
+
+Wall time is time.perf_counter(). CPU time is time.process_time(), which also
+counts pool threads working during the stage (e.g. tabula reading ahead).
+Peak memory per stage needs tracemalloc, which slows Python code down; it is
+only turned on with trace_memory=True or BANK_EXTRACTOR_PROFILE_MEMORY=1.
+"""
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageStats:
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    peak_memory_bytes: Optional[int] = None  # traced Python allocations, only with trace_memory
+
+
+class StageCall:
+    """One run of a stage; set rows_out (and rows_in if not known up front) inside the with block"""
+    __slots__ = ("stats", "rows_in", "rows_out", "wall_start", "cpu_start", "child_wall", "child_cpu")
+
+    def __init__(self, stats: StageStats, rows_in: Optional[int]):
+        self.stats = stats
+        self.rows_in = rows_in
+        self.rows_out: Optional[int] = None
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+
+def _add(total: Optional[int], count: Optional[int]) -> Optional[int]:
+    if count is None:
+        return total
+    return (total or 0) + count
+
+
+class StageProfiler:
+    """
+    Collects StageStats for one extraction, in the order stages first ran.
+    A stage that runs several times (once per table, ...) accumulates its
+    calls, times and row counts. Meant for the extracting thread only.
+    """
+
+    def __init__(self, trace_memory: Optional[bool] = None):
+        if trace_memory is None:
+            trace_memory = os.environ.get("BANK_EXTRACTOR_PROFILE_MEMORY", "0") not in ("", "0")
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, StageStats] = {}
+        self._stack: List[StageCall] = []
+        self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[StageCall]:
+        call = self._enter(name, rows_in)
+        try:
+            yield call
+        finally:
+            self._exit(call)
+
+    def iterate(self, name: str, iterable: Iterable[T], count: Optional[Callable[[T], int]] = None) -> Iterator[T]:
+        """
+        Pass items through, timing each wait for the next one as stage name.
+        rows_out counts the items, or adds up count(item) if given.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name) as call:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                call.rows_out = count(item) if count is not None else 1
+            yield item
+
+    def _enter(self, name: str, rows_in: Optional[int]) -> StageCall:
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._fold_peak()
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        call = StageCall(stats, rows_in)
+        self._stack.append(call)
+        return call
+
+    def _exit(self, call: StageCall):
+        wall = time.perf_counter() - call.wall_start
+        cpu = time.process_time() - call.cpu_start
+        if self.trace_memory:
+            self._fold_peak()
+        self._stack.pop()
+
+        stats = call.stats
+        stats.calls += 1
+        stats.wall_seconds += wall - call.child_wall
+        stats.cpu_seconds += cpu - call.child_cpu
+        stats.rows_in = _add(stats.rows_in, call.rows_in)
+        stats.rows_out = _add(stats.rows_out, call.rows_out)
+        if self._stack:
+            self._stack[-1].child_wall += wall
+            self._stack[-1].child_cpu += cpu
+        elif self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _fold_peak(self):
+        """Credit the traced peak since the last stage switch to the running stage, then restart the peak"""
+        if not tracemalloc.is_tracing():
+            return
+        if self._stack:
+            stats = self._stack[-1].stats
+            peak = tracemalloc.get_traced_memory()[1]
+            stats.peak_memory_bytes = max(stats.peak_memory_bytes or 0, peak)
+        tracemalloc.reset_peak()
+
+    @property
+    def total_wall_seconds(self) -> float:
+        return sum(stats.wall_seconds for stats in self.stages.values())
+
+    def to_dict(self) -> Dict:
+        """JSON-ready summary: the stages in run order plus the process's peak RSS"""
+        return {
+            "wall_seconds": self.total_wall_seconds,
+            "max_rss_bytes": max_rss_bytes(),
+            "stages": [asdict(stats) for stats in self.stages.values()],
+        }
+
+
+
+def max_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far (None where the resource module is missing)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # bytes on macOS, KiB elsewhere
@@ -0,0 +1,46 @@
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+class ExtractionCancelled(Exception):
+    """Raised inside an extraction when the user cancelled it"""
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    stage: str                     # detect, tables, parse, summarize
+    message: str = ""
+    current: Optional[int] = None  # e.g. page number within the stage
+    total: Optional[int] = None
+
+
+class ProgressReporter:
+    """
+    Stage-level progress + cancellation handle passed down through an extraction.
+
+    The callback is invoked on the extracting (worker) thread; the GUI only
+    queues the event there and applies it on the Tk thread. Every report is
+    also a cancellation point: once cancel() was called the next report raises
+    ExtractionCancelled, so work stops at the next stage or page boundary.
+    """
+
+    def __init__(self, callback: Optional[Callable[[ProgressEvent], None]] = None):
+        self.callback = callback
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def check_cancelled(self):
+        if self._cancelled.is_set():
+            raise ExtractionCancelled("Extraction cancelled")
+
+    def report(self, stage: str, message: str = "", current: Optional[int] = None, total: Optional[int] = None):
+        self.check_cancelled()
+        if self.callback is not None:
+            self.callback(ProgressEvent(stage, message, current, total))
@@ -0,0 +1,67 @@
+"""
+Statement period read from a statement's first page.
+
+Transaction rows often print dates without a year (WF "9/14"), so the year
+comes from the period the statement covers. Both banks print it in the page
+header the detector already extracts:
+
+    Bank of America:  "for October 1, 2022 to October 31, 2022"
+    Wells Fargo:      "September 30, 2022 Page 1 of 7" (the statement date,
+                      i.e. the period end) and "Beginning balance on 9/1"
+
+A period is at most a year long, so a month after the end month belongs to
+the year before the end: a statement ending January 15, 2023 puts 12/20 in 2022.
+"""
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+_LONG_DATE = r"[A-Z][a-z]+ \d{1,2}, \d{4}"
+# "October 1, 2022 to October 31, 2022" (BoA)
+PERIOD_RANGE = re.compile(rf"({_LONG_DATE})\s+(?:to|through)\s+({_LONG_DATE})")
+# "September 30, 2022 Page 1 of 7" (WF statement date)
+STATEMENT_DATE = re.compile(rf"({_LONG_DATE})\s+Page 1 of\b")
+# "Beginning balance on 9/1" (WF period start, without the year)
+BEGINNING_BALANCE = re.compile(r"Beginning balance on (\d{1,2})/(\d{1,2})\b")
+
+
+@dataclass(frozen=True)
+class StatementPeriod:
+    end: date
+    start: Optional[date] = None
+
+    def year_for(self, month: int) -> int:
+        """Year of a date in this period from its month (December of a period ending in January is the year before)"""
+        return self.end.year - 1 if month > self.end.month else self.end.year
+
+
+def _long_date(text: str) -> Optional[date]:
+    """Parse "September 30, 2022"; None if it isn't a real date"""
+    try:
+        return datetime.strptime(text, "%B %d, %Y").date()
+    except ValueError:
+        return None
+
+
+def parse_statement_period(text: str) -> Optional[StatementPeriod]:
+    """Statement period from a first page's text, None if neither header layout is found"""
+    m = PERIOD_RANGE.search(text)
+    if m:
+        start, end = _long_date(m.group(1)), _long_date(m.group(2))
+        if end is not None:
+            return StatementPeriod(end=end, start=start)
+
+    m = STATEMENT_DATE.search(text)
+    end = _long_date(m.group(1)) if m else None
+    if end is None:
+        return None
+    period = StatementPeriod(end=end)
+    m = BEGINNING_BALANCE.search(text)
+    if m:
+        month, day = int(m.group(1)), int(m.group(2))
+        try:
+            period = StatementPeriod(end=end, start=date(period.year_for(month), month, day))
+        except ValueError:
+            pass
+    return period
@@ -0,0 +1,31 @@
+"""
+Cheap fingerprints for spotting the same table read twice.
+
+Table extractors (tabula's per-page and batch runs, the pdfplumber fallback)
+can return one table more than once. A fingerprint hashes the table's shape
+and the cells of its first and last FINGERPRINT_ROWS rows. Only those rows
+are read, and not the whole frame, so fingerprinting a table costs the same
+whatever its size. Empty cells (NaN / None) count as "", everything else as
+str(value), so tabula and pdfplumber frames of the same table match.
+"""
+import hashlib
+
+import pandas as pd
+
+# Rows hashed from each end of a table
+FINGERPRINT_ROWS = 2
+
+_CELL_SEP = b"\x1f"
+_ROW_SEP = b"\x1e"
+
+
+def table_fingerprint(df: pd.DataFrame, rows: int = FINGERPRINT_ROWS) -> bytes:
+    """Digest of df's shape and its first and last `rows` rows (normalized cells)"""
+    row_count, col_count = df.shape
+    positions = list(range(min(rows, row_count))) + list(range(max(rows, row_count - rows), row_count))
+    digest = hashlib.blake2b(f"{row_count}x{col_count}".encode(), digest_size=16)
+    for row in df.iloc[positions].to_numpy(dtype=object):
+        digest.update(_ROW_SEP)
+        digest.update(_CELL_SEP.join(b"" if pd.isna(cell) else str(cell).encode("utf-8", "surrogatepass")
+                                     for cell in row))
+    return digest.digest()
@@ -0,0 +1,161 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from copy import deepcopy
+from typing import Dict, List, Optional
+import pandas as pd
+import tabula
+
+try:
+    import jpype
+    from tabula import io as tabula_io
+except ImportError:  # older tabula-py without the in-process (jpype) mode
+    jpype = None
+    tabula_io = None
+
+logger = logging.getLogger(__name__)
+
+
+class _JavaOptionsIgnoredFilter(logging.Filter):
+    """
+    Drops tabula.io's "java_options is ignored until rebooting" warning.
+    tabula.read_pdf always passes java_options (-Dfile.encoding at least), so
+    once the backend's JVM runs, every call (one per page) would log it.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not record.getMessage().startswith("java_options is ignored")
+
+
+class TabulaBackend:
+    """
+    Persistent in-process tabula-java backend.
+
+    tabula-py runs tabula-java inside a JPype JVM that lives for the rest of
+    the process once started. This backend starts that JVM explicitly
+    (warm_up), checks it is still answering (is_healthy) and is the single
+    entry point the bank processors use for tabula.read_pdf, so the JVM
+    start-up cost is paid once per process instead of on the first statement.
+    """
+
+    def __init__(self, java_options: Optional[List[str]] = None):
+        self.java_options = list(java_options or [])
+        self.warm_up_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+        # The JVM is started once on purpose, so tabula's per-call reminder is noise
+        tabula_logger = logging.getLogger("tabula.io")
+        if not any(isinstance(f, _JavaOptionsIgnoredFilter) for f in tabula_logger.filters):
+            tabula_logger.addFilter(_JavaOptionsIgnoredFilter())
+
+    @property
+    def mode(self) -> str:
+        """'jpype' when tabula-java runs in-process, 'subprocess' otherwise"""
+        return "jpype" if jpype is not None else "subprocess"
+
+    def is_started(self) -> bool:
+        return jpype is not None and jpype.isJVMStarted()
+
+    def warm_up(self) -> bool:
+        """Start the JVM and load tabula-java classes; returns True if the backend is healthy"""
+        if jpype is None:
+            return True
+
+        with self._lock:
+            if tabula_io._tabula_vm is None:
+                start = time.perf_counter()
+                java_options = tabula_io._build_java_options(self.java_options)
+                if not any("file.encoding" in opt for opt in java_options):
+                    java_options += ["-Dfile.encoding=UTF8"]  # what read_pdf would start the JVM with
+                try:
+                    # Same VM object tabula.read_pdf creates lazily on its first call
+                    vm = tabula_io.TabulaVm(java_options, silent=None)
+                    # Touch the CLI option builder so its classes are loaded now
+                    vm.tabula.CommandLineApp.buildOptions()
+                    tabula_io._tabula_vm = vm
+                except Exception as e:
+                    logger.warning("⚠️ tabula JVM warm-up failed: %s", e)
+                    return False
+                self.warm_up_seconds = time.perf_counter() - start
+                logger.info("tabula JVM ready in %.2fs", self.warm_up_seconds)
+
+        return self.is_healthy()
+
+    def is_healthy(self) -> bool:
+        """Check the JVM is running and still executes Java calls"""
+        if jpype is None:
+            return True
+        if not self.is_started() or tabula_io._tabula_vm is None:
+            return False
+        try:
+            tabula_io._tabula_vm.lang.System.nanoTime()
+            return True
+        except Exception:
+            return False
+
+    def read_pdf(self, pdf_path: str, **kwargs) -> List[pd.DataFrame]:
+        """tabula.read_pdf through the persistent JVM (warmed up on first use)"""
+        if not self.is_healthy() and not self.warm_up():
+            raise RuntimeError("tabula JVM is not available")
+        return tabula.read_pdf(pdf_path, **kwargs)
+
+    def read_pdf_batch(self, pdf_paths: List[str], **kwargs) -> Dict[str, List[pd.DataFrame]]:
+        """
+        Extract tables from many PDFs with a single tabula-java batch run.
+        Takes the same options as read_pdf (multiple tables per page are always
+        returned) and gives back {pdf_path: List[pd.DataFrame]} for every input.
+        """
+        pandas_options = kwargs.pop("pandas_options", None)
+        kwargs.pop("multiple_tables", None)
+        kwargs.pop("output_format", None)
+
+        if not pdf_paths:
+            return {}
+        if tabula_io is None:
+            return {path: self.read_pdf(path, pandas_options=pandas_options, **kwargs) for path in pdf_paths}
+        if not self.is_healthy() and not self.warm_up():
+            raise RuntimeError("tabula JVM is not available")
+
+        results: Dict[str, List[pd.DataFrame]] = {}
+        batch_dir = tempfile.mkdtemp(prefix="tabula_batch_")
+        try:
+            # tabula-java batch mode converts every PDF of a directory, writing <name>.json next to it
+            staged = {}
+            for idx, path in enumerate(pdf_paths):
+                staged_pdf = os.path.join(batch_dir, f"{idx:05d}.pdf")
+                try:
+                    os.symlink(os.path.abspath(path), staged_pdf)
+                except OSError:
+                    shutil.copyfile(path, staged_pdf)
+                staged[path] = os.path.join(batch_dir, f"{idx:05d}.json")
+
+            logger.info("Running tabula batch over %d PDFs...", len(pdf_paths))
+            tabula.convert_into_by_batch(batch_dir, output_format="json", **kwargs)
+
+            for path, json_path in staged.items():
+                if not os.path.exists(json_path):
+                    # Batch run skipped this file - extract it on its own
+                    logger.warning("⚠️ tabula batch produced no output for %s, extracting it separately", path)
+                    results[path] = self.read_pdf(path, pandas_options=pandas_options, multiple_tables=True, **kwargs)
+                    continue
+                with open(json_path, encoding="utf-8") as f:
+                    raw_json = json.load(f)
+                results[path] = tabula_io._extract_from(raw_json, deepcopy(pandas_options) or {})
+        finally:
+            shutil.rmtree(batch_dir, ignore_errors=True)
+
+        return results
+
+
+_backend: Optional[TabulaBackend] = None
+
+
+def get_tabula_backend() -> TabulaBackend:
+    """Return the process-wide tabula backend"""
+    global _backend
+    if _backend is None:
+        _backend = TabulaBackend()
+    return _backend
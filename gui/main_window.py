@@ -1,11 +1,29 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import logging
 import os
+import queue
+import threading
 import pandas as pd
 from core.processor_factory import ProcessorFactory
+from core.progress import ExtractionCancelled, ProgressEvent, ProgressReporter
+from gui.transaction_view import VirtualTransactionView
 from core.interfaces.transaction import Transaction
+from core.interfaces.transaction_table import TransactionTable
+
+logger = logging.getLogger(__name__)
 
 class BankExtractorGUI:
+    POLL_MS = 100  # how often the Tk thread drains worker events
+
+    # Progress bar span (start %, end %) of each extraction stage
+    STAGE_PROGRESS = {
+        "detect": (0, 10),
+        "tables": (10, 70),
+        "parse": (70, 90),
+        "summarize": (90, 100),
+    }
+
     # def __init__(self):
     #     self.root = tk.Tk()
     #     self.root.title("Bank Statement PDF Extractor")
@@ -24,9 +42,16 @@ class BankExtractorGUI:
         
         # Use factory instead of direct processor
         self.factory = ProcessorFactory()
-        self.current_transactions = []
+        self.current_transactions = TransactionTable()
         self.current_bank_type = ""
         
+        # Background extraction: the worker thread only puts events on this queue,
+        # the Tk thread drains it via root.after (Tk isn't thread-safe)
+        self.worker = None
+        self.progress_reporter = None
+        self.partial_count = 0
+        self.events = queue.Queue()
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -41,7 +66,10 @@ class BankExtractorGUI:
         self.file_path_var = tk.StringVar()
         ttk.Entry(file_frame, textvariable=self.file_path_var, width=60).grid(row=0, column=0, padx=(0, 10))
         ttk.Button(file_frame, text="Browse", command=self.browse_file).grid(row=0, column=1)
-        ttk.Button(file_frame, text="Process PDF", command=self.process_pdf).grid(row=0, column=2, padx=(10, 0))
+        self.process_button = ttk.Button(file_frame, text="Process PDF", command=self.process_pdf)
+        self.process_button.grid(row=0, column=2, padx=(10, 0))
+        self.cancel_button = ttk.Button(file_frame, text="Cancel", command=self.cancel_processing, state=tk.DISABLED)
+        self.cancel_button.grid(row=0, column=3, padx=(10, 0))
         
         # Supported banks info
         # banks_info = f"Supported Banks: {', '.join(self.processor.get_supported_banks())}"
@@ -51,8 +79,15 @@ class BankExtractorGUI:
         ttk.Label(main_frame, text=banks_info, font=('TkDefaultFont', 8)).grid(row=1, column=0, columnspan=2, pady=(0, 5))
         
         # Status
+        status_frame = ttk.Frame(main_frame)
+        status_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        status_frame.columnconfigure(0, weight=1)
+        
         self.status_var = tk.StringVar(value="Select a PDF file to begin...")
-        ttk.Label(main_frame, textvariable=self.status_var).grid(row=2, column=0, columnspan=2, pady=(0, 10))
+        ttk.Label(status_frame, textvariable=self.status_var).grid(row=0, column=0)
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self.progress_bar = ttk.Progressbar(status_frame, variable=self.progress_var, maximum=100, mode='determinate')
+        self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # NEW: Total displays frame
         totals_frame = ttk.LabelFrame(main_frame, text="Transaction Totals", padding="10")
@@ -80,28 +115,18 @@ class BankExtractorGUI:
         table_frame = ttk.LabelFrame(main_frame, text="Extracted Transactions", padding="10")
         table_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
-        # Treeview for results - Updated column order
-        columns = ('Date', 'Check No', 'Description', 'Amount')
-        self.tree = ttk.Treeview(table_frame, columns=columns, show='headings', height=15)
+        # Filter box - narrows the view without re-extracting
+        filter_frame = ttk.Frame(table_frame)
+        filter_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        ttk.Label(filter_frame, text="Filter:").grid(row=0, column=0, padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *_: self.transaction_view.set_filter(self.filter_var.get()))
+        ttk.Entry(filter_frame, textvariable=self.filter_var, width=40).grid(row=0, column=1)
         
-        # Column headings
-        self.tree.heading('Date', text='Date')
-        self.tree.heading('Check No', text='Check No')
-        self.tree.heading('Description', text='Description')
-        self.tree.heading('Amount', text='Amount')
-        
-        # Column widths
-        self.tree.column('Date', width=100)
-        self.tree.column('Check No', width=80)
-        self.tree.column('Description', width=400)
-        self.tree.column('Amount', width=100)
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        # Virtualized Treeview for results - only the visible rows exist as tree items
+        # Order: Date, Check No, Description, Amount; click a heading to sort
+        self.transaction_view = VirtualTransactionView(table_frame, height=15)
+        self.transaction_view.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Export buttons
         export_frame = ttk.Frame(main_frame)
@@ -116,24 +141,18 @@ class BankExtractorGUI:
         main_frame.columnconfigure(0, weight=1)
         main_frame.rowconfigure(4, weight=1)  # Updated row index for table
         table_frame.columnconfigure(0, weight=1)
-        table_frame.rowconfigure(0, weight=1)
+        table_frame.rowconfigure(1, weight=1)
     
     def calculate_totals(self):
         """Calculate total withdrawals and deposits from current transactions"""
-        total_withdrawals = 0.0
-        total_deposits = 0.0
-        
-        for txn in self.current_transactions:
-            if txn.transaction_type in ["withdrawal", "check"] and txn.amount < 0:
-                total_withdrawals += abs(txn.amount)  # Make positive for display
-            elif txn.transaction_type in ["deposit_summary"] and txn.amount > 0:
-                total_deposits += txn.amount
+        # Withdrawals/checks are made positive for display; deposits come from the summaries
+        total_withdrawals, total_deposits = TransactionTable.coerce(self.current_transactions).totals()
         
         # Update display
         self.total_withdrawals_var.set(f"${total_withdrawals:,.2f}")
         self.total_deposits_var.set(f"${total_deposits:,.2f}")
         
-        print(f"Calculated totals - Withdrawals: ${total_withdrawals:,.2f}, Deposits: ${total_deposits:,.2f}")
+        logger.debug("Calculated totals - Withdrawals: $%s, Deposits: $%s", f"{total_withdrawals:,.2f}", f"{total_deposits:,.2f}")
     
     def browse_file(self):
         filename = filedialog.askopenfilename(
@@ -209,66 +228,117 @@ class BankExtractorGUI:
             messagebox.showerror("Error", "Selected file does not exist")
             return
         
+        if self.worker is not None and self.worker.is_alive():
+            return
+        
+        # 🆕 NEW: Detection + extraction run on a worker thread so the window stays responsive
+        self.progress_reporter = ProgressReporter(callback=self.events.put)
+        self.worker = threading.Thread(target=self._extract_in_background,
+                                       args=(file_path, self.progress_reporter), daemon=True)
+        self._set_processing(True)
+        self.status_var.set("Processing PDF... Please wait...")
+        self.transaction_view.clear()
+        self.partial_count = 0
+        self.worker.start()
+        self.root.after(self.POLL_MS, self._poll_worker)
+    
+    def cancel_processing(self):
+        """Ask the running extraction to stop at its next page/stage boundary"""
+        if self.progress_reporter is not None and self.worker is not None and self.worker.is_alive():
+            self.progress_reporter.cancel()
+            self.cancel_button.configure(state=tk.DISABLED)
+            self.status_var.set("Cancelling...")
+    
+    def _set_processing(self, processing: bool):
+        self.process_button.configure(state=tk.DISABLED if processing else tk.NORMAL)
+        self.cancel_button.configure(state=tk.NORMAL if processing else tk.DISABLED)
+        if processing:
+            self.progress_var.set(0.0)
+    
+    def _extract_in_background(self, file_path: str, progress: ProgressReporter):
+        """Worker thread: detect + extract, reporting back only through the event queue (no Tk calls here)"""
         try:
-            self.status_var.set("Processing PDF... Please wait...")
-            self.root.update()
-            
             # 🆕 NEW: Use factory to detect bank and create processor
-            bank_type, processor = self.factory.create_processor(file_path)
+            bank_type, processor = self.factory.create_processor(file_path, progress=progress)
             
             # 🆕 NEW: Check if we got a valid processor
             if processor is None:
-                if bank_type:
-                    messagebox.showerror("Error", f"Detected {bank_type} but no processor available for this bank yet.")
-                else:
-                    messagebox.showerror("Error", "Could not detect bank type. Please ensure this is a supported bank statement.")
-                self.status_var.set("Error: Unsupported bank or detection failed")
+                self.events.put(("unsupported", bank_type))
                 return
             
             # 🆕 NEW: Process using the bank-specific processor
-            bank_type, transactions = processor.extract_transactions(file_path)
-            
-            self.current_bank_type = bank_type
-            self.current_transactions = transactions
-            
-            # 🔄 SAME: Clear previous results (no change)
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            # 🔄 SAME: Add new results - Order: Date, Check No, Description, Amount (no change)
-            for txn in transactions:
-                # Color coding for different transaction types
-                tags = []
-                if txn.transaction_type == "deposit_summary":
-                    tags = ["summary"]
-                elif txn.transaction_type in ["withdrawal", "check"] and txn.amount < 0:
-                    tags = ["withdrawal"]
-                elif txn.transaction_type in ["deposit", "edi_payment"] and txn.amount > 0:
-                    tags = ["deposit"]
-                
-                self.tree.insert('', 'end', values=(
-                    txn.date,
-                    txn.check_number or "",
-                    txn.description[:50] + "..." if len(txn.description) > 50 else txn.description,
-                    f"${txn.amount:.2f}"
-                ), tags=tags)
-            
-            # 🔄 SAME: Configure tag colors (no change)
-            self.tree.tag_configure("summary", background="#E6F3FF", font=('TkDefaultFont', 9, 'bold'))
-            self.tree.tag_configure("withdrawal", background="#FFE6E6")
-            self.tree.tag_configure("deposit", background="#E6FFE6")
+            # Provisional rows are shown as pages are parsed; "done" replaces them with the final result
+            bank_type, transactions = processor.extract_transactions(
+                file_path, progress=progress, on_transactions=lambda txns: self.events.put(("partial", txns)))
+            self.events.put(("done", (bank_type, transactions)))
+        except ExtractionCancelled:
+            self.events.put(("cancelled", None))
+        except Exception as e:
+            self.events.put(("error", e))
+    
+    def _poll_worker(self):
+        """Tk thread: apply queued progress events and the final result"""
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
             
-            # 🔄 SAME: Calculate and display totals (no change)
-            self.calculate_totals()
+            if isinstance(event, ProgressEvent):
+                self._show_progress(event)
+                continue
             
-            # 🆕 IMPROVED: Better status message with bank name
-            bank_display_name = bank_type.replace('_', ' ').title()
-            self.status_var.set(f"Extracted {len(transactions)} transactions from {bank_display_name}")
+            kind, payload = event
+            if kind == "partial":
+                self.partial_count += len(payload)
+                self.transaction_view.append(payload)
+                continue
             
-        except Exception as e:
-            print(f"Full error details: {e}")  # 🆕 NEW: Debug logging
-            messagebox.showerror("Error", f"Failed to process PDF:\n{str(e)}")
-            self.status_var.set("Error processing PDF")
+            self._set_processing(False)
+            if kind != "done":
+                # Drop provisional rows; keep showing the previous result
+                self.transaction_view.set_transactions(self.current_transactions)
+            if kind == "done":
+                self._show_results(*payload)
+            elif kind == "unsupported":
+                if payload:
+                    messagebox.showerror("Error", f"Detected {payload} but no processor available for this bank yet.")
+                else:
+                    messagebox.showerror("Error", "Could not detect bank type. Please ensure this is a supported bank statement.")
+                self.status_var.set("Error: Unsupported bank or detection failed")
+            elif kind == "cancelled":
+                self.progress_var.set(0.0)
+                self.status_var.set("Processing cancelled")
+            else:
+                logger.error("Full error details: %s", payload)
+                messagebox.showerror("Error", f"Failed to process PDF:\n{str(payload)}")
+                self.status_var.set("Error processing PDF")
+            return
+        
+        self.root.after(self.POLL_MS, self._poll_worker)
+    
+    def _show_progress(self, event: ProgressEvent):
+        start, end = self.STAGE_PROGRESS.get(event.stage, (0, 100))
+        fraction = event.current / event.total if event.current and event.total else 0.0
+        self.progress_var.set(start + (end - start) * fraction)
+        if event.message:
+            found = f" ({self.partial_count} transactions so far)" if self.partial_count else ""
+            self.status_var.set(event.message + found)
+    
+    def _show_results(self, bank_type: str, transactions: TransactionTable):
+        self.current_bank_type = bank_type
+        self.current_transactions = TransactionTable.coerce(transactions)
+        
+        # Replace the result set; the view only draws the rows currently on screen
+        self.transaction_view.set_transactions(self.current_transactions)
+        
+        # 🔄 SAME: Calculate and display totals (no change)
+        self.calculate_totals()
+        
+        # 🆕 IMPROVED: Better status message with bank name
+        bank_display_name = bank_type.replace('_', ' ').title()
+        self.status_var.set(f"Extracted {len(transactions)} transactions from {bank_display_name}")
+        self.progress_var.set(100.0)
 
     def export_csv(self):
         if not self.current_transactions:
@@ -283,7 +353,7 @@ class BankExtractorGUI:
         
         if filename:
             try:
-                self.processor.export_to_csv(self.current_transactions, filename)
+                self.current_transactions.to_frame().to_csv(filename, index=False)
                 messagebox.showinfo("Success", f"Exported {len(self.current_transactions)} transactions to CSV")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export CSV:\n{str(e)}")
@@ -302,16 +372,7 @@ class BankExtractorGUI:
         if filename:
             try:
                 # Create DataFrame and export to Excel
-                data = []
-                for txn in self.current_transactions:
-                    data.append({
-                        'Date': txn.date,
-                        'Check No': txn.check_number or '',
-                        'Description': txn.description,
-                        'Amount': txn.amount
-                    })
-                
-                df = pd.DataFrame(data)
+                df = self.current_transactions.to_frame()
                 df.to_excel(filename, index=False)
                 messagebox.showinfo("Success", f"Exported {len(self.current_transactions)} transactions to Excel")
             except Exception as e:
@@ -0,0 +1,194 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional
+import numpy as np
+from core.interfaces.transaction_table import NO_DATE, TransactionTable
+
+
+class VirtualTransactionView:
+    """
+    Virtualized transaction list on top of a ttk.Treeview.
+
+    The Treeview only ever holds as many items as fit on screen; scrolling,
+    sorting and filtering change which rows of the TransactionTable those
+    items show (an index array into the table) instead of inserting/deleting
+    Treeview items, so the cost of a redraw doesn't depend on the row count.
+    """
+
+    COLUMNS = ('Date', 'Check No', 'Description', 'Amount')
+    COLUMN_WIDTHS = {'Date': 100, 'Check No': 80, 'Description': 400, 'Amount': 100}
+    DEFAULT_ROW_HEIGHT = 20
+
+    def __init__(self, parent, height: int = 15):
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=self.COLUMNS, show='headings', height=height)
+
+        for column in self.COLUMNS:
+            self.tree.heading(column, text=column, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=self.COLUMN_WIDTHS[column])
+
+        # The scrollbar drives our row offset, not the Treeview's own yview
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+
+        self.tree.tag_configure("summary", background="#E6F3FF", font=('TkDefaultFont', 9, 'bold'))
+        self.tree.tag_configure("withdrawal", background="#FFE6E6")
+        self.tree.tag_configure("deposit", background="#E6FFE6")
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_mouse_wheel)
+        self.tree.bind("<Configure>", self._on_resize)
+
+        self.table = TransactionTable()
+        self.order = np.zeros(0, dtype=np.int64)  # table rows in display order (after filter + sort)
+        self.offset = 0                           # first displayed position in self.order
+        self.visible_rows = height
+        self.sort_column: Optional[str] = None
+        self.sort_descending = False
+        self.filter_text = ""
+        self._items = []  # reused Treeview item ids, one per visible row
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    # ---- data ---------------------------------------------------------
+
+    def set_transactions(self, transactions):
+        """Show a new result set (replaces the current one)"""
+        self.table = TransactionTable.coerce(transactions)
+        self.offset = 0
+        self._rebuild_order()
+
+    def append(self, transactions):
+        """Add rows as extraction streams them in; only the visible window is redrawn"""
+        new_rows = self.table.extend(transactions)
+        if self.sort_column is None and not self.filter_text:
+            self.order = np.concatenate([self.order, np.arange(new_rows.start, new_rows.stop)])
+            self._refresh()
+        else:
+            self._rebuild_order()
+
+    def clear(self):
+        self.set_transactions(TransactionTable())
+
+    # ---- sorting / filtering ------------------------------------------
+
+    def sort_by(self, column: str):
+        """Sort by a column (clicking the same heading again reverses the order)"""
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column, self.sort_descending = column, False
+        self._rebuild_order()
+
+    def set_filter(self, text: str):
+        """Only show rows whose date, check number or description contains text (case-insensitive)"""
+        self.filter_text = text.strip().lower()
+        self.offset = 0
+        self._rebuild_order()
+
+    def _sort_key(self, column: str) -> np.ndarray:
+        table = self.table
+        if column == 'Amount':
+            return table.cents
+        if column == 'Date':
+            # Undated rows sort after every real date
+            return np.where(table.ordinals == NO_DATE, np.iinfo(np.int32).max, table.ordinals).astype(np.int64)
+        ranks = table.string_ranks()
+        if column == 'Check No':
+            return np.where(table.check_ids < 0, -1, ranks[table.check_ids])
+        return ranks[table.desc_ids]
+
+    def _filter_mask(self) -> np.ndarray:
+        table = self.table
+        # Match each distinct string once, then broadcast through the id columns
+        matches = np.fromiter((self.filter_text in s.lower() for s in table.strings), dtype=bool, count=len(table.strings))
+        matches = np.append(matches, False)  # index -1 (no check number) never matches
+        return matches[table.desc_ids] | matches[table.date_ids] | matches[table.check_ids]
+
+    def _rebuild_order(self):
+        order = np.arange(len(self.table))
+        if self.filter_text:
+            order = order[self._filter_mask()]
+        if self.sort_column is not None and len(order):
+            key = self._sort_key(self.sort_column)[order]
+            order = order[np.argsort(-key if self.sort_descending else key, kind="stable")]
+        self.order = order
+        self._refresh()
+
+    # ---- rendering ----------------------------------------------------
+
+    def _refresh(self):
+        """Point the pooled Treeview items at the rows of the current window"""
+        total = len(self.order)
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        window = self.order[self.offset:self.offset + self.visible_rows]
+
+        while len(self._items) < len(window):
+            self._items.append(self.tree.insert('', 'end'))
+        while len(self._items) > len(window):
+            self.tree.delete(self._items.pop())
+
+        for item, row in zip(self._items, window):
+            txn = self.table[int(row)]
+            self.tree.item(item, values=self._row_values(txn), tags=self._row_tags(txn))
+
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(window)) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    @staticmethod
+    def _row_values(txn):
+        description = txn.description[:50] + "..." if len(txn.description) > 50 else txn.description
+        return (txn.date, txn.check_number or "", description, f"${txn.amount:.2f}")
+
+    @staticmethod
+    def _row_tags(txn):
+        # Color coding for different transaction types
+        if txn.transaction_type == "deposit_summary":
+            return ["summary"]
+        if txn.transaction_type in ["withdrawal", "check"] and txn.amount < 0:
+            return ["withdrawal"]
+        if txn.transaction_type in ["deposit", "edi_payment"] and txn.amount > 0:
+            return ["deposit"]
+        return []
+
+    # ---- scrolling ----------------------------------------------------
+
+    def scroll_to(self, offset: int):
+        self.offset = offset
+        self._refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.order)))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _on_mouse_wheel(self, event):
+        if event.num == 4:
+            delta = -3
+        elif event.num == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self.scroll_to(self.offset + delta)
+        return "break"  # keep the Treeview from scrolling its few items itself
+
+    def _on_resize(self, event):
+        row_height = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            row_height = int(row_height)
+        except (TypeError, ValueError):
+            row_height = self.DEFAULT_ROW_HEIGHT
+        # Leave out roughly one row for the headings
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self._refresh()
@@ -1,5 +1,14 @@
+import multiprocessing
+
 from gui.main_window import BankExtractorGUI
+from core.log import configure_logging
+from core.tabula_backend import get_tabula_backend
 
 if __name__ == "__main__":
+    # Page workers are spawned processes; in a frozen (PyInstaller) build they must not start another GUI
+    multiprocessing.freeze_support()
+    configure_logging()
+    # Start the tabula JVM once up front so the first statement doesn't pay for it
+    get_tabula_backend().warm_up()
     app = BankExtractorGUI()
-    app.run()
\ No newline at end of file
+    app.run()
@@ -0,0 +1,81 @@
+from core.bank_detector import ACCOUNT_POINTS, INDICATOR_POINTS, KEYWORD_POINTS, MAX_PAGES, MIN_SCORE, BankDetector
+
+
+class FakeSession:
+    """Page texts standing in for a PdfSession; records the pages read"""
+
+    def __init__(self, *pages):
+        self.pages = pages
+        self.read = []
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+    def page_text(self, page_idx):
+        self.read.append(page_idx)
+        return self.pages[page_idx]
+
+
+WF_PAGE = "Navigate Business Checking  Questions? 1-800-CALL-WELLS  Account number: 1234567890"
+BOA_PAGE = "Your Business Advantage Fundamentals  Bank of America  Account number: 4350 1234 5678"
+
+
+def test_score_text_counts_each_term_once_by_kind():
+    scores = BankDetector().score_text("bank of america ... BANK OF AMERICA ... p.o. box 25118")
+    assert scores == {"bank_of_america": KEYWORD_POINTS + INDICATOR_POINTS, "wells_fargo": 0}
+
+
+def test_score_text_term_listed_twice_scores_both_listings():
+    # "wellsfargo.com/biz" is both a keyword and a strong indicator
+    assert BankDetector().score_text("visit wellsfargo.com/biz")["wells_fargo"] == KEYWORD_POINTS + INDICATOR_POINTS
+
+
+def test_score_text_account_patterns():
+    detector = BankDetector()
+    assert detector.score_text("Account number: 1234567890")["wells_fargo"] == ACCOUNT_POINTS
+    assert detector.score_text("ACCOUNT NUMBER: 4350 1234 5678")["bank_of_america"] == ACCOUNT_POINTS
+    assert detector.score_text("Account number: 12345") == {"bank_of_america": 0, "wells_fargo": 0}
+
+
+def test_score_text_finds_terms_overlapping_other_terms():
+    # "WELLS" ends the phone number indicator and starts the keyword; both count
+    scores = BankDetector().score_text("1-800-CALL-WELLS FARGO")
+    assert scores == {"bank_of_america": 0, "wells_fargo": INDICATOR_POINTS + KEYWORD_POINTS}
+
+
+def test_detect_stops_after_a_decisive_first_page():
+    session = FakeSession(WF_PAGE, BOA_PAGE, BOA_PAGE)
+    assert BankDetector().detect_bank("statement.pdf", session) == "wells_fargo"
+    assert session.read == [0]
+
+
+def test_detect_reads_more_pages_when_the_first_is_inconclusive():
+    session = FakeSession("Statement period", "Page 2", BOA_PAGE, WF_PAGE)
+    assert BankDetector().detect_bank("statement.pdf", session) == "bank_of_america"
+    assert session.read == [0, 1, 2]
+
+
+def test_detect_reads_at_most_max_pages():
+    session = FakeSession(*["nothing here"] * (MAX_PAGES + 2))
+    assert BankDetector().detect_bank("statement.pdf", session) is None
+    assert session.read == list(range(MAX_PAGES))
+
+
+def test_detect_picks_the_best_score_and_breaks_ties_in_listing_order():
+    detector = BankDetector()
+    both = FakeSession("Wells Fargo 1-800-CALL-WELLS wellsfargo.com/biz Bank of America")
+    assert detector.detect_bank("statement.pdf", both) == "wells_fargo"
+    tie = FakeSession("Wells Fargo Navigate Business Checking Bank of America Business Advantage")
+    assert detector.detect_bank("statement.pdf", tie) == "bank_of_america"
+
+
+def test_detect_below_min_score_or_without_text_is_none():
+    detector = BankDetector()
+    assert MIN_SCORE > KEYWORD_POINTS
+    assert detector.detect_bank("statement.pdf", FakeSession("Wells Fargo")) is None
+    assert detector.detect_bank("statement.pdf", FakeSession()) is None
+
+
+def test_detect_bank_reports_errors_as_none(tmp_path):
+    assert BankDetector().detect_bank(str(tmp_path / "missing.pdf")) is None
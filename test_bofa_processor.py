@@ -0,0 +1,55 @@
+import glob
+import os
+
+import pdfplumber
+import pytest
+
+from core.bank_processors.bofa import bofa_processor
+from core.bank_processors.bofa.bofa_processor import (
+    BOA_LENIENT_TABLE_SETTINGS, BankOfAmericaProcessor, _PageChars, _extract_table, _pdfplumber_boa_page,
+)
+from core.page_pool import PROCESS_MIN_PAGES
+from core.pdf_session import PdfSession
+
+SAMPLE_PDFS = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.pdf")))
+
+
+def _pages(pdf_path):
+    with pdfplumber.open(pdf_path) as pdf:
+        yield from pdf.pages
+
+
+@pytest.mark.skipif(not SAMPLE_PDFS, reason="no sample statements")
+@pytest.mark.parametrize("pdf_path", SAMPLE_PDFS, ids=os.path.basename)
+def test_extract_table_matches_pdfplumber(pdf_path):
+    # _extract_table mirrors Table.extract() of the pinned pdfplumber; this catches drift on upgrades
+    tables_read = 0
+    for page in _pages(pdf_path):
+        page_chars = _PageChars(page.chars)
+        for settings in (None, BOA_LENIENT_TABLE_SETTINGS):
+            for table in page.find_tables(settings):
+                assert _extract_table(table, page_chars) == table.extract()
+                tables_read += 1
+    assert tables_read
+
+
+@pytest.mark.skipif(not SAMPLE_PDFS, reason="no sample statements")
+@pytest.mark.parametrize("pdf_path", SAMPLE_PDFS, ids=os.path.basename)
+def test_boa_page_reads_both_settings_like_pdfplumber(pdf_path):
+    for page in _pages(pdf_path):
+        tables, tables_lenient = _pdfplumber_boa_page(page)
+        assert tables == page.extract_tables()
+        assert tables_lenient == page.extract_tables(BOA_LENIENT_TABLE_SETTINGS)
+
+
+@pytest.mark.skipif(not SAMPLE_PDFS, reason="no sample statements")
+def test_short_statements_are_read_from_the_session(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker processes started for a short statement")
+
+    monkeypatch.setenv("BANK_EXTRACTOR_PAGE_WORKERS", "4")
+    monkeypatch.setattr(bofa_processor, "map_in_order", no_pool)
+    with PdfSession(SAMPLE_PDFS[0]) as session:
+        assert session.page_count < PROCESS_MIN_PAGES
+        tables = BankOfAmericaProcessor().extract_tables_pdfplumber_boa(SAMPLE_PDFS[0], session)
+    assert tables
@@ -0,0 +1,149 @@
+import os
+import types
+
+import pandas as pd
+import pytest
+
+from core.extraction_cache import ExtractionCache, code_version
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "statement.pdf"
+    path.write_bytes(b"%PDF-1.4 statement one")
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("BANK_EXTRACTOR_CACHE", raising=False)
+    return ExtractionCache(cache_dir=str(tmp_path / "cache"))
+
+
+def _module(tmp_path, name, source):
+    path = tmp_path / f"{name}.py"
+    path.write_text(source)
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    return module
+
+
+def test_round_trip_keeps_tables_exactly(cache, pdf):
+    tables = [pd.DataFrame([["9/1", None, "Deposit", "10.00"]]), pd.DataFrame({"a": [1.5, float("nan")]})]
+    key = cache.key(pdf, "v1")
+    assert cache.get(key) is None
+    assert not cache.contains(key)
+
+    cache.put(key, tables)
+
+    assert cache.contains(key)
+    loaded = cache.get(key)
+    assert len(loaded) == 2
+    for got, want in zip(loaded, tables):
+        pd.testing.assert_frame_equal(got, want)
+
+
+def test_key_changes_with_pdf_bytes_and_code_version(cache, pdf, tmp_path):
+    other = tmp_path / "other.pdf"
+    other.write_bytes(b"%PDF-1.4 statement two")
+
+    assert cache.key(pdf, "v1") == cache.key(pdf, "v1")
+    assert cache.key(pdf, "v1") != cache.key(pdf, "v2")
+    assert cache.key(pdf, "v1") != cache.key(str(other), "v1")
+
+
+def test_no_key_when_disabled_unversioned_or_unreadable(tmp_path, pdf, monkeypatch):
+    monkeypatch.delenv("BANK_EXTRACTOR_CACHE", raising=False)
+    assert ExtractionCache(cache_dir=str(tmp_path), enabled=False).key(pdf, "v1") is None
+    assert ExtractionCache(cache_dir=str(tmp_path)).key(pdf, None) is None
+    assert ExtractionCache(cache_dir=str(tmp_path)).key(str(tmp_path / "missing.pdf"), "v1") is None
+
+    monkeypatch.setenv("BANK_EXTRACTOR_CACHE", "0")
+    assert ExtractionCache(cache_dir=str(tmp_path)).key(pdf, "v1") is None
+
+
+def test_none_key_is_a_miss_and_not_stored(cache):
+    cache.put(None, [pd.DataFrame([[1]])])
+    assert cache.get(None) is None
+    assert not os.path.exists(cache.cache_dir)
+
+
+def test_unreadable_entry_is_a_miss(cache, pdf):
+    key = cache.key(pdf, "v1")
+    os.makedirs(cache.cache_dir)
+    with open(cache._entry_path(key), "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.get(key) is None
+
+
+def test_eviction_drops_least_recently_used_first(tmp_path, monkeypatch):
+    monkeypatch.delenv("BANK_EXTRACTOR_CACHE", raising=False)
+    cache = ExtractionCache(cache_dir=str(tmp_path / "cache"))
+    table = [pd.DataFrame({"x": range(200)})]
+    for key in ("a", "b"):
+        cache.put(key, table)
+    entry_size = os.path.getsize(cache._entry_path("a"))
+    # "a" is older than "b", but reading it makes it the most recently used
+    os.utime(cache._entry_path("a"), (1000, 1000))
+    os.utime(cache._entry_path("b"), (2000, 2000))
+    assert cache.get("a") is not None
+
+    cache.max_bytes = 2 * entry_size
+    cache.put("c", table)
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert cache.contains("c")
+
+
+def test_clear_removes_every_entry(cache):
+    cache.put("a", [pd.DataFrame([[1]])])
+    cache.clear()
+    assert not cache.contains("a")
+
+
+def test_code_version_follows_module_source(tmp_path):
+    first = _module(tmp_path, "first", "X = 1\n")
+    second = _module(tmp_path, "second", "Y = 2\n")
+    version = code_version(first, second)
+
+    assert version == code_version(first, second)
+    assert version != code_version(second, first)
+    (tmp_path / "second.py").write_text("Y = 3\n")
+    assert version != code_version(first, second)
+
+
+def test_code_version_is_none_without_source(tmp_path):
+    frozen = types.ModuleType("frozen")  # no __file__, as in a frozen build
+    assert code_version(_module(tmp_path, "first", "X = 1\n"), frozen) is None
+
+
+def test_failed_write_is_swallowed_and_leaves_no_temp_file(cache, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    cache.put("a", [pd.DataFrame([[1]])])
+
+    assert not cache.contains("a")
+    assert os.listdir(cache.cache_dir) == []
+
+
+def test_entries_removed_by_another_worker_are_skipped(cache, monkeypatch):
+    cache.put("a", [pd.DataFrame([[1]])])
+    cache.put("b", [pd.DataFrame([[1]])])
+    real_scandir = os.scandir
+
+    def scandir_then_vanish(path):
+        # Another batch worker clears the entries between the listing and the stat/remove
+        entries = list(real_scandir(path))
+        for entry in entries:
+            os.remove(entry.path)
+        return iter(entries)
+
+    monkeypatch.setattr(os, "scandir", scandir_then_vanish)
+    cache.max_bytes = 0
+    cache.put("c", [pd.DataFrame([[1]])])
+    cache.clear()
+
+    assert os.listdir(cache.cache_dir) == []
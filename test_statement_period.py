@@ -0,0 +1,120 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from core.bank_processors.bofa.bofa_parser import BankOfAmericaParser
+from core.bank_processors.bofa.bofa_processor import BankOfAmericaProcessor
+from core.bank_processors.wells_fargo.wf_parser import WellsFargoParser
+from core.pdf_session import PdfSession
+from core.statement_period import StatementPeriod, parse_statement_period
+
+WF_HEADER = """Navigate Business Checking
+September 30, 2022 Page 1 of 7
+Beginning balance on 9/1 $909.56
+Ending balance on 9/30 $4,132.41"""
+
+BOA_HEADER = """Your Business Advantage Fundamentals
+for October 1, 2022 to October 31, 2022 Account number: 4350 1234 5678"""
+
+
+def test_parse_wells_fargo_header():
+    assert parse_statement_period(WF_HEADER) == StatementPeriod(end=date(2022, 9, 30), start=date(2022, 9, 1))
+
+
+def test_parse_bank_of_america_header():
+    assert parse_statement_period(BOA_HEADER) == StatementPeriod(end=date(2022, 10, 31), start=date(2022, 10, 1))
+
+
+def test_parse_period_spanning_new_year():
+    period = parse_statement_period("January 15, 2024 Page 1 of 5\nBeginning balance on 12/16 $1.00")
+    assert period == StatementPeriod(end=date(2024, 1, 15), start=date(2023, 12, 16))
+    period = parse_statement_period("for December 16, 2023 through January 15, 2024")
+    assert period == StatementPeriod(end=date(2024, 1, 15), start=date(2023, 12, 16))
+
+
+def test_parse_without_a_period():
+    assert parse_statement_period("") is None
+    assert parse_statement_period("Wells Fargo Navigate Business Checking") is None
+    assert parse_statement_period("February 30, 2022 Page 1 of 7") is None
+    # The start line is optional
+    assert parse_statement_period("September 30, 2022 Page 1 of 7") == StatementPeriod(end=date(2022, 9, 30))
+
+
+@pytest.mark.parametrize("end, month, year", [
+    (date(2022, 9, 30), 9, 2022),
+    (date(2022, 9, 30), 8, 2022),
+    (date(2024, 1, 15), 1, 2024),
+    (date(2024, 1, 15), 12, 2023),
+    (date(2023, 12, 31), 12, 2023),
+    (date(2023, 12, 31), 1, 2023),
+])
+def test_year_for(end, month, year):
+    assert StatementPeriod(end=end).year_for(month) == year
+
+
+class _CountingSession(PdfSession):
+    def __init__(self, first_page):
+        super().__init__("statement.pdf")
+        self._text[0] = first_page  # as left behind by detection
+        self.parsed = 0
+
+    def page_text(self, page_idx):
+        self.parsed += 1
+        return super().page_text(page_idx)
+
+
+def test_session_parses_the_period_once():
+    session = _CountingSession(WF_HEADER)
+    assert session.statement_period().end == date(2022, 9, 30)
+    assert session.statement_period().end == date(2022, 9, 30)
+    assert session.parsed == 1
+
+    missing = _CountingSession("no header here")
+    assert missing.statement_period() is None
+    assert missing.statement_period() is None
+    assert missing.parsed == 1
+
+
+def _wf_rows():
+    return [
+        ["12/20", "", "EDI PYMNTS JAPAN TOBAC", "100.00", "", "1,000.00"],
+        ["1/3", "", "Purchase authorized on 01/02 Shell Oil", "", "5.00", "995.00"],
+        ["12/18", "", "Purchase authorized on 12/17 Shell Oil", "", "7.00", "993.00"],
+        ["1/2", "", "Bankcard 1131 Mtot Dep", "50.00", "", "1,043.00"],
+    ]
+
+
+def test_wells_fargo_rows_roll_over_into_the_new_year():
+    rows = WellsFargoParser()._process_raw_rows(_wf_rows(), period=StatementPeriod(end=date(2024, 1, 15)))
+    assert [row[0] for row in rows] == ["12/31/2023", "12/20/2023", "12/18/2023", "1/3/2024"]
+    assert rows[0][2:] == ["Deposits", "150.00"]
+
+
+def test_wells_fargo_rows_without_a_period_use_the_fallback_year():
+    parser = WellsFargoParser()
+    rows = parser._process_raw_rows(_wf_rows())
+    assert {row[0].rsplit("/", 1)[1] for row in rows} == {str(parser.FALLBACK_YEAR)}
+
+
+def test_wells_fargo_provisional_rows_use_the_period():
+    period = StatementPeriod(end=date(2024, 1, 15))
+    transactions = WellsFargoParser()._provisional_transactions(_wf_rows(), period)
+    assert [t.posted_date for t in transactions] == [date(2023, 12, 20), date(2024, 1, 3), date(2023, 12, 18)]
+
+
+def test_bank_of_america_month_dates_take_the_period_year():
+    table = pd.DataFrame([["12/28", "Online Banking transfer to CHK 2786", "-149.79"],
+                          ["01/04/24", "Online Banking transfer to CHK 2786", "-20.00"]])
+    transactions = BankOfAmericaParser().process_tables([table], period=StatementPeriod(end=date(2024, 1, 15)))
+    assert [t.posted_date for t in transactions] == [date(2023, 12, 28), date(2024, 1, 4)]
+    assert BankOfAmericaParser().process_tables([table])[0].date == "12/28"
+
+
+def test_bank_of_america_month_keys():
+    period = StatementPeriod(end=date(2024, 1, 15))
+    assert BankOfAmericaProcessor._boa_month_key("12/28", period) == "2023-12"
+    assert BankOfAmericaProcessor._boa_month_key("01/04", period) == "2024-01"
+    assert BankOfAmericaProcessor._boa_month_key("01/04/23", period) == "2023-01"
+    assert BankOfAmericaProcessor._boa_month_key("12/28") == f"{BankOfAmericaProcessor.FALLBACK_YEAR}-12"
+    assert BankOfAmericaProcessor._boa_month_key("Total") == "unknown"
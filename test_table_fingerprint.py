@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from core.table_fingerprint import FINGERPRINT_ROWS, table_fingerprint
+
+
+def _table(rows=6):
+    return pd.DataFrame([[f"10/{day:02d}/22", f"Purchase {day}", f"{day}.00"] for day in range(1, rows + 1)])
+
+
+def test_same_table_same_fingerprint():
+    assert table_fingerprint(_table()) == table_fingerprint(_table())
+
+
+def test_tabula_and_pdfplumber_frames_of_one_table_match():
+    tabula = pd.DataFrame([["10/01/22", np.nan, "12.00"], ["10/02/22", "Deposit", np.nan]])
+    plumber = pd.DataFrame([["10/01/22", None, "12.00"], ["10/02/22", "Deposit", ""]])
+    assert table_fingerprint(tabula) == table_fingerprint(plumber)
+
+
+def test_first_and_last_rows_and_shape_matter():
+    base = table_fingerprint(_table())
+    first = _table()
+    first.iloc[0, 1] = "Changed"
+    last = _table()
+    last.iloc[-1, 2] = "99.00"
+    assert table_fingerprint(first) != base
+    assert table_fingerprint(last) != base
+    assert table_fingerprint(_table(7)) != base
+    assert table_fingerprint(_table().iloc[:, :2]) != base
+
+
+def test_middle_rows_are_not_read():
+    middle = _table()
+    middle.iloc[FINGERPRINT_ROWS, 1] = "Changed"
+    assert table_fingerprint(middle) == table_fingerprint(_table())
+    assert table_fingerprint(middle, rows=len(middle)) != table_fingerprint(_table(), rows=len(middle))
+
+
+def test_cell_boundaries_are_kept():
+    assert table_fingerprint(pd.DataFrame([["ab", "c"]])) != table_fingerprint(pd.DataFrame([["a", "bc"]]))
+    assert table_fingerprint(pd.DataFrame([["a"], ["b"]])) != table_fingerprint(pd.DataFrame([["a", "b"]]))
+
+
+def test_small_and_empty_tables():
+    one_row = pd.DataFrame([["10/01/22", "Deposit", "12.00"]])
+    assert table_fingerprint(one_row) == table_fingerprint(one_row.copy())
+    assert table_fingerprint(pd.DataFrame()) != table_fingerprint(pd.DataFrame(index=range(2)))
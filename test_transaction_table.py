@@ -0,0 +1,109 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from core.interfaces.transaction import Transaction
+from core.interfaces.transaction_table import TransactionTable
+
+
+def _transactions():
+    return [
+        Transaction("09/30/2022", "Deposits", 1500.25, transaction_type="deposit_summary"),
+        Transaction("09/02/2022", "Purchase Shell Oil", -45.10, transaction_type="withdrawal"),
+        Transaction("09/14/2022", "Check", -300.00, check_number="1071", transaction_type="check"),
+        Transaction("9/5", "Purchase Shell Oil", -12.00, balance=88.5, transaction_type="withdrawal"),
+    ]
+
+
+def test_views_read_back_the_transactions():
+    transactions = _transactions()
+    table = TransactionTable.from_transactions(transactions)
+
+    assert len(table) == 4
+    assert table.to_transactions() == transactions
+    view = table[2]
+    assert (view.date, view.description, view.amount, view.check_number) == ("09/14/2022", "Check", -300.0, "1071")
+    assert view.transaction_type == "check"
+    assert view.posted_date == date(2022, 9, 14)
+    assert table[-1].posted_date is None  # M/D text without a year isn't a full date
+    assert table[-1].balance == 88.5 and table[0].balance is None
+
+
+def test_strings_are_interned_once():
+    table = TransactionTable.from_transactions(_transactions())
+    assert table.strings.count("Purchase Shell Oil") == 1
+    assert table.desc_ids[1] == table.desc_ids[3]
+
+
+def test_extend_returns_new_rows_and_keeps_the_pool():
+    table = TransactionTable.from_transactions(_transactions()[:2])
+    pool_size = len(table.strings)
+
+    rows = table.extend(_transactions()[1:])
+
+    assert rows == range(2, 5)
+    assert len(table) == 5
+    assert table[3].description == "Check"
+    # Only "09/14/2022", "Check", "1071" and "9/5" are new to the pool
+    assert len(table.strings) == pool_size + 4
+    assert table.append(_transactions()[0]) == 5
+
+
+def test_extend_accepts_views_from_another_table():
+    source = TransactionTable.from_transactions(_transactions())
+    copy = TransactionTable()
+    copy.extend(source)
+    assert copy.to_transactions() == source.to_transactions()
+
+
+def test_take_by_index_and_mask_shares_the_pool():
+    table = TransactionTable.from_transactions(_transactions())
+
+    taken = table.take(np.array([3, 0]))
+    assert [view.description for view in taken] == ["Purchase Shell Oil", "Deposits"]
+    assert taken.strings is table.strings
+
+    masked = table[table.cents < 0]
+    assert [view.amount for view in masked] == [-45.10, -300.00, -12.00]
+
+    # Rows added to a taken table land in the shared pool, not in the source's rows
+    taken.extend([Transaction("10/01/2022", "New row", 1.0, transaction_type="deposit")])
+    assert len(table) == 4 and "New row" in table.strings
+
+
+def test_coerce_does_not_copy_a_table():
+    table = TransactionTable.from_transactions(_transactions())
+    assert TransactionTable.coerce(table) is table
+    assert TransactionTable.coerce(_transactions()).to_transactions() == table.to_transactions()
+
+
+def test_string_ranks_sort_like_the_strings():
+    table = TransactionTable.from_transactions(_transactions())
+    ranks = table.string_ranks()
+    by_rank = sorted(range(len(table.strings)), key=lambda i: ranks[i])
+    assert [table.strings[i] for i in by_rank] == sorted(table.strings)
+    assert sorted(ranks.tolist()) == list(range(len(table.strings)))
+
+
+def test_type_helpers_and_totals():
+    table = TransactionTable.from_transactions(_transactions())
+    assert table.type_mask("withdrawal").tolist() == [False, True, False, True]
+    assert table.type_mask("edi_payment").tolist() == [False] * 4
+    assert table.type_counts() == {"deposit_summary": 1, "withdrawal": 2, "check": 1}
+    assert table.totals() == (357.10, 1500.25)
+
+
+def test_to_frame_blanks_missing_check_numbers():
+    frame = TransactionTable.from_transactions(_transactions()).to_frame()
+    assert list(frame.columns) == ["Date", "Check No", "Description", "Amount"]
+    assert frame["Check No"].tolist() == ["", "", "1071", ""]
+    assert frame["Amount"].tolist() == [1500.25, -45.10, -300.00, -12.00]
+
+
+def test_empty_table():
+    table = TransactionTable.from_transactions([])
+    assert len(table) == 0
+    assert table.totals() == (0.0, 0.0)
+    assert table.to_frame().empty
+    assert isinstance(table.to_frame(), pd.DataFrame)
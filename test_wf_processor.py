@@ -0,0 +1,88 @@
+import pandas as pd
+
+from core.bank_processors.wells_fargo.wf_processor import RowTextIndex, WellsFargoProcessor
+
+
+def _wf_transaction_table(width):
+    """A transaction table as tabula reads it, `width` columns wide"""
+    rows = [
+        ["9/1", "", "Purchase authorized on 08/31 Shell Oil", "", "45.10"],
+        ["9/2", "", "Bankcard 1131 Mtot Dep", "1,250.00", ""],
+        ["9/6", "1071", "Check", "", "300.00"],
+    ]
+    return pd.DataFrame([(row + [""] * width)[:width] for row in rows])
+
+
+def test_safeguard_runs_whatever_width_tabula_reads_the_transaction_table():
+    processor = WellsFargoProcessor()
+    for width in (5, 6, 7):
+        assert processor._looks_truncated([pd.DataFrame([["x"]]), _wf_transaction_table(width)], None)
+
+
+def test_safeguard_skips_pages_ending_in_another_table():
+    processor = WellsFargoProcessor()
+    check_summary = pd.DataFrame([
+        ["Number", "Date", "Amount", "Number", "Date", "Amount"],
+        ["1071", "9/6", "300.00", "1072", "9/7", "25.00"],
+    ])
+    assert not processor._looks_truncated([_wf_transaction_table(6), check_summary], None)
+    assert not processor._looks_truncated([], None)
+    assert processor._looks_truncated([], RuntimeError("tabula failed"))
+
+
+def test_row_index_finds_rows_read_by_tabula():
+    index = RowTextIndex()
+    index.add_tables([pd.DataFrame([
+        ["9/8", float("nan"), "Bankcard 1131 Mtot Dep", "747.36", float("nan")],
+        ["9/23", float("nan"), "Purchase authorized on 09/21 Chick-Fil-A Roanoke VA", float("nan"), "25.89"],
+    ])])
+    assert index.contains("9/8   Bankcard 1131 Mtot Dep  747.36")
+    # A footer line holding part of a row that tabula merged with its continuation line
+    assert index.contains("9/23 Purchase authorized on 09/21")
+    assert not index.contains("9/24 Bankcard 1131 Mtot Dep 747.36")
+
+
+def test_row_index_matches_whole_tokens_only():
+    index = RowTextIndex()
+    index.add_row(["9/8", "", "Check", "25.005"])
+    index.add_row(["9/8", "", "Shellfish Market", "12.00"])
+    assert not index.contains("9/8 Check 25.00")
+    assert not index.contains("9/8 Shell")
+    assert not index.contains("9/8 Check 25.005 1,000.00")
+    assert index.contains("9/8 Check 25.005")
+
+
+def test_row_index_only_indexes_new_tables():
+    index = RowTextIndex()
+    tables = [pd.DataFrame([["9/1", "Deposit", "10.00"]])]
+    index.add_tables(tables)
+    tables.append(pd.DataFrame([["9/2", "Deposit", "20.00"]]))
+    index.add_tables(tables)
+    assert index.table_count == 2
+    assert index.contains("9/1 Deposit 10.00") and index.contains("9/2 Deposit 20.00")
+    assert sum(len(rows) for rows in index.by_token.values()) == 2
+
+
+def test_row_dedup_matches_safeguard_rows_and_tables_of_other_widths():
+    processor = WellsFargoProcessor()
+    seen = set()
+    nan = float("nan")
+    tabula = pd.DataFrame([
+        ["9/30", nan, "Purchase authorized on 09/28 Shell Oil", nan, " 57.25", nan],
+        ["9/30", nan, "Purchase authorized on 09/28 Shell Oil", nan, "57.25", nan],
+    ])
+    assert len(processor._drop_seen_rows(tabula, seen)) == 1
+
+    # The same row again from the footer safeguard ("" cells) and from a 5-column table
+    safeguard = pd.DataFrame([["9/30", "", "Purchase authorized on 09/28 Shell Oil", "", "57.25", ""]])
+    narrower = pd.DataFrame([["9/30", None, "Purchase authorized on 09/28 Shell Oil", None, "57.25"]])
+    assert processor._drop_seen_rows(safeguard, seen).empty
+    assert processor._drop_seen_rows(narrower, seen).empty
+
+
+def test_row_dedup_keeps_rows_that_differ_only_in_cell_positions():
+    processor = WellsFargoProcessor()
+    seen = set()
+    table = pd.DataFrame([["9/1", "", "Deposit", "10.00"], ["9/1", "Deposit", "10.00", ""]])
+    kept = processor._drop_seen_rows(table, seen)
+    assert kept is table